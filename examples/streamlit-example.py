@@ -1,10 +1,8 @@
 import streamlit as st
-from IPython.display import HTML
-import streamlit.components.v1 as components
-from pandas import read_parquet
 import pathlib
 
-from neo4j_viz.pandas import from_dfs
+from neo4j_viz.parquet import from_parquet
+from neo4j_viz.streamlit import render_component
 from neo4j_viz import VisualizationGraph
 
 # Path to this file
@@ -17,31 +15,19 @@ def create_visualization_graph() -> VisualizationGraph:
     cora_nodes_path = f"{script_dir_path}/datasets/cora/cora_nodes.parquet.gzip"
     cora_rels_path = f"{script_dir_path}/datasets/cora/cora_rels.parquet.gzip"
 
-    nodes_df = read_parquet(cora_nodes_path)
-    nodes_df = nodes_df.rename(columns={"nodeId": "id"})
-
-    rels_df = read_parquet(cora_rels_path)
-    rels_df = rels_df.rename(
-        columns={"sourceNodeId": "source", "targetNodeId": "target"}
+    # Only the columns of node and relationship fields and of the "subject" property are read.
+    # The GDS column names, like `nodeId` and `sourceNodeId`, are mapped to the fields automatically.
+    VG = from_parquet(
+        cora_nodes_path,
+        cora_rels_path,
+        node_properties=["subject"],
+        relationship_properties=[],
     )
-
-    # Drop the features column since it's not needed for visualization
-    # Also numpy arrays are not supported by the visualization library
-    nodes_df.drop(columns="features", inplace=True)
-
-    VG = from_dfs(nodes_df, rels_df)
     VG.color_nodes(property="subject")
 
     return VG
 
 
-@st.cache_data
-def render_graph(
-    _VG: VisualizationGraph, height: int, initial_zoom: float = 0.1
-) -> HTML:
-    return VG.render(initial_zoom=initial_zoom, height=f"{height}px")
-
-
 VG = create_visualization_graph()
 
 st.title("Neo4j Viz Streamlit Example")
@@ -60,10 +46,10 @@ st.text(
     "seven scientific subjects is represented by a different color."
 )
 
-components.html(
-    render_graph(VG, height=height).data,
-    height=height,
-)
+# The graph is only sent to the browser when it has changed, and changing the height does not restart the layout
+clicked = render_component(VG, height=height, initial_zoom=0.1)
+if clicked is not None:
+    st.text(f"Clicked {clicked['type']} with ID {clicked['id']}")
 
 if show_code:
     st.header("Code")
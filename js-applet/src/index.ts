@@ -1,13 +1,123 @@
 import { FreeLayoutType, NVL } from '@neo4j-nvl/base'
 import type { Node, NvlOptions, Relationship } from '@neo4j-nvl/base'
 import { DragNodeInteraction, PanInteraction, ZoomInteraction, HoverInteraction } from '@neo4j-nvl/interaction-handlers'
+// The field support of each renderer, shared with the Python `Renderer` enum
+import rendererFields from '../../python-wrapper/src/neo4j_viz/resources/renderer_fields.json'
 
-interface PyNode extends Node {
-  properties: Object;
+// Nodes and relationships are sent with dense integer IDs, which index into the tables of `ElementData`.
+// Relationship IDs follow after all node IDs, so that every element has its own position in the tables.
+type PyNode = Omit<Node, 'id'> & { id: number }
+type PyRel = Omit<Relationship, 'id' | 'from' | 'to'> & { id: number; from: number; to: number }
+
+// Data about the elements that NVL does not need, kept outside of the NVL node and relationship objects
+interface ElementData {
+  // The original IDs of the elements
+  ids?: (string | number)[];
+  properties?: (Object | null)[];
+}
+
+type RendererFields = Record<string, { unsupportedFields: { node: string[]; relationship: string[] } }>
+
+// Source code of NVL's layout workers, keyed by worker name
+type WorkerScripts = Record<string, string>
+
+interface PyOptions {
+  workerScripts?: WorkerScripts;
+  // If set, elements are added to the graph in chunks of about this many elements, one chunk per animation frame
+  progressiveChunkSize?: number;
+}
+
+// The shared worker constructor that serves NVL's layout workers from inlined sources, which are kept on it so that
+// several visualizations on one page share a single installation
+type InlineSharedWorker = typeof SharedWorker & { inlineWorkerScripts?: WorkerScripts }
+
+// Whether a worker script URL points at the chunk file of the NVL layout worker with the given name
+const isLayoutWorkerChunk = (scriptURL: string | URL, name: string): boolean => {
+  const path = String(scriptURL).split(/[?#]/)[0]
+  return path === `${name}.js` || path.endsWith(`/${name}.js`)
 }
 
-interface PyRel extends Relationship {
-  properties: Object;
+// NVL loads its layout workers from separate chunk files next to the page, which do not exist when the
+// visualization is embedded inline (e.g. in a sandboxed notebook iframe). Instead we redirect NVL's requests for
+// these chunks to blob URLs created from the inlined worker sources. Any other shared worker is constructed natively.
+const installWorkerScripts = (workerScripts: WorkerScripts): boolean => {
+  if (typeof SharedWorker === 'undefined' || typeof Blob === 'undefined' || typeof URL.createObjectURL !== 'function') {
+    return false
+  }
+  if (Object.keys(workerScripts).length === 0) {
+    return false
+  }
+
+  const installed = window.SharedWorker as InlineSharedWorker
+  if (installed.inlineWorkerScripts !== undefined) {
+    Object.assign(installed.inlineWorkerScripts, workerScripts)
+    return true
+  }
+
+  const NativeSharedWorker = window.SharedWorker
+  const inlineWorkerScripts: WorkerScripts = { ...workerScripts }
+  const blobUrls: Record<string, string> = {}
+
+  const inlineSharedWorker = function (scriptURL: string | URL, options?: string | WorkerOptions): SharedWorker {
+    const name = typeof options === 'string' ? options : options?.name
+    const source = name !== undefined ? inlineWorkerScripts[name] : undefined
+    if (name === undefined || source === undefined || !isLayoutWorkerChunk(scriptURL, name)) {
+      return new NativeSharedWorker(scriptURL, options)
+    }
+    try {
+      if (blobUrls[name] === undefined) {
+        blobUrls[name] = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }))
+      }
+      return new NativeSharedWorker(blobUrls[name], options)
+    } catch (error) {
+      // E.g. a SecurityError in an iframe with an opaque origin. The chunk file cannot be loaded either, so NVL is left
+      // to catch the error and compute the layout on the main thread instead.
+      console.warn(`Failed to start the inlined ${name} worker: ${error}`)
+      throw error
+    }
+  } as unknown as InlineSharedWorker
+  inlineSharedWorker.prototype = NativeSharedWorker.prototype
+  inlineSharedWorker.inlineWorkerScripts = inlineWorkerScripts
+
+  try {
+    window.SharedWorker = inlineSharedWorker
+  } catch {
+    return false
+  }
+  return true
+}
+
+// Order nodes so that the most prominent ones, first by size and then by degree, are shown first
+const prioritizeNodes = (nodes: Node[], rels: Relationship[]): Node[] => {
+  const degrees = new Map<string, number>()
+  for (const rel of rels) {
+    degrees.set(rel.from, (degrees.get(rel.from) ?? 0) + 1)
+    degrees.set(rel.to, (degrees.get(rel.to) ?? 0) + 1)
+  }
+
+  return [...nodes].sort(
+    (a, b) => (b.size ?? 0) - (a.size ?? 0) || (degrees.get(b.id) ?? 0) - (degrees.get(a.id) ?? 0)
+  )
+}
+
+// Removes the fields that the renderer does not draw, in case the payload still contains them
+const withoutFields = <T extends object>(element: T, fields: string[]): T => {
+  if (fields.length === 0) {
+    return element
+  }
+  const stripped = { ...element }
+  for (const field of fields) {
+    delete stripped[field as keyof T]
+  }
+  return stripped
+}
+
+const formatProperties = (properties: Object | null | undefined): string => {
+  let formatted = ""
+  for (const [key, value] of Object.entries(properties ?? {})) {
+    formatted += `</br><b>${key}:</b> ${value}`
+  }
+  return formatted
 }
 
 class PyNVL {
@@ -21,16 +131,37 @@ class PyNVL {
 
   hoverInteraction: HoverInteraction
 
+  elementData: ElementData
+
+  renderer: string
+
+  tooltipCache: Map<string, string> = new Map()
+
   constructor(
     frame: HTMLElement,
     tooltip: HTMLElement | null = null,
-    nvlNodes: Node[] = [],
-    nvlRels: Relationship[] = [],
+    pyNodes: PyNode[] = [],
+    pyRels: PyRel[] = [],
+    elementData: ElementData = {},
     options: NvlOptions = {},
-    callbacks = {}
+    callbacks = {},
+    pyOptions: PyOptions = {}
   ) {
+    // Layout runs on the main thread unless web workers were requested and can actually be started
+    const disableWebWorkers = options.disableWebWorkers !== false || !installWorkerScripts(pyOptions.workerScripts ?? {})
+    const progressive = pyOptions.progressiveChunkSize !== undefined
+
+    this.renderer = options.renderer ?? 'canvas'
+    this.elementData = elementData
+    const [nvlNodes, nvlRels] = this.toNvlElements(pyNodes, pyRels)
 
-    this.nvl = new NVL(frame, nvlNodes, nvlRels, { ...options, disableTelemetry: true, disableWebWorkers: true, disableAria: true }, callbacks)
+    this.nvl = new NVL(
+      frame,
+      progressive ? [] : nvlNodes,
+      progressive ? [] : nvlRels,
+      { ...options, disableTelemetry: true, disableWebWorkers, disableAria: true },
+      callbacks
+    )
     this.zoomInteraction = new ZoomInteraction(this.nvl)
     this.panInteraction = new PanInteraction(this.nvl)
     this.dragNodeInteraction = new DragNodeInteraction(this.nvl)
@@ -38,42 +169,125 @@ class PyNVL {
     if (tooltip !== null) {
       this.hoverInteraction = new HoverInteraction(this.nvl)
 
-      this.hoverInteraction.updateCallback('onHover', (element: PyNode | PyRel) => {
+      // Tooltip contents are only formatted when an element is first hovered, and then reused
+      let hovered: string | undefined = undefined
+
+      this.hoverInteraction.updateCallback('onHover', (element: Node | Relationship) => {
         if (element === undefined) {
+          hovered = undefined
           tooltip.textContent = "";
           if (tooltip.style.display === "block") {
             tooltip.style.display = "none";
           }
-        } else if ("from" in element) {
-          const rel = element as PyRel
+          return
+        }
 
-          let hoverInfo: string = (`<b>Source ID:</b> ${rel.from} </br><b>Target ID:</b> ${rel.to}`)
-          for (const [key, value] of Object.entries(element.properties)) {
-            hoverInfo += `</br><b>${key}:</b> ${value}`
-          }
-          tooltip.setHTMLUnsafe(hoverInfo)
+        const key = element.id
+        if (key === hovered) {
+          return
+        }
+        hovered = key
 
-          if (tooltip.style.display === "none") {
-            tooltip.style.display = "block";
+        let hoverInfo = this.tooltipCache.get(key)
+        if (hoverInfo === undefined) {
+          if ("from" in element) {
+            const rel = element as Relationship
+            hoverInfo = `<b>Source ID:</b> ${this.originalId(rel.from)} </br><b>Target ID:</b> ${this.originalId(rel.to)}`
+          } else {
+            hoverInfo = `<b>ID:</b> ${this.originalId(element.id)}`
           }
-        } else if ("id" in element) {
-          let hoverInfo: string = `<b>ID:</b> ${element.id}`
-          for (const [key, value] of Object.entries(element.properties)) {
-            hoverInfo += `</br><b>${key}:</b> ${value}`
-          }
-          tooltip.setHTMLUnsafe(hoverInfo)
+          hoverInfo += formatProperties(this.elementData.properties?.[Number(element.id)])
+          this.tooltipCache.set(key, hoverInfo)
+        }
+        tooltip.setHTMLUnsafe(hoverInfo)
 
-          if (tooltip.style.display === "none") {
-            tooltip.style.display = "block";
-          }
+        if (tooltip.style.display === "none") {
+          tooltip.style.display = "block";
         }
       })
     }
 
-    if (options.layout === FreeLayoutType) {
+    if (progressive) {
+      this.loadProgressively(nvlNodes, nvlRels, pyOptions.progressiveChunkSize as number, options.layout === FreeLayoutType)
+    } else if (options.layout === FreeLayoutType) {
       this.nvl.setNodePositions(nvlNodes, false)
     }
   }
+
+  toNvlElements(pyNodes: PyNode[], pyRels: PyRel[]): [Node[], Relationship[]] {
+    const unsupportedFields = (rendererFields as RendererFields)[this.renderer]?.unsupportedFields
+    const unsupportedNodeFields: string[] = unsupportedFields?.node ?? []
+    const unsupportedRelFields: string[] = unsupportedFields?.relationship ?? []
+
+    // NVL requires string IDs
+    const nvlNodes: Node[] = pyNodes.map((node) => withoutFields({ ...node, id: String(node.id) }, unsupportedNodeFields))
+    const nvlRels: Relationship[] = pyRels.map((rel) =>
+      withoutFields({ ...rel, id: String(rel.id), from: String(rel.from), to: String(rel.to) }, unsupportedRelFields)
+    )
+    return [nvlNodes, nvlRels]
+  }
+
+  // Updates the styling and data of elements already in the graph, without restarting the layout
+  updateGraph(pyNodes: PyNode[], pyRels: PyRel[], elementData: ElementData) {
+    this.elementData = elementData
+    this.tooltipCache.clear()
+
+    const [nvlNodes, nvlRels] = this.toNvlElements(pyNodes, pyRels)
+    this.nvl.updateElementsInGraph(nvlNodes, nvlRels)
+  }
+
+  setRenderer(renderer: string) {
+    this.renderer = renderer
+    this.nvl.setRenderer(renderer)
+  }
+
+  // Maps an NVL element ID back to the ID of the node or relationship in Python
+  originalId(id: string): string | number {
+    return this.elementData.ids?.[Number(id)] ?? id
+  }
+
+  loadProgressively(nodes: Node[], rels: Relationship[], chunkSize: number, setPositions: boolean) {
+    const orderedNodes = prioritizeNodes(nodes, rels)
+    const rank = new Map<string, number>()
+    orderedNodes.forEach((node, i) => rank.set(node.id, i))
+
+    // A relationship is added together with the last of its two nodes to be added
+    const relsByRank: Relationship[][] = orderedNodes.map(() => [])
+    const danglingRels: Relationship[] = []
+    for (const rel of rels) {
+      const fromRank = rank.get(rel.from)
+      const toRank = rank.get(rel.to)
+      if (fromRank === undefined || toRank === undefined) {
+        danglingRels.push(rel)
+      } else {
+        (relsByRank[Math.max(fromRank, toRank)] as Relationship[]).push(rel)
+      }
+    }
+
+    let next = 0
+    const addChunk = () => {
+      const chunkNodes: Node[] = []
+      const chunkRels: Relationship[] = []
+      while (next < orderedNodes.length && chunkNodes.length + chunkRels.length < chunkSize) {
+        chunkNodes.push(orderedNodes[next] as Node)
+        chunkRels.push(...(relsByRank[next] as Relationship[]))
+        next++
+      }
+      if (next === orderedNodes.length) {
+        chunkRels.push(...danglingRels)
+      }
+
+      this.nvl.addAndUpdateElementsInGraph(chunkNodes, chunkRels)
+      if (setPositions) {
+        this.nvl.setNodePositions(chunkNodes, false)
+      }
+
+      if (next < orderedNodes.length) {
+        requestAnimationFrame(addChunk)
+      }
+    }
+    addChunk()
+  }
 }
 
 export { PyNVL as NVL }
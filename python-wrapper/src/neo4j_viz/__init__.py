@@ -1,6 +1,6 @@
 from .node import Node
 from .options import CaptionAlignment, Layout, Renderer
 from .relationship import Relationship
-from .visualization_graph import VisualizationGraph
+from .visualization_graph import GraphDelta, VisualizationGraph
 
-__all__ = ["VisualizationGraph", "Node", "Relationship", "CaptionAlignment", "Layout", "Renderer"]
+__all__ = ["VisualizationGraph", "GraphDelta", "Node", "Relationship", "CaptionAlignment", "Layout", "Renderer"]
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import base64
+import json
+import zlib
+from collections.abc import Sequence
+from typing import Any, Callable, Optional, Union
+
+from pydantic_extra_types.color import Color
+
+from ._encoders import value_kind
+from ._records import NodeLike, NodeRecord, RelationshipLike, RelationshipRecord, dump_value
+from .options import CaptionAlignment
+
+# The storage format of the graphs in a `QueryCache`.
+#
+# Serialized graphs are columns of record fields as JSON, compressed. Colors and caption alignments are stored as their
+# plain values. Property values that JSON cannot represent, like bytes or the temporal and spatial types of Neo4j, are
+# stored as JSON objects tagged with their type, which is why maps are tagged too. Loading only ever creates these known
+# types, so unlike unpickling it cannot run code that came with the data.
+# The types of property values are dispatched on by their kind, like the encoders of the tooltips do.
+
+_VERSION = 2
+_NODE_FIELDS = NodeRecord.__slots__
+# In the order of the parameters of `RelationshipRecord`
+_RELATIONSHIP_FIELDS = ("source", "target", "id", "caption", "caption_align", "caption_size", "color", "properties")
+
+_TAG = "$type"
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+# The Neo4j point types by SRID
+_POINT_TYPES = {7203: "CartesianPoint", 9157: "CartesianPoint", 4326: "WGS84Point", 4979: "WGS84Point"}
+
+
+def _tz_spec(value: Any) -> Union[str, int, None]:
+    # The time zone of a Neo4j date time, as pytz zone name or as fixed offset in minutes, like the driver creates them
+    tz = value.tzinfo
+    if tz is None:
+        return None
+    if getattr(tz, "zone", None) is not None:
+        return str(tz.zone)
+    offset = tz.utcoffset(None)
+    if offset is None:
+        raise TypeError(f"Date times with time zones of type {type(tz).__name__} cannot be serialized")
+    return int(offset.total_seconds()) // 60
+
+
+def _encode_datetime(value: Any) -> Any:
+    tz = _tz_spec(value)
+    if tz is not None:
+        import pytz
+
+        value = value.as_timezone(pytz.UTC).replace(tzinfo=None)
+    return {_TAG: "datetime", "value": value.iso_format(), "tz": tz}
+
+
+def _encode_point(value: Any) -> Any:
+    srid = getattr(value, "srid", None)
+    if srid not in _POINT_TYPES:
+        raise TypeError(f"Points with SRID {srid} cannot be serialized")
+    return {_TAG: "point", "srid": srid, "value": list(value)}
+
+
+_ENCODERS: dict[str, Callable[[Any], Any]] = {
+    "float": lambda value: value,
+    "scalar": lambda value: value,
+    "numpy_scalar": lambda value: _encode_property(value.item()),
+    "list": lambda value: [_encode_property(item) for item in value],
+    "tuple": lambda value: {_TAG: "tuple", "value": [_encode_property(item) for item in value]},
+    "dict": lambda value: {
+        _TAG: "map",
+        "value": [[_encode_property(key), _encode_property(item)] for key, item in value.items()],
+    },
+    "bytes": lambda value: {_TAG: "bytes", "value": base64.b64encode(value).decode("ascii")},
+    "point": _encode_point,
+    "datetime": _encode_datetime,
+    "date": lambda value: {_TAG: "date", "value": value.iso_format()},
+    "time": lambda value: {_TAG: "time", "value": value.iso_format()},
+    "duration": lambda value: {
+        _TAG: "duration",
+        "value": [value.months, value.days, value.seconds, value.nanoseconds],
+    },
+}
+
+
+def _encode_property(value: Any) -> Any:
+    encoder = _ENCODERS.get(value_kind(type(value)))
+    if encoder is None:
+        raise TypeError(f"Property values of type {type(value).__name__} cannot be serialized")
+    return encoder(value)
+
+
+def _decode_property(value: Any) -> Any:
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, list):
+        return [_decode_property(item) for item in value]
+
+    tag = value[_TAG]
+    if tag == "map":
+        return {_decode_property(k): _decode_property(v) for k, v in value["value"]}
+    if tag == "bytes":
+        return base64.b64decode(value["value"])
+    if tag == "tuple":
+        return tuple(_decode_property(item) for item in value["value"])
+
+    if tag == "point":
+        import neo4j.spatial
+
+        point_type = getattr(neo4j.spatial, _POINT_TYPES[value["srid"]])
+        return point_type(value["value"])
+
+    import neo4j.time
+
+    if tag == "datetime":
+        datetime = neo4j.time.DateTime.from_iso_format(value["value"])
+        tz = value["tz"]
+        if tz is None:
+            return datetime
+        import pytz
+
+        zone = pytz.timezone(tz) if isinstance(tz, str) else pytz.FixedOffset(tz)
+        return datetime.replace(tzinfo=pytz.UTC).as_timezone(zone)
+    if tag == "date":
+        return neo4j.time.Date.from_iso_format(value["value"])
+    if tag == "time":
+        return neo4j.time.Time.from_iso_format(value["value"])
+    if tag == "duration":
+        months, days, seconds, nanoseconds = value["value"]
+        return neo4j.time.Duration(months=months, days=days, seconds=seconds, nanoseconds=nanoseconds)
+
+    raise ValueError(f"Unknown serialized type '{tag}'")
+
+
+def _dump_column(name: str, entities: Sequence[Union[NodeLike, RelationshipLike]]) -> list[Any]:
+    if name == "properties":
+        return [
+            {key: value if type(value) is str else _encode_property(value) for key, value in entity.properties.items()}
+            for entity in entities
+        ]
+    return [dump_value(name, getattr(entity, name)) for entity in entities]
+
+
+def _load_column(name: str, column: list[Any]) -> list[Any]:
+    if name == "color":
+        return [Color(value) if value is not None else None for value in column]
+    if name == "caption_align":
+        return [CaptionAlignment(value) if value is not None else None for value in column]
+    if name == "properties":
+        return [
+            {key: value if type(value) is str else _decode_property(value) for key, value in properties.items()}
+            for properties in column
+        ]
+    return column
+
+
+def dump_records(nodes: Sequence[NodeLike], relationships: Sequence[RelationshipLike]) -> bytes:
+    # Raises a TypeError for property values that cannot be serialized
+    data = {
+        "version": _VERSION,
+        "nodes": [_dump_column(name, nodes) for name in _NODE_FIELDS],
+        "relationships": [_dump_column(name, relationships) for name in _RELATIONSHIP_FIELDS],
+    }
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode(), 1)
+
+
+def load_records(data: bytes) -> Optional[tuple[list[NodeRecord], list[RelationshipRecord]]]:
+    # Returns None for data that is not a serialized graph of the current version
+    try:
+        loaded = json.loads(zlib.decompress(data))
+    except (zlib.error, ValueError):
+        return None
+    if not isinstance(loaded, dict) or loaded.get("version") != _VERSION:
+        return None
+    node_columns = [_load_column(name, column) for name, column in zip(_NODE_FIELDS, loaded["nodes"])]
+    rel_columns = [_load_column(name, column) for name, column in zip(_RELATIONSHIP_FIELDS, loaded["relationships"])]
+    nodes = [NodeRecord(*values) for values in zip(*node_columns)]
+    relationships = [RelationshipRecord(*values) for values in zip(*rel_columns)]
+    return nodes, relationships
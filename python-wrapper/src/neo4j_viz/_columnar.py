@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from itertools import repeat
+from typing import Any, Callable, Optional, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_extra_types.color import Color
+
+from ._records import RECORD_TYPES, NodeLike, NodeRecord, RelationshipLike, RelationshipRecord
+from .node import Node, NodeIdType
+from .options import CaptionAlignment
+from .relationship import Relationship
+from .visualization_graph import VisualizationGraph
+
+# Conversion of columnar data, shared by the importers of DataFrames, Arrow tables and other tabular sources.
+# Nothing in here depends on any particular table library.
+
+EntityType = TypeVar("EntityType", Node, Relationship)
+
+
+def parse_validation_error(e: ValidationError, entity_type: type[BaseModel], location: Optional[str] = None) -> None:
+    for err in e.errors():
+        loc = err["loc"][0]
+        if err["type"] == "missing":
+            raise ValueError(
+                f"Mandatory {entity_type.__name__.lower()} column '{loc}' is missing. Expected one of {entity_type.model_fields[loc].validation_alias.choices} to be present"  # type: ignore
+            )
+        else:
+            suffix = f" ({location})" if location is not None else ""
+            raise ValueError(
+                f"Error for {entity_type.__name__.lower()} column '{loc}' with provided input '{err['input']}'. Reason: {err['msg']}{suffix}"
+            )
+
+
+_list_adapters: dict[type, TypeAdapter[Any]] = {}
+
+
+def validate_entities(
+    entity_type: type[EntityType],
+    records: list[dict[str, Any]],
+    on_error: Callable[[ValidationError, int], None],
+) -> list[EntityType]:
+    """
+    Validate a list of records, given as keyword arguments of `entity_type`, to nodes or relationships.
+    The whole list is validated in a single call into pydantic-core, instead of constructing one entity at a time.
+    If a record is invalid, `on_error` is called with the validation error of that record alone and its index.
+    """
+    adapter = _list_adapters.get(entity_type)
+    if adapter is None:
+        adapter = _list_adapters[entity_type] = TypeAdapter(list[entity_type])  # type: ignore[valid-type]
+
+    try:
+        entities: list[EntityType] = adapter.validate_python(records)
+        return entities
+    except ValidationError as e:
+        # Validating the first invalid record once more gives the same error as constructing it on its own would
+        index = e.errors()[0]["loc"][0]
+        assert isinstance(index, int)
+        try:
+            entity_type.model_validate(records[index])
+        except ValidationError as record_error:
+            on_error(record_error, index)
+        raise
+
+
+# Conversions of values that the serializers expect as the validated type, also when validation is skipped
+_TRUSTED_CONVERSIONS: dict[str, Callable[[Any], Any]] = {
+    "color": lambda color: color if isinstance(color, Color) else Color(color),
+    "caption_align": CaptionAlignment,
+}
+
+_field_names: dict[type, dict[str, str]] = {}
+
+
+def _field_name_by_alias(entity_type: type[BaseModel]) -> dict[str, str]:
+    field_names = _field_names.get(entity_type)
+    if field_names is None:
+        field_names = _field_names[entity_type] = {
+            str(alias): name
+            for name, field in entity_type.model_fields.items()
+            for alias in field.validation_alias.choices  # type: ignore
+        }
+    return field_names
+
+
+def field_name(entity_type: type[BaseModel], key: str) -> str:
+    """The name of the field of `entity_type` that the column `key` is an alias of."""
+    return _field_name_by_alias(entity_type)[key]
+
+
+def _convert_column(convert: Callable[[Any], Any], column: Sequence[Any]) -> list[Any]:
+    # Equal strings, such as the few distinct colors of a column, are converted once and their results shared
+    converted: dict[str, Any] = {}
+    result: list[Any] = []
+    for value in column:
+        if value is None:
+            result.append(None)
+        elif isinstance(value, str):
+            result.append(converted[value] if value in converted else converted.setdefault(value, convert(value)))
+        else:
+            result.append(convert(value))
+    return result
+
+
+def _construct_records(
+    keys: list[str],
+    columns: Sequence[Sequence[Any]],
+    is_top_level: list[bool],
+    entity_type: type[EntityType],
+) -> list[Any]:
+    # Builds the records of `_records` without validation, with the mapping of aliases to fields done once per chunk
+    field_name_by_alias = _field_name_by_alias(entity_type)
+    field_names: list[str] = []
+    top_level_columns: list[Sequence[Any]] = []
+    property_keys: list[str] = []
+    property_columns: list[Sequence[Any]] = []
+    for key, top, column in zip(keys, is_top_level, columns):
+        if top:
+            name = field_name_by_alias[key]
+            convert = _TRUSTED_CONVERSIONS.get(name)
+            if convert is not None:
+                column = _convert_column(convert, column)
+            field_names.append(name)
+            top_level_columns.append(column)
+        else:
+            property_keys.append(key)
+            property_columns.append(column)
+
+    for name, field in entity_type.model_fields.items():
+        if field.is_required() and name not in field_names:
+            raise ValueError(
+                f"Mandatory {entity_type.__name__.lower()} column '{name}' is missing. Expected one of {field.validation_alias.choices} to be present"  # type: ignore
+            )
+
+    num_rows = len(columns[0]) if columns else 0
+    top_level_rows = zip(*top_level_columns) if top_level_columns else repeat((), num_rows)
+    property_rows = zip(*property_columns) if property_columns else repeat((), num_rows)
+
+    record_type = RECORD_TYPES[entity_type]
+    return [
+        record_type(**dict(zip(field_names, top_level_values)), properties=dict(zip(property_keys, property_values)))
+        for top_level_values, property_values in zip(top_level_rows, property_rows)
+    ]
+
+
+def convert_columns(
+    keys: list[str],
+    columns: Sequence[Sequence[Any]],
+    entity_type: type[EntityType],
+    rename_properties: Optional[dict[str, str]],
+    source: str,
+    first_row: int,
+    validate: bool = True,
+) -> list[Any]:
+    """
+    Convert a chunk of rows, given as one list of values per column, to nodes or relationships.
+    Columns named like a field of `entity_type` become fields, all other columns become properties.
+    `source` and `first_row` only serve to locate invalid values in error messages.
+    Without `validate`, the values are trusted to be valid, and lightweight records are built instead of the models.
+    """
+    # Which columns are top level fields and which are properties is decided once per chunk, not once per row
+    field_aliases = entity_type.all_validation_aliases()
+    is_top_level = [key in field_aliases for key in keys]
+    if rename_properties:
+        keys = [key if top_level else rename_properties.get(key, key) for key, top_level in zip(keys, is_top_level)]
+
+    if not validate:
+        return _construct_records(keys, columns, is_top_level, entity_type)
+
+    records = []
+    for values in zip(*columns):
+        record: dict[str, Any] = {}
+        properties = {}
+        for key, top, value in zip(keys, is_top_level, values):
+            if top:
+                record[key] = value
+            else:
+                properties[key] = value
+        record["properties"] = properties
+        records.append(record)
+
+    return validate_entities(
+        entity_type,
+        records,
+        lambda e, index: parse_validation_error(e, entity_type, f"{source}, row {first_row + index}"),
+    )
+
+
+def build_graph(
+    nodes: Optional[Sequence[NodeLike]],
+    relationships: Sequence[RelationshipLike],
+    has_size: bool,
+    node_radius_min_max: Optional[tuple[float, float]],
+) -> VisualizationGraph:
+    """
+    Assemble the converted entities or records into a graph. Without `nodes`, they are created from the relationship
+    endpoints.
+    """
+    if nodes is None:
+        has_size = False
+        # Ordered by first appearance, which unlike a set is deterministic
+        node_ids: dict[NodeIdType, None] = {}
+        for rel in relationships:
+            node_ids[rel.source] = None
+            node_ids[rel.target] = None
+        node_type = NodeRecord if relationships and isinstance(relationships[0], RelationshipRecord) else Node
+        nodes = [node_type(id=id) for id in node_ids]
+
+    VG = VisualizationGraph._from_records(nodes, relationships)
+
+    if node_radius_min_max is not None and has_size:
+        VG.resize_nodes(node_radius_min_max=node_radius_min_max)
+
+    return VG
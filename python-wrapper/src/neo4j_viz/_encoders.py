@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import math
+import sys
+from typing import Any, Callable, Optional
+
+# Encoding of property values to JSON compatible values, for the tooltips of the visualization.
+#
+# The kind of every value type is resolved once and then cached, so that property columns of a single type, like the
+# values of a DataFrame column, pay for the type dispatch only once. Strings, integers, booleans and None are passed
+# through without any encoding. Items of lists and values of dictionaries are encoded recursively by the same encoders.
+# Optional libraries (numpy, pandas, neo4j) are only looked up in `sys.modules`: if a library has not been imported,
+# none of the property values can be of its types. The kinds of value types are shared with `_cache_format`, which
+# stores cached graphs.
+
+Encoder = Callable[[Any, Optional[int]], Any]
+
+# By default, arrays and numeric lists with more elements than this are summarized, instead of sending all their values
+MAX_ARRAY_VALUES = 100
+# The number of values shown at the start and the end of a summarized array
+_SUMMARY_EDGE_VALUES = 3
+
+_JSON_TYPES = (str, int, bool, type(None))
+# The types of dictionary keys that JSON serialization supports, all other keys are converted to strings
+_KEY_TYPES = (str, int, float, bool, type(None))
+# The types of the items of lists that are summarized like arrays, such as embeddings from Arrow tables or Neo4j
+_NUMBER_TYPES = (int, float)
+
+
+def _encode_identity(value: Any, max_array_values: Optional[int]) -> Any:
+    return value
+
+
+def _encode_float(value: float, max_array_values: Optional[int]) -> Any:
+    # NaN and infinities are not valid JSON
+    return value if math.isfinite(value) else str(value)
+
+
+def _encode_str(value: Any, max_array_values: Optional[int]) -> str:
+    return str(value)
+
+
+def _encode_none(value: Any, max_array_values: Optional[int]) -> None:
+    return None
+
+
+def _encode_sequence(value: Any, max_array_values: Optional[int]) -> Any:
+    if (
+        max_array_values is not None
+        and len(value) > max_array_values
+        and isinstance(value, (list, tuple))
+        and all(type(item) in _NUMBER_TYPES for item in value)
+    ):
+        head = ", ".join(str(item) for item in value[:_SUMMARY_EDGE_VALUES])
+        tail = ", ".join(str(item) for item in value[-_SUMMARY_EDGE_VALUES:])
+        return f"[{head}, ..., {tail}] (length {len(value)})"
+    return [encode_value(item, max_array_values) for item in value]
+
+
+def _encode_dict(value: dict[Any, Any], max_array_values: Optional[int]) -> dict[Any, Any]:
+    return {
+        key if isinstance(key, _KEY_TYPES) else str(key): encode_value(item, max_array_values)
+        for key, item in value.items()
+    }
+
+
+def _encode_numpy_array(value: Any, max_array_values: Optional[int]) -> Any:
+    np = sys.modules["numpy"]
+
+    if max_array_values is not None and value.size > max_array_values:
+        summary = np.array2string(
+            value.ravel(), threshold=max_array_values, edgeitems=_SUMMARY_EDGE_VALUES, separator=", "
+        )
+        return f"{summary} (shape {value.shape}, {value.dtype})"
+
+    if value.dtype.kind in "biu" or (value.dtype.kind == "f" and np.isfinite(value).all()):
+        # The common case of numeric arrays, converted in one go
+        return value.tolist()
+    return _encode_sequence(value.tolist(), max_array_values)
+
+
+def _encode_numpy_scalar(value: Any, max_array_values: Optional[int]) -> Any:
+    return encode_value(value.item(), max_array_values)
+
+
+def _encode_point(value: Any, max_array_values: Optional[int]) -> str:
+    coordinates = ", ".join(f"{name}: {coordinate}" for name, coordinate in zip("xyz", value))
+    return f"point({{srid: {value.srid}, {coordinates}}})"
+
+
+def _resolve_kind(value_type: type) -> str:
+    if issubclass(value_type, float):
+        return "float"
+    if issubclass(value_type, _JSON_TYPES):
+        return "scalar"
+    if issubclass(value_type, bytes):
+        return "bytes"
+
+    np = sys.modules.get("numpy")
+    if np is not None:
+        if issubclass(value_type, np.ndarray):
+            return "numpy_array"
+        if issubclass(value_type, (np.datetime64, np.timedelta64)):
+            return "numpy_temporal"
+        if issubclass(value_type, np.generic):
+            return "numpy_scalar"
+
+    pd = sys.modules.get("pandas")
+    if pd is not None:
+        if value_type is type(pd.NA) or value_type is type(pd.NaT):
+            return "missing"
+        if issubclass(value_type, (pd.Timestamp, pd.Timedelta, pd.Period, pd.Interval)):
+            return "pandas_temporal"
+
+    neo4j_spatial = sys.modules.get("neo4j.spatial")
+    if neo4j_spatial is not None and issubclass(value_type, neo4j_spatial.Point):
+        return "point"
+    # Checked before tuples, since durations are tuples
+    neo4j_time = sys.modules.get("neo4j.time")
+    if neo4j_time is not None:
+        if issubclass(value_type, neo4j_time.DateTime):
+            return "datetime"
+        if issubclass(value_type, neo4j_time.Date):
+            return "date"
+        if issubclass(value_type, neo4j_time.Time):
+            return "time"
+        if issubclass(value_type, neo4j_time.Duration):
+            return "duration"
+
+    if issubclass(value_type, list):
+        return "list"
+    if issubclass(value_type, tuple):
+        return "tuple"
+    if issubclass(value_type, (set, frozenset)):
+        return "set"
+    if issubclass(value_type, dict):
+        return "dict"
+    return "other"
+
+
+_kinds: dict[type, str] = {}
+
+
+def value_kind(value_type: type) -> str:
+    """
+    The kind of a property value type, such as "list", "point" or "other", which decides how its values are encoded.
+    """
+    kind = _kinds.get(value_type)
+    if kind is None:
+        kind = _kinds[value_type] = _resolve_kind(value_type)
+    return kind
+
+
+_ENCODERS: dict[str, Encoder] = {
+    "float": _encode_float,
+    "scalar": _encode_identity,
+    "numpy_array": _encode_numpy_array,
+    "numpy_scalar": _encode_numpy_scalar,
+    "missing": _encode_none,
+    "point": _encode_point,
+    # The items of sequences and the values of dictionaries may need encoding themselves, such as NaN values
+    "list": _encode_sequence,
+    "tuple": _encode_sequence,
+    "set": _encode_sequence,
+    "dict": _encode_dict,
+}
+
+
+def _encoder_for(value_type: type) -> Encoder:
+    # Everything else, including bytes, `datetime` values and Neo4j temporal types, is shown by its string
+    # representation
+    return _ENCODERS.get(value_kind(value_type), _encode_str)
+
+
+def encode_value(value: Any, max_array_values: Optional[int] = MAX_ARRAY_VALUES) -> Any:
+    return _encoder_for(type(value))(value, max_array_values)
+
+
+def encode_properties(properties: dict[str, Any], max_array_values: Optional[int] = MAX_ARRAY_VALUES) -> dict[str, Any]:
+    encoded = {}
+    for key, value in properties.items():
+        value_type = type(value)
+        # Fast path for the most common types
+        if value_type is str or value_type is int or value_type is bool or value is None:
+            encoded[key] = value
+        else:
+            encoded[key] = _encoder_for(value_type)(value, max_array_values)
+    return encoded
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import Any, Optional, Union
+from uuid import uuid4
+
+from pydantic import BaseModel
+from pydantic_extra_types.color import Color
+
+from .node import Node, NodeIdType
+from .node_size import RealNumber
+from .options import CaptionAlignment
+from .relationship import Relationship
+
+# Compact stand-ins for `Node` and `Relationship`, for graphs built from data that is trusted to be valid.
+#
+# A pydantic model keeps its fields in a dictionary per instance, together with the set of fields that were given.
+# The records below keep the same fields in slots instead, which takes a fraction of the memory and is several times
+# cheaper to create. A `VisualizationGraph` holds records until its nodes or relationships are first accessed, and
+# only then converts them to the public models. Rendering a graph reads the records directly.
+#
+# The slots are named and ordered like the fields of the models, and hold values of the types that validation would
+# produce, such as `Color` objects for colors.
+
+
+def _construct_model(entity_type: type[BaseModel], values: dict[str, Any]) -> Any:
+    # The values of records have already been validated, so the model is constructed without validating them again
+    fields_set = {name for name, value in values.items() if value is not None}
+    return entity_type.model_construct(_fields_set=fields_set, **values)
+
+
+def _payload(record: Union[NodeRecord, RelationshipRecord], exclude: frozenset[str]) -> dict[str, Any]:
+    # Same as `model_dump(exclude={"properties", "id", "source", "target", *exclude}, exclude_none=True, by_alias=True)`
+    # of the corresponding model
+    payload = {}
+    for name, alias in record._payload_fields:
+        value = getattr(record, name)
+        if value is None or name in exclude:
+            continue
+        payload[alias] = value.as_hex(format="long") if name == "color" else value
+    return payload
+
+
+class NodeRecord:
+    __slots__ = ("id", "caption", "caption_align", "caption_size", "size", "color", "pinned", "x", "y", "properties")
+
+    _payload_fields = tuple(
+        (name, str(field.serialization_alias))
+        for name, field in Node.model_fields.items()
+        if name not in ("id", "properties")
+    )
+
+    def __init__(
+        self,
+        id: NodeIdType,
+        caption: Optional[str] = None,
+        caption_align: Optional[CaptionAlignment] = None,
+        caption_size: Optional[int] = None,
+        size: Optional[RealNumber] = None,
+        color: Optional[Color] = None,
+        pinned: Optional[bool] = None,
+        x: Optional[RealNumber] = None,
+        y: Optional[RealNumber] = None,
+        properties: Optional[dict[str, Any]] = None,
+    ) -> None:
+        self.id = id
+        self.caption = caption
+        self.caption_align = caption_align
+        self.caption_size = caption_size
+        self.size = size
+        self.color = color
+        self.pinned = pinned
+        self.x = x
+        self.y = y
+        self.properties = properties if properties is not None else {}
+
+    def to_model(self) -> Node:
+        node: Node = _construct_model(Node, {name: getattr(self, name) for name in self.__slots__})
+        return node
+
+    def payload(self, exclude: frozenset[str] = frozenset()) -> dict[str, Any]:
+        return _payload(self, exclude)
+
+
+class RelationshipRecord:
+    __slots__ = ("id", "source", "target", "caption", "caption_align", "caption_size", "color", "properties")
+
+    _payload_fields = tuple(
+        (name, str(field.serialization_alias))
+        for name, field in Relationship.model_fields.items()
+        if name not in ("id", "source", "target", "properties")
+    )
+
+    def __init__(
+        self,
+        source: Union[str, int],
+        target: Union[str, int],
+        id: Optional[Union[str, int]] = None,
+        caption: Optional[str] = None,
+        caption_align: Optional[CaptionAlignment] = None,
+        caption_size: Optional[Union[int, float]] = None,
+        color: Optional[Color] = None,
+        properties: Optional[dict[str, Any]] = None,
+    ) -> None:
+        self.id = id if id is not None else uuid4().hex
+        self.source = source
+        self.target = target
+        self.caption = caption
+        self.caption_align = caption_align
+        self.caption_size = caption_size
+        self.color = color
+        self.properties = properties if properties is not None else {}
+
+    def to_model(self) -> Relationship:
+        rel: Relationship = _construct_model(Relationship, {name: getattr(self, name) for name in self.__slots__})
+        return rel
+
+    def payload(self, exclude: frozenset[str] = frozenset()) -> dict[str, Any]:
+        return _payload(self, exclude)
+
+
+NodeLike = Union[Node, NodeRecord]
+RelationshipLike = Union[Relationship, RelationshipRecord]
+
+RECORD_TYPES: dict[type[BaseModel], Union[type[NodeRecord], type[RelationshipRecord]]] = {
+    Node: NodeRecord,
+    Relationship: RelationshipRecord,
+}
+
+
+def dump_value(name: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if name == "color":
+        return value.as_hex(format="long")
+    if name == "caption_align":
+        return value.value
+    return value
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Optional, Union
+
+import pyarrow as pa
+
+from ._columnar import EntityType, build_graph, convert_columns
+from .node import Node
+from .relationship import Relationship
+from .visualization_graph import VisualizationGraph
+
+ARROW_TYPE = Union[pa.Table, pa.RecordBatch, Iterable[Union[pa.Table, pa.RecordBatch]]]
+
+
+def _iter_batches(data: Optional[ARROW_TYPE]) -> Iterator[pa.RecordBatch]:
+    # Tables are walked by their record batches, which are zero-copy views of the table's buffers. Iterables, such as
+    # a `pyarrow.RecordBatchReader`, are consumed lazily so that only one batch at a time is converted.
+    if data is None:
+        return
+    tables: Iterable[Union[pa.Table, pa.RecordBatch]] = [data] if isinstance(data, (pa.Table, pa.RecordBatch)) else data
+
+    for table in tables:
+        if isinstance(table, pa.RecordBatch):
+            yield table
+        else:
+            yield from table.to_batches()
+
+
+def _convert_batches(
+    data: ARROW_TYPE, entity_type: type[EntityType], rename_properties: Optional[dict[str, str]]
+) -> tuple[list[EntityType], bool]:
+    has_size = True
+    entities: list[EntityType] = []
+    for batch_index, batch in enumerate(_iter_batches(data)):
+        keys = batch.schema.names
+        has_size &= "size" in keys
+        columns = [column.to_pylist() for column in batch.columns]
+        entities.extend(convert_columns(keys, columns, entity_type, rename_properties, f"batch {batch_index}", 0))
+
+    return entities, has_size
+
+
+def _from_arrow(
+    node_tables: Optional[ARROW_TYPE],
+    rel_tables: ARROW_TYPE,
+    node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+    rename_properties: Optional[dict[str, str]] = None,
+) -> VisualizationGraph:
+    relationships, _ = _convert_batches(rel_tables, Relationship, rename_properties)
+
+    nodes: Optional[list[Node]] = None
+    has_size = False
+    if node_tables is not None:
+        nodes, has_size = _convert_batches(node_tables, Node, rename_properties)
+
+    return build_graph(nodes, relationships, has_size, node_radius_min_max)
+
+
+def from_arrow(
+    node_tables: Optional[ARROW_TYPE],
+    rel_tables: ARROW_TYPE,
+    node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+) -> VisualizationGraph:
+    """
+    Create a VisualizationGraph from Apache Arrow tables representing a graph.
+
+    All columns will be included in the visualization graph.
+    If the columns are named as the fields of the `Node` or `Relationship` classes, they will be included as
+    top level fields of the respective objects. Otherwise, they will be included in the `properties` dictionary.
+    The tables are converted one record batch at a time, without going through pandas.
+
+    Parameters
+    ----------
+    node_tables: Optional[Union[pyarrow.Table, pyarrow.RecordBatch, Iterable[Union[pyarrow.Table, pyarrow.RecordBatch]]]]
+        Table, record batch, or iterable of tables or record batches, such as a `pyarrow.RecordBatchReader`,
+        containing node data.
+        If None, the nodes will be created from the source and target node ids in the rel_tables.
+    rel_tables: Union[pyarrow.Table, pyarrow.RecordBatch, Iterable[Union[pyarrow.Table, pyarrow.RecordBatch]]]
+        Table, record batch, or iterable of tables or record batches containing relationship data.
+    node_radius_min_max : tuple[float, float], optional
+        Minimum and maximum node radius.
+        To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    """
+
+    return _from_arrow(node_tables, rel_tables, node_radius_min_max)
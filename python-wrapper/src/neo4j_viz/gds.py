@@ -1,28 +1,149 @@
 from __future__ import annotations
 
+import logging
+import time
+import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
 from itertools import chain
-from typing import Optional
+from typing import Any, Callable, Optional
 
+import numpy as np
 import pandas as pd
 from graphdatascience import Graph, GraphDataScience
 
-from .pandas import _from_dfs
+from ._columnar import build_graph, convert_columns
+from ._records import NodeLike
+from .node import Node
+from .pandas import _parse_relationships, _row_ranges
+from .relationship import Relationship
 from .visualization_graph import VisualizationGraph
 
+_logger = logging.getLogger(__name__)
+
+# The number of nodes or relationships that are converted at once, bounding the intermediate Python objects
+_CHUNK_SIZE = 100_000
+
+# Relationship properties named like these would be taken for the topology of the relationships, so they are renamed
+# while the relationships are created
+_RESERVED_RELATIONSHIP_KEYS = frozenset(
+    {"relationshipType"}
+    | Relationship.all_validation_aliases(
+        exempted_fields=[
+            name for name in Relationship.model_fields if name not in ("id", "source", "target", "properties")
+        ]
+    )
+)
+
+_SAMPLING_METHODS = ("rwr", "cnarw", "top_k")
+
+
+def _timed_stream(description: str, stream: Callable[..., pd.DataFrame], *args: Any, **kwargs: Any) -> pd.DataFrame:
+    # Runs a stream call and logs how long it took, to help diagnose slow servers
+    start = time.perf_counter()
+    df = stream(*args, **kwargs)
+    _logger.debug("%s: %d rows in %.3f s", description, len(df), time.perf_counter() - start)
+    return df
+
 
 def _node_dfs(
-    gds: GraphDataScience, G: Graph, node_properties: list[str], node_labels: list[str]
+    gds: GraphDataScience, G: Graph, node_properties: list[str], node_labels: list[str], executor: Executor
 ) -> dict[str, pd.DataFrame]:
-    return {
-        lbl: gds.graph.nodeProperties.stream(
-            G, node_properties=node_properties, node_labels=[lbl], separate_property_columns=True
+    # The labels are streamed concurrently, as far as the executor allows
+    futures = {
+        lbl: executor.submit(
+            _timed_stream,
+            f"Streamed node properties of label '{lbl}'",
+            gds.graph.nodeProperties.stream,
+            G,
+            node_properties=node_properties,
+            node_labels=[lbl],
+            separate_property_columns=True,
         )
         for lbl in node_labels
     }
+    return {lbl: future.result() for lbl, future in futures.items()}
+
+
+def _aggregate_labels(
+    node_dfs: dict[str, pd.DataFrame], node_properties: list[str]
+) -> tuple[np.ndarray, list[np.ndarray], list[list[str]]]:
+    # Combines the frames of all labels into one row per node, in order of first appearance, without building any
+    # intermediate frames: the IDs, one array per property, and the labels of every node.
+    # The node IDs are factorized once, and the labels of every node are recorded as a bitset, one bit per label.
+    label_names = list(node_dfs.keys())
+    frames = list(node_dfs.values())
+    if not frames:
+        return np.empty(0, dtype=np.int64), [np.empty(0) for _ in node_properties], []
+
+    codes, ids = pd.factorize(np.concatenate([df["nodeId"].to_numpy() for df in frames]))
+    # The first row of every node, where its properties are taken from
+    _, first_rows = np.unique(codes, return_index=True)
+
+    # A node occurs at most once per label, so that the bits of a label can be set for all its nodes at once
+    label_bits = np.zeros((len(ids), (len(label_names) + 7) // 8), dtype=np.uint8)
+    offset = 0
+    for index, df in enumerate(frames):
+        label_bits[codes[offset : offset + len(df)], index // 8] |= np.uint8(0x80 >> (index % 8))
+        offset += len(df)
+
+    # The label lists are built once per distinct combination of labels, and copied for every node
+    combinations, combination_codes = np.unique(label_bits, axis=0, return_inverse=True)
+    del label_bits
+    combination_labels = [
+        [label_names[i] for i in np.flatnonzero(np.unpackbits(bits, count=len(label_names)))] for bits in combinations
+    ]
+    labels = [combination_labels[code].copy() for code in combination_codes.reshape(-1).tolist()]
+
+    # One property at a time, so that only a single column of all the frames is combined at once
+    columns = [
+        pd.concat([df[prop] for df in frames], ignore_index=True).to_numpy()[first_rows] for prop in node_properties
+    ]
 
+    return np.asarray(ids), columns, labels
 
-def _rel_df(gds: GraphDataScience, G: Graph) -> pd.DataFrame:
-    return gds.graph.relationships.stream(G)
+
+def _rel_df(
+    gds: GraphDataScience, G: Graph, relationship_types: list[str], relationship_properties: list[str]
+) -> pd.DataFrame:
+    # Only the topology is streamed unless properties are needed, which is cheaper
+    if not relationship_properties:
+        return _timed_stream("Streamed relationships", gds.graph.relationships.stream, G, relationship_types)
+    return _timed_stream(
+        "Streamed relationship properties",
+        gds.graph.relationshipProperties.stream,
+        G,
+        relationship_properties,
+        relationship_types,
+        separate_property_columns=True,
+    )
+
+
+def _sample(gds: GraphDataScience, G: Graph, max_nodes: int, sampling: str, size_property: Optional[str]) -> Graph:
+    # A temporary projection of about `max_nodes` nodes of `G`, which the caller has to drop
+    sample_name = f"{G.name()}_neo4j_viz_sample_{uuid.uuid4().hex}"
+    if sampling == "top_k":
+        if size_property is None:
+            raise ValueError("Sampling with 'top_k' requires a `size_property` to rank the nodes by")
+        values = _timed_stream(
+            f"Streamed node property '{size_property}'", gds.graph.nodeProperty.stream, G, size_property
+        )
+        # Nodes tied with the last of the top nodes are kept as well
+        threshold = float(values["propertyValue"].nlargest(max_nodes).min())
+        if not np.isfinite(threshold):
+            raise ValueError(
+                f"Sampling with 'top_k' requires finite values of '{size_property}' to rank the nodes by, but the "
+                f"smallest value among the top {max_nodes} nodes was {threshold}"
+            )
+        # The property key is quoted, and the threshold is written without the exponent sign that filters do not parse
+        property_key = size_property.replace("`", "``")
+        literal = repr(threshold).replace("e+", "e")
+        sample, _ = gds.graph.filter(
+            sample_name, G, node_filter=f"n.`{property_key}` >= {literal}", relationship_filter="*"
+        )
+    else:
+        sample_method = gds.graph.sample.rwr if sampling == "rwr" else gds.graph.sample.cnarw
+        sample, _ = sample_method(sample_name, G, samplingRatio=max_nodes / G.node_count())
+    return sample
 
 
 def from_gds(
@@ -31,6 +152,11 @@ def from_gds(
     size_property: Optional[str] = None,
     additional_node_properties: Optional[list[str]] = None,
     node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+    max_workers: int = 4,
+    max_nodes: Optional[int] = None,
+    sampling: str = "rwr",
+    relationship_types: Optional[list[str]] = None,
+    relationship_properties: Optional[list[str]] = None,
 ) -> VisualizationGraph:
     """
     Create a VisualizationGraph from a GraphDataScience object and a Graph object.
@@ -39,6 +165,8 @@ def from_gds(
     If the properties are named as the fields of the `Node` class, they will be included as top level fields of the
     created `Node` objects. Otherwise, they will be included in the `properties` dictionary.
     Additionally, a new "labels" node property will be added, containing the node labels of the node.
+    The same holds for `relationship_properties` and the fields of the `Relationship` class, and every relationship
+    has a "relationshipType" property.
 
     Parameters
     ----------
@@ -53,7 +181,33 @@ def from_gds(
     node_radius_min_max : tuple[float, float], optional
         Minimum and maximum node radius, by default (3, 60).
         To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    max_workers : int, optional
+        The maximum number of stream calls to the server that run at the same time, by default 4.
+        The node properties are streamed per label, concurrently with each other and with the relationships.
+        The duration of every call is logged at debug level to the "neo4j_viz.gds" logger.
+    max_nodes : int, optional
+        If given, and the graph has more nodes, only a sample of about this many nodes is visualized. The sample is
+        created on the server as a temporary projection, which is dropped once it has been streamed.
+    sampling : str, optional
+        How to sample the nodes if `max_nodes` is exceeded, by default "rwr".
+        With "rwr" or "cnarw", the graph is sampled by random walks with restarts, or by common neighbour aware random
+        walks, using the `gds.graph.sample` procedures. The number of sampled nodes is approximately `max_nodes`.
+        With "top_k", the nodes with the largest values of `size_property` are kept, including all nodes that are tied
+        with the last of them, together with the relationships between them.
+    relationship_types : list[str], optional
+        The relationship types to include, by default None, which includes all relationship types.
+        Only relationships of these types are streamed from the server.
+    relationship_properties : list[str], optional
+        Relationship properties to include in the visualization relationships, by default None. Every property must
+        exist for all included relationship types. They can be used later for modifying the relationship appearance.
     """
+    if max_workers < 1:
+        raise ValueError(f"`max_workers` must be a positive integer, but was {max_workers}")
+    if max_nodes is not None and max_nodes < 1:
+        raise ValueError(f"`max_nodes` must be a positive integer, but was {max_nodes}")
+    if sampling not in _SAMPLING_METHODS:
+        raise ValueError(f"`sampling` must be one of {_SAMPLING_METHODS}, but was '{sampling}'")
+
     node_properties_from_gds = G.node_properties()
     assert isinstance(node_properties_from_gds, pd.Series)
     actual_node_properties = list(chain.from_iterable(node_properties_from_gds.to_dict().values()))
@@ -66,39 +220,87 @@ def from_gds(
             if prop not in actual_node_properties:
                 raise ValueError(f"There is no node property '{prop}' in graph '{G.name()}'")
 
-    node_properties = set()
-    if additional_node_properties is not None:
-        node_properties.update(additional_node_properties)
+    if relationship_types is not None or relationship_properties is not None:
+        relationship_properties_from_gds = G.relationship_properties()
+        assert isinstance(relationship_properties_from_gds, pd.Series)
+        actual_relationship_properties = relationship_properties_from_gds.to_dict()
 
-    if size_property is not None:
-        node_properties.add(size_property)
+        if relationship_types is not None:
+            for rel_type in relationship_types:
+                if rel_type not in actual_relationship_properties:
+                    raise ValueError(f"There is no relationship type '{rel_type}' in graph '{G.name()}'")
 
-    node_properties = list(node_properties)
-    node_dfs = _node_dfs(gds, G, node_properties, G.node_labels())
-    for df in node_dfs.values():
-        df.rename(columns={"nodeId": "id"}, inplace=True)
+        for prop in relationship_properties or []:
+            for rel_type in relationship_types or map(str, actual_relationship_properties):
+                if prop not in actual_relationship_properties[rel_type]:
+                    raise ValueError(
+                        f"There is no relationship property '{prop}' for relationship type '{rel_type}' in graph '{G.name()}'"
+                    )
 
-    node_props_df = pd.concat(node_dfs.values(), ignore_index=True, axis=0).drop_duplicates()
-    if size_property is not None:
-        if "size" in actual_node_properties and size_property != "size":
-            node_props_df.rename(columns={"size": "__size"}, inplace=True)
-        node_props_df.rename(columns={size_property: "size"}, inplace=True)
+    if max_nodes is not None and G.node_count() > max_nodes:
+        sample = _sample(gds, G, max_nodes, sampling, size_property)
+        try:
+            return from_gds(
+                gds,
+                sample,
+                size_property,
+                additional_node_properties,
+                node_radius_min_max,
+                max_workers,
+                relationship_types=relationship_types,
+                relationship_properties=relationship_properties,
+            )
+        finally:
+            sample.drop()
 
-    for lbl, df in node_dfs.items():
-        if "labels" in actual_node_properties:
-            df.rename(columns={"labels": "__labels"}, inplace=True)
-        df["labels"] = lbl
+    node_property_set = set()
+    if additional_node_properties is not None:
+        node_property_set.update(additional_node_properties)
+
+    if size_property is not None:
+        node_property_set.add(size_property)
 
-    node_lbls_df = pd.concat([df[["id", "labels"]] for df in node_dfs.values()], ignore_index=True, axis=0)
-    node_lbls_df = node_lbls_df.groupby("id").agg({"labels": list})
+    node_properties = list(node_property_set)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # The relationships are streamed while the nodes are
+        rel_future = executor.submit(_rel_df, gds, G, relationship_types or ["*"], relationship_properties or [])
+        node_dfs = _node_dfs(gds, G, node_properties, G.node_labels(), executor)
+        rel_df = rel_future.result()
 
-    node_df = node_props_df.merge(node_lbls_df, on="id")
+    # Properties that are named like the fields that we set are renamed, and named back once they are properties
+    property_keys = []
+    for prop in node_properties:
+        if prop == size_property:
+            property_keys.append("size")
+        elif prop == "size" and size_property is not None:
+            property_keys.append("__size")
+        elif prop == "labels":
+            property_keys.append("__labels")
+        else:
+            property_keys.append(prop)
 
-    rel_df = _rel_df(gds, G)
-    rel_df.rename(columns={"sourceNodeId": "source", "targetNodeId": "target"}, inplace=True)
+    ids, node_columns, labels = _aggregate_labels(node_dfs, node_properties)
+    del node_dfs
+    keys = ["id", *property_keys, "labels"]
 
+    rename_properties = {"__size": "size"}
+    rel_columns = {"sourceNodeId": "source", "targetNodeId": "target"}
+    for prop in relationship_properties or []:
+        if prop in _RESERVED_RELATIONSHIP_KEYS:
+            rel_columns[prop] = f"__{prop}"
+            rename_properties[f"__{prop}"] = prop
+    rel_df.rename(columns=rel_columns, inplace=True)
     try:
-        return _from_dfs(node_df, rel_df, node_radius_min_max=node_radius_min_max, rename_properties={"__size": "size"})
+        nodes: list[NodeLike] = []
+        for start, stop in _row_ranges(len(ids), _CHUNK_SIZE):
+            columns = [
+                ids[start:stop].tolist(),
+                *(col[start:stop].tolist() for col in node_columns),
+                labels[start:stop],
+            ]
+            nodes.extend(convert_columns(keys, columns, Node, rename_properties, f"graph '{G.name()}'", start))
+        relationships = _parse_relationships(rel_df, rename_properties=rename_properties, chunk_size=_CHUNK_SIZE)
+        return build_graph(nodes, relationships, "size" in keys, node_radius_min_max)
     except ValueError as e:
         err_msg = str(e)
         if "column" in err_msg:
@@ -5,6 +5,7 @@ from typing import Any, Optional
 from pydantic import BaseModel, ValidationError
 
 from neo4j_viz import Node, Relationship, VisualizationGraph
+from neo4j_viz._columnar import validate_entities
 
 
 def _parse_value(value_str: str) -> Any:
@@ -92,8 +93,13 @@ def _parse_value(value_str: str) -> Any:
 
 
 def _parse_prop_str(
-    query: str, prop_str: str, prop_start: int, top_level_keys: set[str]
+    query: str,
+    prop_str: str,
+    prop_start: int,
+    top_level_keys: set[str],
+    selected_keys: Optional[set[str]] = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
+    # Values of properties that are neither top level nor in `selected_keys` are skipped without being parsed
     top_level: dict[str, Any] = {}
     props: dict[str, Any] = {}
     depth = 0
@@ -117,7 +123,7 @@ def _parse_prop_str(
 
                 if k in top_level_keys:
                     top_level[k] = _parse_value(v)
-                else:
+                elif selected_keys is None or k in selected_keys:
                     props[k] = _parse_value(v)
 
                 start_idx = i + 1
@@ -135,14 +141,14 @@ def _parse_prop_str(
 
         if k in top_level_keys:
             top_level[k] = _parse_value(v)
-        else:
+        elif selected_keys is None or k in selected_keys:
             props[k] = _parse_value(v)
 
     return top_level, props
 
 
 def _parse_labels_and_props(
-    query: str, s: str, top_level_keys: set[str]
+    query: str, s: str, top_level_keys: set[str], selected_keys: Optional[set[str]] = None
 ) -> tuple[Optional[str], dict[str, Any], dict[str, Any]]:
     prop_match = re.search(r"\{(.*)\}", s)
     prop_str = ""
@@ -155,7 +161,7 @@ def _parse_labels_and_props(
     final_alias = raw_alias if raw_alias else None
 
     if prop_str:
-        top_level, props = _parse_prop_str(query, prop_str, prop_start, top_level_keys)
+        top_level, props = _parse_prop_str(query, prop_str, prop_start, top_level_keys, selected_keys)
     else:
         top_level = {}
         props = {}
@@ -175,17 +181,30 @@ def _get_snippet(q: str, idx: int, context: int = 15) -> str:
     return q[start:end].replace("\n", " ")
 
 
+def _kept_keys(selected: Optional[list[str]], include_properties: bool, implicit_key: str) -> Optional[set[str]]:
+    # The keys of the properties to include, or None for all of them. The implicit "labels" or "type" property, and
+    # a renamed user property of the same name, are kept with the others.
+    if not include_properties:
+        return set()
+    if selected is None:
+        return None
+    return {*selected, implicit_key, f"__{implicit_key}"} if implicit_key in selected else {*selected, implicit_key}
+
+
 def from_gql_create(
     query: str,
     size_property: Optional[str] = None,
     node_caption: Optional[str] = "labels",
     relationship_caption: Optional[str] = "type",
     node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+    node_properties: Optional[list[str]] = None,
+    relationship_properties: Optional[list[str]] = None,
+    properties: bool = True,
 ) -> VisualizationGraph:
     """
     Parse a GQL CREATE query and return a VisualizationGraph object representing the graph it creates.
 
-    All node and relationship properties will be included in the visualization graph.
+    By default, all node and relationship properties will be included in the visualization graph.
     If the properties are named as the fields of the `Node` or `Relationship` classes, they will be included as
     top level fields of the respective objects. Otherwise, they will be included in the `properties` dictionary.
     Additionally, a "labels" property will be added for nodes and a "type" property for relationships.
@@ -208,6 +227,17 @@ def from_gql_create(
     node_radius_min_max : tuple[float, float], optional
         Minimum and maximum node radius, by default (3, 60).
         To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    node_properties : list[str], optional
+        If given, only these node properties are included in the `properties` of the nodes, by default all of them.
+        The values of other node properties are not parsed, unless they are used for the size or caption.
+    relationship_properties : list[str], optional
+        If given, only these relationship properties are included in the `properties` of the relationships, by
+        default all of them. The values of other relationship properties are not parsed, unless they are used for
+        the caption.
+    properties : bool, optional
+        Whether to include properties, by default True. If False, only the properties used for the sizes and captions,
+        and the properties named like fields, are parsed, and the nodes and relationships get no `properties`, not
+        even "labels" and "type".
     """
 
     query = query.strip()
@@ -254,6 +284,16 @@ def from_gql_create(
     node_top_level_keys = Node.all_validation_aliases(exempted_fields=["id"])
     rel_top_level_keys = Relationship.all_validation_aliases(exempted_fields=["id", "source", "target"])
 
+    # The properties to parse, and to keep once the sizes and captions have been set, or None for all of them
+    node_kept_keys = _kept_keys(node_properties, properties, "labels")
+    rel_kept_keys = _kept_keys(relationship_properties, properties, "type")
+    node_parsed_keys = None
+    if node_kept_keys is not None:
+        node_parsed_keys = node_kept_keys | {key for key in (size_property, node_caption) if key is not None}
+    rel_parsed_keys = None
+    if rel_kept_keys is not None:
+        rel_parsed_keys = rel_kept_keys | ({relationship_caption} if relationship_caption is not None else set())
+
     def _parse_validation_error(e: ValidationError, entity_type: type[BaseModel]) -> None:
         for err in e.errors():
             loc = err["loc"][0]
@@ -268,8 +308,8 @@ def from_gql_create(
                 f"Error for {entity_type.__name__.lower()} property '{loc}' with provided input '{err['input']}'. Reason: {err['msg']}"
             )
 
-    nodes = []
-    relationships = []
+    node_records: list[dict[str, Any]] = []
+    rel_records: list[dict[str, Any]] = []
     alias_to_id = {}
     anonymous_count = 0
 
@@ -277,16 +317,15 @@ def from_gql_create(
         node_m = node_pattern.match(part)
         if node_m:
             alias_labels_props = node_m.group(1).strip()
-            alias, top_level, props = _parse_labels_and_props(query, alias_labels_props, node_top_level_keys)
+            alias, top_level, props = _parse_labels_and_props(
+                query, alias_labels_props, node_top_level_keys, node_parsed_keys
+            )
             if not alias:
                 alias = f"_anon_{anonymous_count}"
                 anonymous_count += 1
             if alias not in alias_to_id:
                 alias_to_id[alias] = str(uuid.uuid4())
-            try:
-                nodes.append(Node(id=alias_to_id[alias], **top_level, properties=props))
-            except ValidationError as e:
-                _parse_validation_error(e, Node)
+            node_records.append({"id": alias_to_id[alias], **top_level, "properties": props})
 
             continue
 
@@ -296,31 +335,29 @@ def from_gql_create(
             right_node = rel_m.group(4).strip()
 
             # Parse left node pattern
-            left_alias, left_top_level, left_props = _parse_labels_and_props(query, left_node, node_top_level_keys)
+            left_alias, left_top_level, left_props = _parse_labels_and_props(
+                query, left_node, node_top_level_keys, node_parsed_keys
+            )
             if not left_alias:
                 left_alias = f"_anon_{anonymous_count}"
                 anonymous_count += 1
                 if left_alias not in alias_to_id:
                     alias_to_id[left_alias] = str(uuid.uuid4())
-                try:
-                    nodes.append(Node(id=alias_to_id[left_alias], **left_top_level, properties=left_props))
-                except ValidationError as e:
-                    _parse_validation_error(e, Node)
+                node_records.append({"id": alias_to_id[left_alias], **left_top_level, "properties": left_props})
             elif left_alias not in alias_to_id:
                 snippet = _get_snippet(query, query.index(left_node))
                 raise ValueError(f"Relationship references unknown node alias: '{left_alias}' near: `{snippet}`.")
 
             # Parse right node pattern
-            right_alias, right_top_level, right_props = _parse_labels_and_props(query, right_node, node_top_level_keys)
+            right_alias, right_top_level, right_props = _parse_labels_and_props(
+                query, right_node, node_top_level_keys, node_parsed_keys
+            )
             if not right_alias:
                 right_alias = f"_anon_{anonymous_count}"
                 anonymous_count += 1
                 if right_alias not in alias_to_id:
                     alias_to_id[right_alias] = str(uuid.uuid4())
-                try:
-                    nodes.append(Node(id=alias_to_id[right_alias], **right_top_level, properties=right_props))
-                except ValidationError as e:
-                    _parse_validation_error(e, Node)
+                node_records.append({"id": alias_to_id[right_alias], **right_top_level, "properties": right_props})
             elif right_alias not in alias_to_id:
                 snippet = _get_snippet(query, query.index(right_node))
                 raise ValueError(f"Relationship references unknown node alias: '{right_alias}' near: `{snippet}`.")
@@ -331,7 +368,7 @@ def from_gql_create(
             if rel_props_str:
                 inner_str = rel_props_str.strip("{}").strip()
                 prop_start = query.index(inner_str, query.index(inner_str))
-                top_level, props = _parse_prop_str(query, inner_str, prop_start, rel_top_level_keys)
+                top_level, props = _parse_prop_str(query, inner_str, prop_start, rel_top_level_keys, rel_parsed_keys)
             else:
                 top_level = {}
                 props = {}
@@ -339,24 +376,24 @@ def from_gql_create(
                 props["__type"] = props["type"]
             props["type"] = rel_type
 
-            try:
-                relationships.append(
-                    Relationship(
-                        id=rel_id,
-                        source=alias_to_id[left_alias],
-                        target=alias_to_id[right_alias],
-                        **top_level,
-                        properties=props,
-                    )
-                )
-            except ValidationError as e:
-                _parse_validation_error(e, Relationship)
+            rel_records.append(
+                {
+                    "id": rel_id,
+                    "source": alias_to_id[left_alias],
+                    "target": alias_to_id[right_alias],
+                    **top_level,
+                    "properties": props,
+                }
+            )
 
             continue
 
         snippet = part[:30]
         raise ValueError(f"Invalid element in CREATE near: `{snippet}`.")
 
+    nodes = validate_entities(Node, node_records, lambda e, _: _parse_validation_error(e, Node))
+    relationships = validate_entities(Relationship, rel_records, lambda e, _: _parse_validation_error(e, Relationship))
+
     if size_property is not None:
         for node in nodes:
             node.size = node.properties.get(size_property)
@@ -374,6 +411,13 @@ def from_gql_create(
             else:
                 rel.caption = str(rel.properties.get(relationship_caption))
 
+    if node_kept_keys is not None:
+        for node in nodes:
+            node.properties = {k: v for k, v in node.properties.items() if k in node_kept_keys}
+    if rel_kept_keys is not None:
+        for rel in relationships:
+            rel.properties = {k: v for k, v in rel.properties.items() if k in rel_kept_keys}
+
     VG = VisualizationGraph(nodes=nodes, relationships=relationships)
     if (node_radius_min_max is not None) and (size_property is not None):
         try:
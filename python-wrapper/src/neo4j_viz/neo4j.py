@@ -1,15 +1,38 @@
 from __future__ import annotations
 
-from typing import Optional, Union
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import warnings
+from collections import deque
+from collections.abc import Collection, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import closing
+from typing import Any, NamedTuple, Optional, Union
 
 import neo4j.graph
-from neo4j import Result
+from neo4j import AsyncResult, Record, Result
 from pydantic import BaseModel, ValidationError
 
+from neo4j_viz._cache_format import dump_records, load_records
+from neo4j_viz._columnar import validate_entities
 from neo4j_viz.node import Node
 from neo4j_viz.relationship import Relationship
 from neo4j_viz.visualization_graph import VisualizationGraph
 
+# The number of records that `from_neo4j_async` processes before letting other tasks run
+_ASYNC_BATCH_SIZE = 1000
+
+# Nodes that are already known are not returned, so only their element IDs are sent as the endpoints of relationships
+_EXPAND_QUERY = (
+    "MATCH (n)-[r]-(m) WHERE elementId(n) IN $node_ids AND NOT elementId(r) IN $known_relationship_ids "
+    "RETURN CASE WHEN elementId(n) IN $known_node_ids THEN null ELSE n END AS n, r, "
+    "CASE WHEN elementId(m) IN $known_node_ids THEN null ELSE m END AS m"
+)
+
 
 def _parse_validation_error(e: ValidationError, entity_type: type[BaseModel]) -> None:
     for err in e.errors():
@@ -19,12 +42,104 @@ def _parse_validation_error(e: ValidationError, entity_type: type[BaseModel]) ->
         )
 
 
+class _EntityCollector:
+    # Collects the nodes and relationships of a query result, deduplicated by element ID through an index.
+    # The entities of the driver are only referenced, not copied. A node that is first seen as the endpoint of a
+    # relationship is completed in place by the driver, if the node itself arrives in a later record.
+    def __init__(self, max_nodes: Optional[int] = None) -> None:
+        self.max_nodes = max_nodes
+        self.nodes: dict[str, neo4j.graph.Node] = {}
+        self.relationships: dict[str, neo4j.graph.Relationship] = {}
+
+    def is_full(self) -> bool:
+        return self.max_nodes is not None and len(self.nodes) >= self.max_nodes
+
+    def add_node(self, node: neo4j.graph.Node) -> bool:
+        existing = self.nodes.get(node.element_id)
+        if existing is not None:
+            # Entities of different results are different objects. A node that a result only had as the endpoint of a
+            # relationship, without labels or properties, is replaced by the same node from another result.
+            if not existing.labels and len(existing) == 0:
+                self.nodes[node.element_id] = node
+            return True
+        if self.is_full():
+            return False
+        self.nodes[node.element_id] = node
+        return True
+
+    def add_relationship(self, rel: neo4j.graph.Relationship) -> None:
+        if rel.element_id in self.relationships or rel.start_node is None or rel.end_node is None:
+            return
+        # Relationships are only included together with both of their nodes
+        if self.add_node(rel.start_node) and self.add_node(rel.end_node):
+            self.relationships[rel.element_id] = rel
+
+    def add_value(self, value: Any) -> None:
+        if isinstance(value, neo4j.graph.Node):
+            self.add_node(value)
+        elif isinstance(value, neo4j.graph.Relationship):
+            self.add_relationship(value)
+        elif isinstance(value, neo4j.graph.Path):
+            for node in value.nodes:
+                self.add_node(node)
+            for rel in value.relationships:
+                self.add_relationship(rel)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                self.add_value(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                self.add_value(item)
+
+    def add_record(self, record: Record) -> None:
+        for value in record.values():
+            self.add_value(value)
+
+    def add_graph(self, graph: neo4j.graph.Graph) -> None:
+        for node in graph.nodes:
+            self.add_node(node)
+        for rel in graph.relationships:
+            self.add_relationship(rel)
+
+    def add_collected(self, other: _EntityCollector) -> None:
+        for node in other.nodes.values():
+            self.add_node(node)
+        for rel in other.relationships.values():
+            self.add_relationship(rel)
+
+    def build(
+        self,
+        size_property: Optional[str],
+        node_caption: Optional[str],
+        relationship_caption: Optional[str],
+        node_radius_min_max: Optional[tuple[float, float]],
+        node_properties: Optional[Collection[str]] = None,
+        relationship_properties: Optional[Collection[str]] = None,
+        properties: bool = True,
+    ) -> VisualizationGraph:
+        return _build_graph(
+            self.nodes.values(),
+            self.relationships.values(),
+            size_property,
+            node_caption,
+            relationship_caption,
+            node_radius_min_max,
+            node_properties,
+            relationship_properties,
+            properties,
+        )
+
+
 def from_neo4j(
     result: Union[neo4j.graph.Graph, Result],
     size_property: Optional[str] = None,
     node_caption: Optional[str] = "labels",
     relationship_caption: Optional[str] = "type",
     node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+    max_nodes: Optional[int] = None,
+    node_properties: Optional[list[str]] = None,
+    relationship_properties: Optional[list[str]] = None,
+    properties: bool = True,
 ) -> VisualizationGraph:
     """
     Create a VisualizationGraph from a Neo4j Graph or Neo4j Result object.
@@ -34,6 +149,9 @@ def from_neo4j(
     top level fields of the respective objects. Otherwise, they will be included in the `properties` dictionary.
     Additionally, a "labels" property will be added for nodes and a "type" property for relationships.
 
+    The records of a Result are processed as they arrive, instead of being buffered all at once. The nodes,
+    relationships and paths are taken from all values of the records, including values nested in lists and maps.
+
     Parameters
     ----------
     result : Union[neo4j.graph.Graph, Result]
@@ -47,23 +165,572 @@ def from_neo4j(
     node_radius_min_max : tuple[float, float], optional
         Minimum and maximum node radius, by default (3, 60).
         To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    max_nodes : int, optional
+        If given, at most this many nodes are included, in order of appearance, and relationships are only included
+        together with both of their nodes. A Result is no longer consumed once this many nodes have been collected,
+        and its remaining records are left unread.
+    node_properties : list[str], optional
+        If given, only these node properties are included in the `properties` of the nodes, by default all of them.
+        The values of other node properties are never read. Properties named like fields of `Node` are still used
+        as fields.
+    relationship_properties : list[str], optional
+        If given, only these relationship properties are included in the `properties` of the relationships, by
+        default all of them. The values of other relationship properties are never read. Properties named like fields
+        of `Relationship` are still used as fields.
+    properties : bool, optional
+        Whether to include properties, by default True. If False, only the captions, the sizes and the properties
+        named like fields are read, and the nodes and relationships get no `properties`, not even "labels" and "type".
     """
 
+    if max_nodes is not None and max_nodes < 1:
+        raise ValueError(f"`max_nodes` must be a positive integer, but was {max_nodes}")
+
+    collector = _EntityCollector(max_nodes)
     if isinstance(result, Result):
-        graph = result.graph()
+        for record in result:
+            collector.add_record(record)
+            if collector.is_full():
+                break
     elif isinstance(result, neo4j.graph.Graph):
-        graph = result
+        collector.add_graph(result)
     else:
         raise ValueError(f"Invalid input type `{type(result)}`. Expected `neo4j.Graph` or `neo4j.Result`")
 
+    return collector.build(
+        size_property,
+        node_caption,
+        relationship_caption,
+        node_radius_min_max,
+        node_properties,
+        relationship_properties,
+        properties,
+    )
+
+
+async def from_neo4j_async(
+    result: AsyncResult,
+    size_property: Optional[str] = None,
+    node_caption: Optional[str] = "labels",
+    relationship_caption: Optional[str] = "type",
+    node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+    max_nodes: Optional[int] = None,
+    node_properties: Optional[list[str]] = None,
+    relationship_properties: Optional[list[str]] = None,
+    properties: bool = True,
+    executor: Optional[Executor] = None,
+) -> VisualizationGraph:
+    """
+    Create a VisualizationGraph from a Neo4j AsyncResult object, as returned by the async driver.
+
+    Works like `from_neo4j`, without blocking the event loop: the records are consumed asynchronously, other tasks
+    get to run between batches of records, and the conversion of the collected nodes and relationships runs in an
+    executor.
+
+    Parameters
+    ----------
+    result : AsyncResult
+        Query result of the async driver.
+    size_property : str, optional
+        Property to use for node size, by default None.
+    node_caption : str, optional
+        Property to use as the node caption, by default the node labels will be used.
+    relationship_caption : str, optional
+        Property to use as the relationship caption, by default the relationship type will be used.
+    node_radius_min_max : tuple[float, float], optional
+        Minimum and maximum node radius, by default (3, 60).
+        To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    max_nodes : int, optional
+        If given, at most this many nodes are included, in order of appearance, and relationships are only included
+        together with both of their nodes. The result is no longer consumed once this many nodes have been collected,
+        and its remaining records are left unread.
+    node_properties : list[str], optional
+        If given, only these node properties are included in the `properties` of the nodes, by default all of them.
+        The values of other node properties are never read. Properties named like fields of `Node` are still used
+        as fields.
+    relationship_properties : list[str], optional
+        If given, only these relationship properties are included in the `properties` of the relationships, by
+        default all of them. The values of other relationship properties are never read. Properties named like fields
+        of `Relationship` are still used as fields.
+    properties : bool, optional
+        Whether to include properties, by default True. If False, only the captions, the sizes and the properties
+        named like fields are read, and the nodes and relationships get no `properties`, not even "labels" and "type".
+    executor : Executor, optional
+        The executor to convert the nodes and relationships in, by default the default executor of the event loop.
+    """
+
+    if max_nodes is not None and max_nodes < 1:
+        raise ValueError(f"`max_nodes` must be a positive integer, but was {max_nodes}")
+    if not isinstance(result, AsyncResult):
+        raise ValueError(f"Invalid input type `{type(result)}`. Expected `neo4j.AsyncResult`")
+
+    collector = _EntityCollector(max_nodes)
+    num_records = 0
+    async for record in result:
+        collector.add_record(record)
+        if collector.is_full():
+            break
+        num_records += 1
+        if num_records % _ASYNC_BATCH_SIZE == 0:
+            # Records that the driver has already buffered are returned without suspending, so other tasks would not
+            # get to run until the whole buffer has been processed
+            await asyncio.sleep(0)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        collector.build,
+        size_property,
+        node_caption,
+        relationship_caption,
+        node_radius_min_max,
+        node_properties,
+        relationship_properties,
+        properties,
+    )
+
+
+def from_neo4j_paged(
+    driver: neo4j.Driver,
+    query: str,
+    page_size: int = 10_000,
+    parameters: Optional[dict[str, Any]] = None,
+    database: Optional[str] = None,
+    max_sessions: int = 4,
+    size_property: Optional[str] = None,
+    node_caption: Optional[str] = "labels",
+    relationship_caption: Optional[str] = "type",
+    node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+    max_nodes: Optional[int] = None,
+    node_properties: Optional[list[str]] = None,
+    relationship_properties: Optional[list[str]] = None,
+    properties: bool = True,
+) -> VisualizationGraph:
+    """
+    Create a VisualizationGraph from a query that is run page by page, with several pages fetched concurrently.
+
+    The query must page its results with the parameters `$skip` and `$limit`, for example
+    `MATCH (n)-[r]->(m) RETURN n, r, m ORDER BY elementId(r) SKIP $skip LIMIT $limit`. The order must be stable for
+    the pages to be consistent. Pages are run in sessions of their own, at most `max_sessions` at the same time, until a
+    page returns fewer than `page_size` records. The nodes and relationships of all pages are merged by element ID, so
+    that entities occurring in several pages are included once.
+
+    Parameters
+    ----------
+    driver : neo4j.Driver
+        The driver to open the sessions with.
+    query : str
+        The query, with `$skip` and `$limit` parameters.
+    page_size : int, optional
+        The number of records per page, by default 10000.
+    parameters : dict[str, Any], optional
+        Further parameters of the query.
+    database : str, optional
+        The database to run the query against, by default the default database of the server.
+    max_sessions : int, optional
+        The maximum number of pages that are fetched at the same time, each in its own session, by default 4.
+    size_property : str, optional
+        Property to use for node size, by default None.
+    node_caption : str, optional
+        Property to use as the node caption, by default the node labels will be used.
+    relationship_caption : str, optional
+        Property to use as the relationship caption, by default the relationship type will be used.
+    node_radius_min_max : tuple[float, float], optional
+        Minimum and maximum node radius, by default (3, 60).
+        To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    max_nodes : int, optional
+        If given, at most this many nodes are included, in order of appearance. No further pages are fetched once
+        this many nodes have been collected.
+    node_properties : list[str], optional
+        If given, only these node properties are included in the `properties` of the nodes, by default all of them.
+        The values of other node properties are never read. Properties named like fields of `Node` are still used
+        as fields.
+    relationship_properties : list[str], optional
+        If given, only these relationship properties are included in the `properties` of the relationships, by
+        default all of them. The values of other relationship properties are never read. Properties named like fields
+        of `Relationship` are still used as fields.
+    properties : bool, optional
+        Whether to include properties, by default True. If False, only the captions, the sizes and the properties
+        named like fields are read, and the nodes and relationships get no `properties`, not even "labels" and "type".
+    """
+
+    if page_size < 1:
+        raise ValueError(f"`page_size` must be a positive integer, but was {page_size}")
+    if max_sessions < 1:
+        raise ValueError(f"`max_sessions` must be a positive integer, but was {max_sessions}")
+    if max_nodes is not None and max_nodes < 1:
+        raise ValueError(f"`max_nodes` must be a positive integer, but was {max_nodes}")
+
+    def fetch_page(page: int) -> tuple[_EntityCollector, int]:
+        page_parameters = {**(parameters or {}), "skip": page * page_size, "limit": page_size}
+        collector = _EntityCollector()
+        num_records = 0
+        with driver.session(database=database) as session:
+            for record in session.run(query, page_parameters):
+                collector.add_record(record)
+                num_records += 1
+        return collector, num_records
+
+    merged = _EntityCollector(max_nodes)
+    with ThreadPoolExecutor(max_workers=max_sessions) as executor:
+        pending = deque(executor.submit(fetch_page, page) for page in range(max_sessions))
+        next_page = max_sessions
+        # Pages are merged in order, which keeps the result independent of which page finishes first
+        while pending:
+            page_collector, num_records = pending.popleft().result()
+            merged.add_collected(page_collector)
+            if num_records < page_size or merged.is_full():
+                # Later pages are empty, or not needed
+                for future in pending:
+                    future.cancel()
+                break
+            pending.append(executor.submit(fetch_page, next_page))
+            next_page += 1
+
+    return merged.build(
+        size_property,
+        node_caption,
+        relationship_caption,
+        node_radius_min_max,
+        node_properties,
+        relationship_properties,
+        properties,
+    )
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a `QueryCache`.
+
+    The hits, misses and skipped graphs are counted by the `QueryCache` object, while the entries and their size are
+    those of the cache file, shared by all processes that use it.
+    """
+
+    hits: int
+    misses: int
+    #: The number of graphs that were not stored, since they were too large or had values that cannot be stored
+    skipped: int
+    entries: int
+    size_bytes: int
+
+
+# The number of least recently used cache entries that are read at a time when evicting
+_EVICTION_BATCH_SIZE = 64
+
+
+class QueryCache:
+    """
+    A persistent cache of the visualization graphs created by `from_neo4j_cached`.
+
+    The graphs are stored as compressed JSON in an SQLite database file, which can be shared by several processes.
+    Entries expire `ttl` seconds after they were stored, and the least recently used entries are evicted once the cache
+    exceeds `max_bytes`. Loading a cached graph does not validate its values again.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]], ttl: Optional[float] = 3600, max_bytes: int = 256 << 20):
+        """
+        Open the cache in the given file, which is created if it does not exist.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike[str]]
+            The path of the SQLite database file.
+        ttl : float, optional
+            The time to live of the entries in seconds, by default one hour. If None, entries do not expire.
+        max_bytes : int, optional
+            The maximum total size of the stored graphs in bytes, by default 256 MiB.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"`ttl` must be positive, but was {ttl}")
+        if max_bytes < 1:
+            raise ValueError(f"`max_bytes` must be a positive integer, but was {max_bytes}")
+
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+        with closing(self._connect()) as conn:
+            # With write-ahead logging, readers in other processes are not blocked by a writer
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS graphs "
+                    "(key TEXT PRIMARY KEY, created REAL NOT NULL, accessed REAL NOT NULL, size INTEGER NOT NULL, data BLOB NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS graphs_accessed ON graphs (accessed)")
+                conn.execute("CREATE INDEX IF NOT EXISTS graphs_created ON graphs (created)")
+                # The total size of all entries is kept up to date by triggers, so that it never needs to be summed up
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS total (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)"
+                )
+                conn.execute("INSERT OR IGNORE INTO total VALUES (0, (SELECT COALESCE(SUM(size), 0) FROM graphs))")
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS graphs_insert AFTER INSERT ON graphs "
+                    "BEGIN UPDATE total SET size = size + NEW.size; END"
+                )
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS graphs_update AFTER UPDATE OF size ON graphs "
+                    "BEGIN UPDATE total SET size = size - OLD.size + NEW.size; END"
+                )
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS graphs_delete AFTER DELETE ON graphs "
+                    "BEGIN UPDATE total SET size = size - OLD.size; END"
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation, so that the cache can be used from several threads. Transactions are explicit.
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    @staticmethod
+    def key(
+        query: str, parameters: Optional[dict[str, Any]] = None, database: Optional[str] = None, **options: Any
+    ) -> str:
+        """
+        Compute the cache key of a query, together with the options that the graph was created with.
+
+        Parameters
+        ----------
+        query : str
+            The query text.
+        parameters : dict[str, Any], optional
+            The parameters of the query.
+        database : str, optional
+            The database the query is run against.
+        **options : Any
+            Further options that affect the created graph.
+        """
+        # Parameter values that JSON does not support, like dates, are keyed by their representation
+        identity = json.dumps([query, parameters or {}, database, options], sort_keys=True, default=repr)
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[VisualizationGraph]:
+        """
+        Load the graph stored under a key, or return None if there is none or it has expired.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT created, data FROM graphs WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl is not None and row[0] + self.ttl <= now:
+                conn.execute("DELETE FROM graphs WHERE key = ? AND created = ?", (key, row[0]))
+                row = None
+            if row is not None:
+                conn.execute("UPDATE graphs SET accessed = ? WHERE key = ?", (now, key))
+
+        loaded = load_records(row[1]) if row is not None else None
+        if loaded is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return VisualizationGraph._from_records(*loaded)
+
+    def put(self, key: str, VG: VisualizationGraph) -> None:
+        """
+        Store a graph under a key, replacing any graph stored under it before.
+
+        Graphs that are larger than `max_bytes` on their own, or that have property values of types that cannot be
+        stored, are skipped with a warning and counted in `info`. Besides JSON values, the types that can be stored
+        include bytes, tuples, and the temporal and spatial types of the Neo4j driver.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        VG : VisualizationGraph
+            The graph to store.
+        """
+        try:
+            data = dump_records(VG._node_entities(), VG._relationship_entities())
+        except TypeError as e:
+            self.skipped += 1
+            warnings.warn(f"The graph is not cached, since it cannot be stored: {e}")
+            return
+        if len(data) > self.max_bytes:
+            self.skipped += 1
+            warnings.warn(f"The graph is not cached, since its size of {len(data)} bytes exceeds `max_bytes`")
+            return
+
+        now = time.time()
+        with closing(self._connect()) as conn:
+            # Other processes wait for the whole update, including the eviction
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # An upsert rather than a replace, since a replace would not run the delete trigger
+                conn.execute(
+                    "INSERT INTO graphs (key, created, accessed, size, data) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET "
+                    "created = excluded.created, accessed = excluded.accessed, size = excluded.size, data = excluded.data",
+                    (key, now, now, len(data), data),
+                )
+                if self.ttl is not None:
+                    conn.execute("DELETE FROM graphs WHERE created <= ?", (now - self.ttl,))
+
+                # The least recently used entries are evicted, reading only as many of them as needed
+                (excess,) = conn.execute("SELECT size - ? FROM total", (self.max_bytes,)).fetchone()
+                while excess > 0:
+                    batch = conn.execute(
+                        "SELECT key, size FROM graphs ORDER BY accessed LIMIT ?", (_EVICTION_BATCH_SIZE,)
+                    ).fetchall()
+                    evicted = []
+                    for entry_key, size in batch:
+                        if excess <= 0:
+                            break
+                        evicted.append((entry_key,))
+                        excess -= size
+                    conn.executemany("DELETE FROM graphs WHERE key = ?", evicted)
+                    if len(batch) < _EVICTION_BATCH_SIZE:
+                        break
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM graphs")
+
+    def info(self) -> CacheInfo:
+        """
+        Return the number of hits, misses and skipped graphs, and the number of entries and their total size in bytes.
+        """
+        with closing(self._connect()) as conn:
+            (entries,) = conn.execute("SELECT COUNT(*) FROM graphs").fetchone()
+            (size_bytes,) = conn.execute("SELECT size FROM total").fetchone()
+        return CacheInfo(self.hits, self.misses, self.skipped, entries, size_bytes)
+
+
+def from_neo4j_cached(
+    driver: neo4j.Driver,
+    query: str,
+    cache: QueryCache,
+    parameters: Optional[dict[str, Any]] = None,
+    database: Optional[str] = None,
+    size_property: Optional[str] = None,
+    node_caption: Optional[str] = "labels",
+    relationship_caption: Optional[str] = "type",
+    node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+    max_nodes: Optional[int] = None,
+    node_properties: Optional[list[str]] = None,
+    relationship_properties: Optional[list[str]] = None,
+    properties: bool = True,
+) -> VisualizationGraph:
+    """
+    Create a VisualizationGraph from a query, reusing the graph created by an earlier call with the same arguments.
+
+    The graphs are cached by query text, parameters, database and the further arguments of this function. On a miss,
+    the query is run in a new session and the graph is created like by `from_neo4j` and stored in the cache. On a hit,
+    the database is not queried at all. Changes of the data in the database are only picked up once the entry expires.
+
+    Parameters
+    ----------
+    driver : neo4j.Driver
+        The driver to open the session with.
+    query : str
+        The query to run.
+    cache : QueryCache
+        The cache to look up and store the graph in.
+    parameters : dict[str, Any], optional
+        The parameters of the query.
+    database : str, optional
+        The database to run the query against, by default the default database of the server.
+    size_property : str, optional
+        Property to use for node size, by default None.
+    node_caption : str, optional
+        Property to use as the node caption, by default the node labels will be used.
+    relationship_caption : str, optional
+        Property to use as the relationship caption, by default the relationship type will be used.
+    node_radius_min_max : tuple[float, float], optional
+        Minimum and maximum node radius, by default (3, 60).
+        To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    max_nodes : int, optional
+        If given, at most this many nodes are included, in order of appearance.
+    node_properties : list[str], optional
+        If given, only these node properties are included in the `properties` of the nodes, by default all of them.
+    relationship_properties : list[str], optional
+        If given, only these relationship properties are included in the `properties` of the relationships, by
+        default all of them.
+    properties : bool, optional
+        Whether to include properties, by default True.
+    """
+
+    key = cache.key(
+        query,
+        parameters,
+        database,
+        size_property=size_property,
+        node_caption=node_caption,
+        relationship_caption=relationship_caption,
+        node_radius_min_max=node_radius_min_max,
+        max_nodes=max_nodes,
+        node_properties=node_properties,
+        relationship_properties=relationship_properties,
+        properties=properties,
+    )
+    VG = cache.get(key)
+    if VG is not None:
+        return VG
+
+    with driver.session(database=database) as session:
+        VG = from_neo4j(
+            session.run(query, parameters),
+            size_property,
+            node_caption,
+            relationship_caption,
+            node_radius_min_max,
+            max_nodes,
+            node_properties,
+            relationship_properties,
+            properties,
+        )
+    cache.put(key, VG)
+    return VG
+
+
+def _build_graph(
+    graph_nodes: Iterable[neo4j.graph.Node],
+    graph_relationships: Iterable[neo4j.graph.Relationship],
+    size_property: Optional[str],
+    node_caption: Optional[str],
+    relationship_caption: Optional[str],
+    node_radius_min_max: Optional[tuple[float, float]],
+    node_properties: Optional[Collection[str]] = None,
+    relationship_properties: Optional[Collection[str]] = None,
+    properties: bool = True,
+) -> VisualizationGraph:
     all_node_field_aliases = Node.all_validation_aliases()
     all_rel_field_aliases = Relationship.all_validation_aliases()
 
+    node_property_keys = _property_keys(node_properties, properties)
+    rel_property_keys = _property_keys(relationship_properties, properties)
+
     try:
-        nodes = [
-            _map_node(node, all_node_field_aliases, size_property, caption_property=node_caption)
-            for node in graph.nodes
+        node_records = [
+            _map_node(
+                node,
+                all_node_field_aliases,
+                size_property,
+                caption_property=node_caption,
+                property_keys=node_property_keys,
+                add_labels=properties,
+            )
+            for node in graph_nodes
         ]
+        nodes = validate_entities(Node, node_records, lambda e, _: _parse_validation_error(e, Node))
     except ValueError as e:
         err_msg = str(e)
         if ("'size'" in err_msg) and (size_property is not None):
@@ -72,12 +739,21 @@ def from_neo4j(
             err_msg = err_msg.replace("'caption'", f"'{node_caption}'")
         raise ValueError(err_msg)
 
-    relationships = []
+    rel_records = []
     try:
-        for rel in graph.relationships:
-            mapped_rel = _map_relationship(rel, all_rel_field_aliases, caption_property=relationship_caption)
+        for rel in graph_relationships:
+            mapped_rel = _map_relationship(
+                rel,
+                all_rel_field_aliases,
+                caption_property=relationship_caption,
+                property_keys=rel_property_keys,
+                add_type=properties,
+            )
             if mapped_rel:
-                relationships.append(mapped_rel)
+                rel_records.append(mapped_rel)
+        relationships = validate_entities(
+            Relationship, rel_records, lambda e, _: _parse_validation_error(e, Relationship)
+        )
     except ValueError as e:
         err_msg = str(e)
         if ("'caption'" in err_msg) and (relationship_caption is not None):
@@ -92,13 +768,31 @@ def from_neo4j(
     return VG
 
 
+def _property_keys(selected: Optional[Collection[str]], include_properties: bool) -> Optional[frozenset[str]]:
+    # The keys of the properties to include, or None for all of them
+    if not include_properties:
+        return frozenset()
+    return frozenset(selected) if selected is not None else None
+
+
+def _selected_items(
+    entity: neo4j.graph.Entity, field_aliases: set[str], property_keys: Optional[frozenset[str]]
+) -> Iterable[tuple[str, Any]]:
+    if property_keys is None:
+        return entity.items()
+    # Only the values of the selected properties, and of the properties named like fields, are read
+    return [(key, entity[key]) for key in entity.keys() if key in property_keys or key in field_aliases]
+
+
 def _map_node(
     node: neo4j.graph.Node,
     all_node_field_aliases: set[str],
     size_property: Optional[str],
     caption_property: Optional[str],
-) -> Node:
-    top_level_fields = {"id": node.element_id}
+    property_keys: Optional[frozenset[str]] = None,
+    add_labels: bool = True,
+) -> dict[str, Any]:
+    top_level_fields: dict[str, Any] = {"id": node.element_id}
 
     if size_property:
         top_level_fields["size"] = node.get(size_property)
@@ -112,36 +806,38 @@ def _map_node(
             top_level_fields["caption"] = str(node.get(caption_property))
 
     properties = {}
-    for prop, value in node.items():
-        if prop not in all_node_field_aliases:
-            properties[prop] = value
-            continue
-
-        if prop in top_level_fields:
-            properties[prop] = value
+    for prop, value in _selected_items(node, all_node_field_aliases, property_keys):
+        if prop not in all_node_field_aliases or prop in top_level_fields:
+            if property_keys is None or prop in property_keys:
+                properties[prop] = value
             continue
 
         top_level_fields[prop] = value
 
-    if "labels" in properties:
-        properties["__labels"] = properties["labels"]
-    properties["labels"] = labels
-
-    try:
-        viz_node = Node(**top_level_fields, properties=properties)
-    except ValidationError as e:
-        _parse_validation_error(e, Node)
+    if add_labels:
+        if "labels" in properties:
+            properties["__labels"] = properties["labels"]
+        properties["labels"] = labels
+    top_level_fields["properties"] = properties
 
-    return viz_node
+    return top_level_fields
 
 
 def _map_relationship(
-    rel: neo4j.graph.Relationship, all_rel_field_aliases: set[str], caption_property: Optional[str]
-) -> Optional[Relationship]:
+    rel: neo4j.graph.Relationship,
+    all_rel_field_aliases: set[str],
+    caption_property: Optional[str],
+    property_keys: Optional[frozenset[str]] = None,
+    add_type: bool = True,
+) -> Optional[dict[str, Any]]:
     if rel.start_node is None or rel.end_node is None:
         return None
 
-    top_level_fields = {"id": rel.element_id, "source": rel.start_node.element_id, "target": rel.end_node.element_id}
+    top_level_fields: dict[str, Any] = {
+        "id": rel.element_id,
+        "source": rel.start_node.element_id,
+        "target": rel.end_node.element_id,
+    }
 
     if caption_property:
         if caption_property == "type":
@@ -150,24 +846,52 @@ def _map_relationship(
             top_level_fields["caption"] = str(rel.get(caption_property))
 
     properties = {}
-    for prop, value in rel.items():
-        if prop not in all_rel_field_aliases:
-            properties[prop] = value
-            continue
-
-        if prop in top_level_fields:
-            properties[prop] = value
+    for prop, value in _selected_items(rel, all_rel_field_aliases, property_keys):
+        if prop not in all_rel_field_aliases or prop in top_level_fields:
+            if property_keys is None or prop in property_keys:
+                properties[prop] = value
             continue
 
         top_level_fields[prop] = value
 
-    if "type" in properties:
-        properties["__type"] = properties["type"]
-    properties["type"] = rel.type
+    if add_type:
+        if "type" in properties:
+            properties["__type"] = properties["type"]
+        properties["type"] = rel.type
+    top_level_fields["properties"] = properties
 
-    try:
-        viz_rel = Relationship(**top_level_fields, properties=properties)
-    except ValidationError as e:
-        _parse_validation_error(e, Relationship)
+    return top_level_fields
+
+
+def _fetch_neighbors(
+    driver: neo4j.Driver,
+    node_ids: list[str],
+    known_relationship_ids: list[str],
+    known_node_ids: list[str],
+    limit: Optional[int],
+    database: Optional[str],
+    size_property: Optional[str],
+    node_caption: Optional[str],
+    relationship_caption: Optional[str],
+) -> VisualizationGraph:
+    # The relationships of the given nodes that are not known yet, with their other nodes, for `VisualizationGraph.expand`
+    query = _EXPAND_QUERY if limit is None else f"{_EXPAND_QUERY} LIMIT $limit"
+    parameters = {
+        "node_ids": node_ids,
+        "known_relationship_ids": known_relationship_ids,
+        "known_node_ids": known_node_ids,
+        "limit": limit,
+    }
+    with driver.session(database=database) as session:
+        fetched = from_neo4j(
+            session.run(query, parameters),
+            size_property,
+            node_caption,
+            relationship_caption,
+            node_radius_min_max=None,
+        )
 
-    return viz_rel
+    # The known nodes only arrive as endpoints, without labels and properties, so they must not replace the known ones
+    known = set(known_node_ids)
+    nodes = [node for node in fetched._node_entities() if node.id not in known]
+    return VisualizationGraph._from_records(nodes, fetched._relationship_entities())
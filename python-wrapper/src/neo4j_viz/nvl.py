@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import uuid
+import warnings
+from collections.abc import Sequence
 from importlib.resources import files
-from typing import Union
+from typing import Any, Optional, Union
 
 from IPython.display import HTML
 
+from ._encoders import MAX_ARRAY_VALUES, encode_properties
+from ._records import NodeLike, RelationshipLike
 from .node import Node
-from .options import RenderOptions
+from .options import Renderer, RenderOptions
 from .relationship import Relationship
 
 
 class NVL:
+    LAYOUT_WORKERS = ["CoseBilkentLayout", "HierarchicalLayout"]
+
     def __init__(self) -> None:
         # at which point we get None?
         base_folder = files("neo4j_viz")
@@ -41,42 +48,173 @@ class NVL:
         with screenshot_path.open("r", encoding="utf-8") as file:
             self.screenshot_svg = file.read()
 
+    @classmethod
+    def _worker_scripts(cls) -> dict[str, str]:
+        # The layout workers are inlined so that they can be started from blob URLs, also in sandboxed iframes.
+        # They are chunks of the JS build, and workers that are not bundled are skipped.
+        nvl_entry_point = files("neo4j_viz") / "resources" / "nvl_entrypoint"
+        scripts = {}
+        for worker_name in cls.LAYOUT_WORKERS:
+            worker_path = nvl_entry_point / f"{worker_name}.js"
+            if not worker_path.is_file():
+                continue
+            with worker_path.open("r", encoding="utf-8") as file:
+                scripts[worker_name] = file.read()
+
+        return scripts
+
+    @classmethod
+    def layout_workers(cls, render_options: RenderOptions) -> tuple[RenderOptions, dict[str, str]]:
+        # The sources of the layout workers, if they are enabled. Without bundled workers, they are disabled instead.
+        if render_options.disable_web_workers is not False:
+            return render_options, {}
+
+        worker_scripts = cls._worker_scripts()
+        if not worker_scripts:
+            warnings.warn(
+                "The layout web workers are not bundled with this installation of neo4j-viz, so the layout is "
+                "computed on the main thread instead"
+            )
+            render_options = render_options.model_copy(update={"disable_web_workers": True})
+        return render_options, worker_scripts
+
     @staticmethod
-    def _serialize_entity(entity: Union[Node, Relationship]) -> str:
+    def _serialize_entity(
+        entity: Union[NodeLike, RelationshipLike], interned_ids: dict[str, int], exclude: frozenset[str] = frozenset()
+    ) -> str:
+        # Properties are only used for tooltips, so they are kept out of the NVL elements and serialized separately
+        if isinstance(entity, (Node, Relationship)):
+            entity_dict = entity.model_dump(
+                exclude={"properties", "id", "source", "target", *exclude}, exclude_none=True, by_alias=True
+            )
+        else:
+            entity_dict = entity.payload(exclude)
         try:
-            entity_dict = entity.to_dict()
-            return json.dumps(entity_dict)
-        except TypeError:
-            props_as_strings = {}
-            for k, v in entity_dict["properties"].items():
-                try:
-                    json.dumps(v)
-                except TypeError:
-                    props_as_strings[k] = str(v)
-            entity_dict["properties"].update(props_as_strings)
-
-            try:
-                return json.dumps(entity_dict)
-            except TypeError as e:
-                # This should never happen anymore, but just in case
-                if "not JSON serializable" in str(e):
-                    raise ValueError(f"A field of a {type(entity).__name__} object is not supported: {str(e)}")
-                else:
-                    raise e
+            return json.dumps({**interned_ids, **entity_dict})
+        except TypeError as e:
+            # This should never happen, but just in case
+            if "not JSON serializable" in str(e):
+                raise ValueError(f"A field of a {type(entity).__name__} object is not supported: {str(e)}")
+            else:
+                raise e
+
+    @staticmethod
+    def _serialize_properties(properties: dict[str, Any], max_array_values: Optional[int] = MAX_ARRAY_VALUES) -> str:
+        # Values that JSON does not support, like NumPy arrays or timestamps, are encoded by an encoder for their type.
+        # Nested values, in lists and dictionaries, are encoded by the same encoders.
+        return json.dumps(encode_properties(properties, max_array_values))
+
+    @staticmethod
+    def _intern_ids(
+        nodes: Sequence[NodeLike], relationships: Sequence[RelationshipLike]
+    ) -> tuple[list[int], list[tuple[int, int, int]], list[Union[str, int]]]:
+        # Node IDs are matched as strings, like NVL does, and mapped to dense integers in order of appearance.
+        # Relationships are numbered after all nodes, so that every element has its own index into the side tables.
+        node_index: dict[str, int] = {}
+        original_ids: list[Union[str, int]] = []
+
+        def intern(id: Union[str, int]) -> int:
+            key = str(id)
+            dense_id = node_index.get(key)
+            if dense_id is None:
+                dense_id = node_index[key] = len(original_ids)
+                original_ids.append(id)
+            return dense_id
+
+        node_ids = [intern(node.id) for node in nodes]
+        endpoints = [(intern(rel.source), intern(rel.target)) for rel in relationships]
+
+        first_rel_id = len(original_ids)
+        rel_ids = [(first_rel_id + i, source, target) for i, (source, target) in enumerate(endpoints)]
+        original_ids.extend(rel.id for rel in relationships)
+
+        return node_ids, rel_ids, original_ids
+
+    @staticmethod
+    def _unsupported_fields(
+        entity_type: Union[type[Node], type[Relationship]], renderer: Optional[Renderer]
+    ) -> frozenset[str]:
+        if renderer is None:
+            return frozenset()
+
+        unsupported = renderer.unsupported_fields("node" if entity_type is Node else "relationship")
+        return frozenset(
+            name for name, field in entity_type.model_fields.items() if field.serialization_alias in unsupported
+        )
+
+    @classmethod
+    def serialize_graph(
+        cls,
+        nodes: Sequence[NodeLike],
+        relationships: Sequence[RelationshipLike],
+        renderer: Optional[Renderer],
+        include_properties: bool,
+        max_array_values: Optional[int] = MAX_ARRAY_VALUES,
+    ) -> tuple[str, str, str]:
+        # The payload of the NVL entrypoint: the nodes, the relationships and the side tables of element data
+        node_ids, rel_ids, original_ids = cls._intern_ids(nodes, relationships)
+
+        # Fields that the renderer does not draw are not sent at all
+        node_exclude = cls._unsupported_fields(Node, renderer)
+        rel_exclude = cls._unsupported_fields(Relationship, renderer)
+
+        serialized_nodes = [cls._serialize_entity(node, {"id": id}, node_exclude) for node, id in zip(nodes, node_ids)]
+        serialized_rels = [
+            cls._serialize_entity(rel, {"id": id, "from": source, "to": target}, rel_exclude)
+            for rel, (id, source, target) in zip(relationships, rel_ids)
+        ]
+        nodes_json = f"[{','.join(serialized_nodes)}]"
+        rels_json = f"[{','.join(serialized_rels)}]"
+
+        # The original IDs and the properties are indexed by the interned IDs
+        element_data: dict[str, str] = {"ids": json.dumps(original_ids)}
+        if include_properties:
+            properties_json = ["null"] * len(original_ids)
+            for node, id in zip(nodes, node_ids):
+                if node.properties:
+                    properties_json[id] = cls._serialize_properties(node.properties, max_array_values)
+            for rel, (id, _, _) in zip(relationships, rel_ids):
+                if rel.properties:
+                    properties_json[id] = cls._serialize_properties(rel.properties, max_array_values)
+            element_data["properties"] = f"[{','.join(properties_json)}]"
+        element_data_json = f"{{{','.join([f'{json.dumps(key)}:{value}' for key, value in element_data.items()])}}}"
+
+        return nodes_json, rels_json, element_data_json
+
+    @staticmethod
+    def fingerprint(*payload: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for part in payload:
+            digest.update(part.encode("utf-8"))
+            # Separate the parts, so that moving text from one part to the next changes the digest
+            digest.update(b"\0")
+        return digest.hexdigest()
 
     def render(
         self,
-        nodes: list[Node],
-        relationships: list[Relationship],
+        nodes: Sequence[NodeLike],
+        relationships: Sequence[RelationshipLike],
         render_options: RenderOptions,
         width: str,
         height: str,
         show_hover_tooltip: bool,
+        progressive_chunk_size: Optional[int] = None,
+        max_array_values: Optional[int] = MAX_ARRAY_VALUES,
     ) -> HTML:
-        nodes_json = f"[{','.join([self._serialize_entity(node) for node in nodes])}]"
-        rels_json = f"[{','.join([self._serialize_entity(rel) for rel in relationships])}]"
+        nodes_json, rels_json, element_data_json = self.serialize_graph(
+            nodes, relationships, render_options.renderer, show_hover_tooltip, max_array_values
+        )
+
+        py_options: dict[str, Any] = {}
+        render_options, worker_scripts = self.layout_workers(render_options)
+        if worker_scripts:
+            py_options["workerScripts"] = worker_scripts
+        if progressive_chunk_size is not None:
+            py_options["progressiveChunkSize"] = progressive_chunk_size
 
         render_options_json = json.dumps(render_options.to_dict())
+        # Escape closing tags, since the worker sources end up inside a <script> element
+        py_options_json = json.dumps(py_options).replace("</", "<\\/")
         container_id = str(uuid.uuid4())
 
         if show_hover_tooltip:
@@ -98,7 +236,10 @@ class NVL:
             {hover_element},
             {nodes_json},
             {rels_json},
+            {element_data_json},
             {render_options_json},
+            {{}},
+            {py_options_json},
         );
         """
         full_code = self.library_code + js_code
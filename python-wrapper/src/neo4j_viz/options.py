@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import json
 import warnings
 from enum import Enum
-from typing import Any, Optional
+from functools import lru_cache
+from importlib.resources import files
+from typing import Any, Literal, Optional
 
 import enum_tools.documentation
 from pydantic import BaseModel, Field
@@ -50,6 +53,12 @@ class Renderer(str, Enum):
     However, it can render text, icons, and arrowheads on relationships.
     """
 
+    def unsupported_fields(self, entity_type: Literal["node", "relationship"]) -> frozenset[str]:
+        """
+        The fields of nodes or relationships, by their serialized names, that this renderer does not draw.
+        """
+        return frozenset(_renderer_fields()[self.value]["unsupportedFields"][entity_type])
+
     @classmethod
     def check(self, renderer: Renderer, num_nodes: int) -> None:
         if renderer == Renderer.CANVAS and num_nodes > 10_000:
@@ -66,6 +75,16 @@ class Renderer(str, Enum):
             )
 
 
+@lru_cache(maxsize=None)
+def _renderer_fields() -> dict[str, Any]:
+    # The field support of each renderer, shared with the JS applet
+    fields_path = files("neo4j_viz") / "resources" / "renderer_fields.json"
+    with fields_path.open("r", encoding="utf-8") as file:
+        renderer_fields: dict[str, Any] = json.load(file)
+
+    return renderer_fields
+
+
 class RenderOptions(BaseModel, extra="allow"):
     """
     Options as documented at https://neo4j.com/docs/nvl/current/base-library/#_options
@@ -83,6 +102,11 @@ class RenderOptions(BaseModel, extra="allow"):
     )
     min_zoom: Optional[float] = Field(None, serialization_alias="minZoom", description="The minimum zoom level allowed")
     allow_dynamic_min_zoom: Optional[bool] = Field(None, serialization_alias="allowDynamicMinZoom")
+    disable_web_workers: Optional[bool] = Field(
+        None,
+        serialization_alias="disableWebWorkers",
+        description="Whether to run the layout on the main thread instead of in web workers",
+    )
 
     def to_dict(self) -> dict[str, Any]:
         return self.model_dump(exclude_none=True, by_alias=True)
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from typing import Optional, Union
+import math
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional, Union
 
-from pandas import DataFrame
-from pydantic import BaseModel, ValidationError
+import numpy as np
+from pandas import DataFrame, Series
 
+from ._columnar import EntityType, build_graph, convert_columns, field_name
+from ._records import NodeLike, RelationshipLike, dump_value
 from .node import Node
 from .relationship import Relationship
 from .visualization_graph import VisualizationGraph
@@ -13,17 +20,173 @@ from .visualization_graph import VisualizationGraph
 DFS_TYPE = Union[DataFrame, Iterable[DataFrame]]
 
 
-def _parse_validation_error(e: ValidationError, entity_type: type[BaseModel]) -> None:
-    for err in e.errors():
-        loc = err["loc"][0]
-        if err["type"] == "missing":
-            raise ValueError(
-                f"Mandatory {entity_type.__name__.lower()} column '{loc}' is missing. Expected one of {entity_type.model_fields[loc].validation_alias.choices} to be present"  # type: ignore
+def _iter_dfs(dfs: Optional[DFS_TYPE]) -> Iterator[DataFrame]:
+    # The DataFrames are consumed lazily, so that iterators such as `pd.read_csv(..., chunksize=...)` are never
+    # fully materialized
+    if dfs is None:
+        return
+    yield from [dfs] if isinstance(dfs, DataFrame) else dfs
+
+
+def _row_ranges(num_rows: int, range_size: Optional[int]) -> list[tuple[int, int]]:
+    if range_size is None or num_rows <= range_size:
+        return [(0, num_rows)]
+    return [(start, min(start + range_size, num_rows)) for start in range(0, num_rows, range_size)]
+
+
+def _share_numeric_columns(df: DataFrame) -> tuple[Optional[SharedMemory], dict[int, tuple[str, int]]]:
+    # Numeric columns are copied once into shared memory, from which the worker processes read their row ranges
+    # without the data being pickled. Returns the dtype and byte offset of every shared column, by column position.
+    arrays = {}
+    layout = {}
+    size = 0
+    for position in range(df.shape[1]):
+        column = df.iloc[:, position]
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+            array = column.to_numpy()
+            arrays[position] = array
+            layout[position] = (array.dtype.str, size)
+            # Keep every column 8 byte aligned
+            size += math.ceil(array.nbytes / 8) * 8
+
+    if size == 0:
+        return None, {}
+
+    shm = SharedMemory(create=True, size=size)
+    for position, array in arrays.items():
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf, offset=layout[position][1])[:] = array
+
+    return shm, layout
+
+
+def _convert_shared_rows(
+    keys: list[str],
+    shm_name: Optional[str],
+    shared_columns: dict[int, tuple[str, int]],
+    other_columns: dict[int, Series],
+    num_rows: int,
+    start: int,
+    stop: int,
+    entity_type: type[EntityType],
+    df_index: int,
+) -> list[list[Any]]:
+    # Runs in a worker process. Validates the top level columns of a range of rows and returns the validated values as
+    # plain column lists, which are far cheaper to send back to the parent process than the entities themselves.
+    columns = []
+    shm = SharedMemory(name=shm_name) if shm_name is not None else None
+    try:
+        for position in range(len(keys)):
+            if shm is not None and position in shared_columns:
+                dtype, offset = shared_columns[position]
+                shared = np.ndarray((num_rows,), dtype=dtype, buffer=shm.buf, offset=offset)
+                columns.append(shared[start:stop].tolist())
+                # All views must be gone before the shared memory can be closed
+                del shared
+            else:
+                columns.append(other_columns[position].tolist())
+    finally:
+        if shm is not None:
+            shm.close()
+
+    entities = convert_columns(keys, columns, entity_type, None, f"DataFrame {df_index}", start)
+    field_names = [field_name(entity_type, key) for key in keys]
+    return [[dump_value(name, getattr(entity, name)) for entity in entities] for name in field_names]
+
+
+def _convert_df(
+    df: DataFrame,
+    entity_type: type[EntityType],
+    rename_properties: Optional[dict[str, str]],
+    df_index: int,
+    chunk_size: Optional[int],
+    executor: Optional[Executor],
+    workers: int,
+    validate: bool,
+) -> list[Any]:
+    keys = [str(key) for key in df.columns]
+
+    # Without validation there is nothing worth the overhead of handing rows to worker processes
+    if executor is None or not validate:
+        entities = []
+        # Only one chunk of rows at a time is held as intermediate Python objects
+        for start, stop in _row_ranges(len(df), chunk_size):
+            chunk = df.iloc[start:stop]
+            # Converting whole columns at once is much cheaper than `iterrows`, and keeps the dtype of every column
+            columns = [chunk.iloc[:, i].tolist() for i in range(len(keys))]
+            entities.extend(
+                convert_columns(keys, columns, entity_type, rename_properties, f"DataFrame {df_index}", start, validate)
+            )
+        return entities
+
+    # The workers validate the top level columns, and the parent builds records from the validated values and the
+    # properties, which need no validation and so are never sent to the workers
+    field_aliases = entity_type.all_validation_aliases()
+    top_level = [position for position, key in enumerate(keys) if key in field_aliases]
+    top_level_keys = [keys[position] for position in top_level]
+    top_level_df = df.iloc[:, top_level]
+    property_positions = [position for position, key in enumerate(keys) if key not in field_aliases]
+    record_keys = [field_name(entity_type, key) for key in top_level_keys] + [keys[p] for p in property_positions]
+
+    range_size = chunk_size if chunk_size is not None else max(1, math.ceil(len(df) / workers))
+
+    shm, shared_columns = _share_numeric_columns(top_level_df)
+    pending: deque[tuple[int, int, Future[list[list[Any]]]]] = deque()
+    try:
+        entities = []
+        for start, stop in _row_ranges(len(df), range_size):
+            future = executor.submit(
+                _convert_shared_rows,
+                top_level_keys,
+                shm.name if shm is not None else None,
+                shared_columns,
+                {
+                    position: top_level_df.iloc[start:stop, position]
+                    for position in range(len(top_level_keys))
+                    if position not in shared_columns
+                },
+                len(df),
+                start,
+                stop,
+                entity_type,
+                df_index,
             )
-        else:
-            raise ValueError(
-                f"Error for {entity_type.__name__.lower()} column '{loc}' with provided input '{err['input']}'. Reason: {err['msg']}"
+            pending.append((start, stop, future))
+            # Only a bounded number of row ranges, with their copies of non-numeric columns, are in flight at a time
+            if len(pending) >= 2 * workers:
+                entities.extend(
+                    _collect_rows(
+                        df, property_positions, record_keys, entity_type, rename_properties, *pending.popleft()
+                    )
+                )
+
+        # Merging in submission order keeps the result, and the first reported error, independent of scheduling
+        while pending:
+            entities.extend(
+                _collect_rows(df, property_positions, record_keys, entity_type, rename_properties, *pending.popleft())
             )
+        return entities
+    finally:
+        # Pending conversions are cancelled, while workers that already attached keep their mapping until closed
+        for _, _, future in pending:
+            future.cancel()
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+
+def _collect_rows(
+    df: DataFrame,
+    property_positions: list[int],
+    record_keys: list[str],
+    entity_type: type[EntityType],
+    rename_properties: Optional[dict[str, str]],
+    start: int,
+    stop: int,
+    future: Future[list[list[Any]]],
+) -> list[Any]:
+    # Joins the validated top level values of a row range with its properties into records
+    columns = future.result() + [df.iloc[start:stop, position].tolist() for position in property_positions]
+    return convert_columns(record_keys, columns, entity_type, rename_properties, "", start, validate=False)
 
 
 def _from_dfs(
@@ -31,85 +194,70 @@ def _from_dfs(
     rel_dfs: DFS_TYPE,
     node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
     rename_properties: Optional[dict[str, str]] = None,
+    chunk_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    validate: bool = True,
 ) -> VisualizationGraph:
-    relationships = _parse_relationships(rel_dfs, rename_properties=rename_properties)
-
-    if node_dfs is None:
-        has_size = False
-        node_ids = set()
-        for rel in relationships:
-            node_ids.add(rel.source)
-            node_ids.add(rel.target)
-        nodes = [Node(id=id) for id in node_ids]
-    else:
-        nodes, has_size = _parse_nodes(node_dfs, rename_properties=rename_properties)
-
-    VG = VisualizationGraph(nodes=nodes, relationships=relationships)
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"`chunk_size` must be a positive integer, but was {chunk_size}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"`workers` must be a positive integer, but was {workers}")
 
-    if node_radius_min_max is not None and has_size:
-        VG.resize_nodes(node_radius_min_max=node_radius_min_max)
-
-    return VG
+    with ProcessPoolExecutor(max_workers=workers) if workers is not None and workers > 1 else nullcontext() as executor:
+        relationships = _parse_relationships(
+            rel_dfs,
+            rename_properties=rename_properties,
+            chunk_size=chunk_size,
+            executor=executor,
+            workers=workers or 1,
+            validate=validate,
+        )
 
+        nodes: Optional[list[NodeLike]] = None
+        has_size = False
+        if node_dfs is not None:
+            nodes, has_size = _parse_nodes(
+                node_dfs,
+                rename_properties=rename_properties,
+                chunk_size=chunk_size,
+                executor=executor,
+                workers=workers or 1,
+                validate=validate,
+            )
 
-def _parse_nodes(node_dfs: DFS_TYPE, rename_properties: Optional[dict[str, str]]) -> tuple[list[Node], bool]:
-    if isinstance(node_dfs, DataFrame):
-        node_dfs_iter: Iterable[DataFrame] = [node_dfs]
-    elif node_dfs is None:
-        node_dfs_iter = []
-    else:
-        node_dfs_iter = node_dfs
+    return build_graph(nodes, relationships, has_size, node_radius_min_max)
 
-    all_node_field_aliases = Node.all_validation_aliases()
 
+def _parse_nodes(
+    node_dfs: Optional[DFS_TYPE],
+    rename_properties: Optional[dict[str, str]],
+    chunk_size: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    workers: int = 1,
+    validate: bool = True,
+) -> tuple[list[NodeLike], bool]:
     has_size = True
     nodes = []
-    for node_df in node_dfs_iter:
+    for df_index, node_df in enumerate(_iter_dfs(node_dfs)):
         has_size &= "size" in node_df.columns
-        for _, row in node_df.iterrows():
-            top_level = {}
-            properties = {}
-            for key, value in row.to_dict().items():
-                if key in all_node_field_aliases:
-                    top_level[key] = value
-                else:
-                    if rename_properties and key in rename_properties:
-                        key = rename_properties[key]
-                    properties[key] = value
-
-            try:
-                nodes.append(Node(**top_level, properties=properties))
-            except ValidationError as e:
-                _parse_validation_error(e, Node)
+        nodes.extend(_convert_df(node_df, Node, rename_properties, df_index, chunk_size, executor, workers, validate))
 
     return nodes, has_size
 
 
-def _parse_relationships(rel_dfs: DFS_TYPE, rename_properties: Optional[dict[str, str]]) -> list[Relationship]:
-    all_rel_field_aliases = Relationship.all_validation_aliases()
-
-    if isinstance(rel_dfs, DataFrame):
-        rel_dfs_iter: Iterable[DataFrame] = [rel_dfs]
-    else:
-        rel_dfs_iter = rel_dfs
-    relationships: list[Relationship] = []
-
-    for rel_df in rel_dfs_iter:
-        for _, row in rel_df.iterrows():
-            top_level = {}
-            properties = {}
-            for key, value in row.to_dict().items():
-                if key in all_rel_field_aliases:
-                    top_level[key] = value
-                else:
-                    if rename_properties and key in rename_properties:
-                        key = rename_properties[key]
-                    properties[key] = value
-
-            try:
-                relationships.append(Relationship(**top_level, properties=properties))
-            except ValidationError as e:
-                _parse_validation_error(e, Relationship)
+def _parse_relationships(
+    rel_dfs: DFS_TYPE,
+    rename_properties: Optional[dict[str, str]],
+    chunk_size: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    workers: int = 1,
+    validate: bool = True,
+) -> list[RelationshipLike]:
+    relationships: list[RelationshipLike] = []
+    for df_index, rel_df in enumerate(_iter_dfs(rel_dfs)):
+        relationships.extend(
+            _convert_df(rel_df, Relationship, rename_properties, df_index, chunk_size, executor, workers, validate)
+        )
 
     return relationships
 
@@ -118,6 +266,9 @@ def from_dfs(
     node_dfs: Optional[DFS_TYPE],
     rel_dfs: DFS_TYPE,
     node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+    chunk_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    validate: bool = True,
 ) -> VisualizationGraph:
     """
     Create a VisualizationGraph from pandas DataFrames representing a graph.
@@ -136,6 +287,23 @@ def from_dfs(
     node_radius_min_max : tuple[float, float], optional
         Minimum and maximum node radius.
         To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    chunk_size : int, optional
+        If given, DataFrames are converted in chunks of at most this many rows, so that only one chunk of rows at a
+        time is held as intermediate Python objects.
+        Iterables of DataFrames, such as the result of `pd.read_csv(..., chunksize=...)`, are always consumed one
+        DataFrame at a time, which keeps the memory used by ingestion close to the size of the resulting graph.
+    workers : int, optional
+        If larger than 1, the rows of every DataFrame are split into ranges whose columns are validated in parallel by
+        this many worker processes. Only the columns of top level fields are sent to the workers, with numeric columns
+        handed over through shared memory, and only a few ranges are in flight at a time.
+        The ranges have `chunk_size` rows if given, and are otherwise split evenly between the workers.
+        The result is identical to a conversion without workers. Workers are only used with `validate`, and only pay
+        off on machines with several cores.
+    validate : bool, optional
+        Whether to validate the values of the columns, by default True.
+        Without validation, nodes and relationships are constructed several times faster. This is only safe for data
+        already known to be valid, such as typed columns produced by a trusted pipeline: invalid values are not
+        reported, and instead end up in the visualization as they are.
     """
 
-    return _from_dfs(node_dfs, rel_dfs, node_radius_min_max)
+    return _from_dfs(node_dfs, rel_dfs, node_radius_min_max, chunk_size=chunk_size, workers=workers, validate=validate)
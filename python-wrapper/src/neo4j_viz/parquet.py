@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from os import PathLike
+from typing import Any, Optional, Union
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow.fs import LocalFileSystem
+
+from .arrow import _from_arrow
+from .node import Node
+from .relationship import Relationship
+from .visualization_graph import VisualizationGraph
+
+PATH_TYPE = Union[str, PathLike[str], list[Union[str, PathLike[str]]]]
+# Either a pyarrow compute expression, or filters in the disjunctive normal form of `pyarrow.parquet.read_table`
+FILTER_TYPE = Union[ds.Expression, list[tuple[str, str, Any]], list[list[tuple[str, str, Any]]]]
+
+
+def _scan(
+    paths: PATH_TYPE,
+    entity_type: Union[type[Node], type[Relationship]],
+    properties: Optional[list[str]],
+    filter: Optional[FILTER_TYPE],
+    memory_map: bool,
+) -> Iterator[pa.RecordBatch]:
+    source = [str(path) for path in paths] if isinstance(paths, list) else str(paths)
+    # Memory-mapping avoids copying uncompressed pages, compressed pages have to be decompressed regardless
+    filesystem = LocalFileSystem(use_mmap=True) if memory_map else None
+    dataset = ds.dataset(source, format="parquet", filesystem=filesystem)
+
+    columns = None
+    if properties is not None:
+        # Only the columns of fields and of the selected properties are read from the files
+        field_aliases = entity_type.all_validation_aliases()
+        missing = [prop for prop in properties if prop not in dataset.schema.names]
+        if missing:
+            raise ValueError(
+                f"The {entity_type.__name__.lower()} properties {missing} are not columns of the Parquet data. "
+                f"Available columns are {dataset.schema.names}"
+            )
+        columns = [name for name in dataset.schema.names if name in field_aliases or name in properties]
+
+    if filter is not None and not isinstance(filter, ds.Expression):
+        filter = pq.filters_to_expression(filter)
+
+    # Filters are applied while scanning, so that rows which do not match are never materialized
+    batches: Iterator[pa.RecordBatch] = dataset.to_batches(columns=columns, filter=filter)
+    return batches
+
+
+def from_parquet(
+    node_paths: Optional[PATH_TYPE],
+    rel_paths: PATH_TYPE,
+    node_properties: Optional[list[str]] = None,
+    relationship_properties: Optional[list[str]] = None,
+    node_filter: Optional[FILTER_TYPE] = None,
+    relationship_filter: Optional[FILTER_TYPE] = None,
+    memory_map: bool = False,
+    node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+) -> VisualizationGraph:
+    """
+    Create a VisualizationGraph from Parquet files representing a graph.
+
+    Columns named as the fields of the `Node` or `Relationship` classes, including the column names of GDS exports such
+    as `nodeId`, `sourceNodeId` and `targetNodeId`, are included as top level fields of the respective objects.
+    Other columns are included in the `properties` dictionary.
+    The files are scanned one record batch at a time, so that they are never fully loaded into memory.
+
+    Parameters
+    ----------
+    node_paths: Optional[Union[str, PathLike, list[Union[str, PathLike]]]]
+        Path of a Parquet file or directory of Parquet files, or list of such paths, containing node data.
+        If None, the nodes will be created from the source and target node ids of the relationships.
+    rel_paths: Union[str, PathLike, list[Union[str, PathLike]]]
+        Path of a Parquet file or directory of Parquet files, or list of such paths, containing relationship data.
+    node_properties: list[str], optional
+        The node property columns to include. If given, only these and the columns of node fields are read.
+        By default, all columns are read.
+    relationship_properties: list[str], optional
+        The relationship property columns to include. If given, only these and the columns of relationship fields are
+        read. By default, all columns are read.
+    node_filter: Union[pyarrow.dataset.Expression, list[tuple], list[list[tuple]]], optional
+        A filter on the node rows, applied while scanning the files. Either a `pyarrow.dataset.Expression`, such as
+        `pyarrow.compute.field("subject") == 1`, or filters like those of `pyarrow.parquet.read_table`, such as
+        `[("subject", "==", 1)]`.
+    relationship_filter: Union[pyarrow.dataset.Expression, list[tuple], list[list[tuple]]], optional
+        A filter on the relationship rows, applied while scanning the files.
+    memory_map: bool
+        Whether to memory-map the files instead of reading them into buffers. This is most effective for uncompressed
+        files.
+    node_radius_min_max : tuple[float, float], optional
+        Minimum and maximum node radius.
+        To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    """
+    rel_batches = _scan(rel_paths, Relationship, relationship_properties, relationship_filter, memory_map)
+    node_batches = _scan(node_paths, Node, node_properties, node_filter, memory_map) if node_paths is not None else None
+
+    return _from_arrow(node_batches, rel_batches, node_radius_min_max)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Optional, Union
+
+from polars import DataFrame
+
+from ._columnar import EntityType, build_graph, convert_columns
+from .node import Node
+from .relationship import Relationship
+from .visualization_graph import VisualizationGraph
+
+DFS_TYPE = Union[DataFrame, Iterable[DataFrame]]
+
+# Number of rows that are converted to Python objects at a time
+_SLICE_SIZE = 10_000
+
+
+def _convert_dfs(
+    dfs: DFS_TYPE, entity_type: type[EntityType], rename_properties: Optional[dict[str, str]]
+) -> tuple[list[EntityType], bool]:
+    dfs_iter: Iterable[DataFrame] = [dfs] if isinstance(dfs, DataFrame) else dfs
+
+    has_size = True
+    entities: list[EntityType] = []
+    for df_index, df in enumerate(dfs_iter):
+        keys = df.columns
+        has_size &= "size" in keys
+        # Slices are zero-copy views, so that only one slice at a time is held as Python objects
+        for first_row, df_slice in enumerate(df.iter_slices(n_rows=_SLICE_SIZE)):
+            columns = [series.to_list() for series in df_slice.get_columns()]
+            entities.extend(
+                convert_columns(
+                    keys, columns, entity_type, rename_properties, f"DataFrame {df_index}", first_row * _SLICE_SIZE
+                )
+            )
+
+    return entities, has_size
+
+
+def from_polars(
+    node_dfs: Optional[DFS_TYPE],
+    rel_dfs: DFS_TYPE,
+    node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+) -> VisualizationGraph:
+    """
+    Create a VisualizationGraph from Polars DataFrames representing a graph.
+
+    All columns will be included in the visualization graph.
+    If the columns are named as the fields of the `Node` or `Relationship` classes, they will be included as
+    top level fields of the respective objects. Otherwise, they will be included in the `properties` dictionary.
+    The DataFrames are converted directly, without going through pandas.
+
+    Parameters
+    ----------
+    node_dfs: Optional[Union[polars.DataFrame, Iterable[polars.DataFrame]]]
+        DataFrame or iterable of DataFrames containing node data.
+        If None, the nodes will be created from the source and target node ids in the rel_dfs.
+    rel_dfs: Union[polars.DataFrame, Iterable[polars.DataFrame]]
+        DataFrame or iterable of DataFrames containing relationship data.
+    node_radius_min_max : tuple[float, float], optional
+        Minimum and maximum node radius.
+        To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    """
+    relationships, _ = _convert_dfs(rel_dfs, Relationship, None)
+
+    nodes: Optional[list[Node]] = None
+    has_size = False
+    if node_dfs is not None:
+        nodes, has_size = _convert_dfs(node_dfs, Node, None)
+
+    return build_graph(nodes, relationships, has_size, node_radius_min_max)
@@ -0,0 +1,177 @@
+// Frontend of the Streamlit component in `neo4j_viz.streamlit`.
+//
+// Implements the messaging protocol that Streamlit uses to talk to component iframes, so that the component can be
+// served directly from this folder next to `base.js`, without a build step of its own.
+(() => {
+  const container = document.getElementById('container')
+  const frame = document.getElementById('graph')
+  const tooltip = document.getElementById('tooltip')
+
+  // Options that NVL only reads when it is created. Any change to them requires a new NVL instance.
+  const CONSTRUCTOR_OPTIONS = ['minZoom', 'maxZoom', 'allowDynamicMinZoom', 'disableWebWorkers']
+
+  let graph = null
+  let current = null
+  let workerScripts = null
+  // The fingerprint of the graph that NVL shows, and the last clicked element that is reported to Python
+  let graphFingerprint = null
+  let clicked = null
+  let requestCount = 0
+  let requestedFingerprint = null
+
+  const sendMessage = (type, data = {}) => {
+    window.parent.postMessage({ isStreamlitMessage: true, type, ...data }, '*')
+  }
+
+  const setComponentValue = (value) => {
+    sendMessage('streamlit:setComponentValue', { value, dataType: 'json' })
+  }
+
+  // Python only sends the graph when it has not sent it in this session yet. A frontend that did not receive it, for
+  // example since it was created again, asks for it with a request of its own, so that it is answered exactly once.
+  const requestGraph = (fingerprint) => {
+    if (fingerprint === requestedFingerprint) {
+      return
+    }
+    requestedFingerprint = fingerprint
+    requestCount += 1
+    const id = `${Date.now()}-${Math.random()}-${requestCount}`
+    setComponentValue({ clicked, missingGraph: { id, fingerprint } })
+  }
+
+  // Fetch the sources of the layout workers from the static folder once, so that they can be started from blob URLs
+  const loadWorkerScripts = async () => {
+    if (workerScripts === null) {
+      workerScripts = {}
+      for (const name of ['CoseBilkentLayout', 'HierarchicalLayout']) {
+        try {
+          const response = await fetch(`${name}.js`)
+          if (response.ok) {
+            workerScripts[name] = await response.text()
+          }
+        } catch (e) {
+          // The layout then runs on the main thread
+        }
+      }
+    }
+    return workerScripts
+  }
+
+  const requiresRebuild = (args) => {
+    if (graph === null || current === null) {
+      return true
+    }
+    if (args.structureFingerprint !== current.structureFingerprint || args.showHoverTooltip !== current.showHoverTooltip) {
+      return true
+    }
+    return CONSTRUCTOR_OPTIONS.some((option) => args.options[option] !== current.options[option])
+  }
+
+  const rebuild = async (args) => {
+    if (graph !== null) {
+      graph.nvl.destroy()
+      frame.replaceChildren()
+    }
+
+    const pyOptions = {}
+    if (args.options.disableWebWorkers === false) {
+      pyOptions.workerScripts = await loadWorkerScripts()
+    }
+
+    graphFingerprint = args.graphFingerprint
+    graph = new NVLBase.NVL(
+      frame,
+      args.showHoverTooltip ? tooltip : null,
+      JSON.parse(args.nodes),
+      JSON.parse(args.relationships),
+      JSON.parse(args.elementData),
+      args.options,
+      {},
+      pyOptions
+    )
+  }
+
+  // Apply the changes in the arguments to the existing graph, without restarting the layout
+  const update = (args) => {
+    const options = args.options
+    if (options.renderer !== current.options.renderer && options.renderer !== undefined) {
+      graph.setRenderer(options.renderer)
+    }
+    if (args.graphFingerprint !== graphFingerprint) {
+      graphFingerprint = args.graphFingerprint
+      graph.updateGraph(JSON.parse(args.nodes), JSON.parse(args.relationships), JSON.parse(args.elementData))
+    }
+    if (options.layout !== current.options.layout && options.layout !== undefined) {
+      graph.nvl.setLayout(options.layout)
+    }
+    if (options.initialZoom !== current.options.initialZoom && options.initialZoom !== undefined) {
+      graph.nvl.setZoom(options.initialZoom)
+    }
+    if (
+      (options.panX !== current.options.panX || options.panY !== current.options.panY) &&
+      options.panX !== undefined &&
+      options.panY !== undefined
+    ) {
+      graph.nvl.setPan(options.panX, options.panY)
+    }
+  }
+
+  const render = async (args, theme) => {
+    if (theme !== undefined) {
+      document.documentElement.className = theme.base === 'dark' ? 'dark' : 'light'
+    }
+
+    if (current === null || args.height !== current.height) {
+      container.style.height = `${args.height}px`
+      sendMessage('streamlit:setFrameHeight', { height: args.height })
+    }
+
+    const rebuilding = requiresRebuild(args)
+    if (args.nodes === null && (rebuilding || args.graphFingerprint !== graphFingerprint)) {
+      // The graph is needed, but was not sent. The arguments are applied once it arrives.
+      requestGraph(args.graphFingerprint)
+      return
+    }
+
+    requestedFingerprint = null
+    if (rebuilding) {
+      await rebuild(args)
+    } else {
+      update(args)
+    }
+    current = args
+  }
+
+  // Renders are applied one after the other, since building a graph may have to wait for the worker sources
+  let pending = Promise.resolve()
+
+  window.addEventListener('message', (event) => {
+    if (event.data.type !== 'streamlit:render') {
+      return
+    }
+    const { args, theme } = event.data
+    pending = pending.then(() => render(args, theme)).catch((e) => console.error(e))
+  })
+
+  // Report the clicked node or relationship back to Python, by its original ID
+  frame.addEventListener('click', (event) => {
+    if (graph === null) {
+      return
+    }
+    const { nodes, relationships } = graph.nvl.getHits(event, ['node', 'relationship']).nvlTargets
+    if (nodes.length > 0) {
+      clicked = { type: 'node', id: graph.originalId(nodes[0].data.id) }
+    } else if (relationships.length > 0) {
+      clicked = { type: 'relationship', id: graph.originalId(relationships[0].data.id) }
+    } else {
+      clicked = null
+    }
+    setComponentValue({ clicked })
+  })
+
+  document.getElementById('screenshot').addEventListener('click', () => graph?.nvl.saveToFile({ filename: 'graph.png' }))
+  document.getElementById('zoom-in').addEventListener('click', () => graph?.nvl.setZoom(graph.nvl.getScale() + 0.5))
+  document.getElementById('zoom-out').addEventListener('click', () => graph?.nvl.setZoom(graph.nvl.getScale() - 0.5))
+
+  sendMessage('streamlit:componentReady', { apiVersion: 1 })
+})()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from ._columnar import EntityType, build_graph, convert_columns
+from .node import Node
+from .relationship import Relationship
+from .visualization_graph import VisualizationGraph
+
+
+def _fetch_entities(
+    connection: Any, query: str, entity_type: type[EntityType], batch_size: int
+) -> tuple[list[EntityType], bool]:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query)
+        # Statements that do not return rows, like updates, have no description
+        if cursor.description is None:
+            raise ValueError(f"The query '{query}' returned no rows or columns")
+        keys = [str(column[0]) for column in cursor.description]
+
+        entities: list[EntityType] = []
+        first_row = 0
+        # Only one batch of rows at a time is fetched from the database and held as intermediate Python objects
+        while rows := cursor.fetchmany(batch_size):
+            columns = list(zip(*rows))
+            entities.extend(convert_columns(keys, columns, entity_type, None, "query result", first_row))
+            first_row += len(rows)
+    finally:
+        cursor.close()
+
+    return entities, "size" in keys
+
+
+def from_sql(
+    connection: Any,
+    node_query: Optional[str],
+    rel_query: str,
+    batch_size: int = 10_000,
+    node_radius_min_max: Optional[tuple[float, float]] = (3, 60),
+) -> VisualizationGraph:
+    """
+    Create a VisualizationGraph from the results of SQL queries, using any DB-API 2.0 (PEP 249) connection.
+
+    All columns of the query results will be included in the visualization graph.
+    If the columns are named as the fields of the `Node` or `Relationship` classes, they will be included as
+    top level fields of the respective objects. Otherwise, they will be included in the `properties` dictionary.
+    The results are streamed in batches, so that they are never held in memory as a whole, for example as a DataFrame.
+
+    Parameters
+    ----------
+    connection:
+        An open DB-API 2.0 connection, for example from `sqlite3`, `psycopg` or the Snowflake connector.
+    node_query: Optional[str]
+        A query returning one row per node.
+        If None, the nodes will be created from the source and target node ids of the relationships.
+    rel_query: str
+        A query returning one row per relationship.
+    batch_size: int
+        The number of rows to fetch from the database at a time.
+    node_radius_min_max : tuple[float, float], optional
+        Minimum and maximum node radius.
+        To avoid tiny or huge nodes in the visualization, the node sizes are scaled to fit in the given range.
+    """
+    if batch_size < 1:
+        raise ValueError(f"`batch_size` must be a positive integer, but was {batch_size}")
+
+    relationships, _ = _fetch_entities(connection, rel_query, Relationship, batch_size)
+
+    nodes: Optional[list[Node]] = None
+    has_size = False
+    if node_query is not None:
+        nodes, has_size = _fetch_entities(connection, node_query, Node, batch_size)
+
+    return build_graph(nodes, relationships, has_size, node_radius_min_max)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+from importlib.resources import files
+from typing import Any, Optional
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from ._encoders import MAX_ARRAY_VALUES
+from .nvl import NVL
+from .options import Layout, Renderer
+from .visualization_graph import VisualizationGraph
+
+# The library and the component frontend are served once by Streamlit as static files from this folder
+_component_func = components.declare_component(
+    "neo4j_viz", path=str(files("neo4j_viz") / "resources" / "nvl_entrypoint")
+)
+
+# The fingerprints of the graphs that were sent to the browser in the current session, oldest first, and the requests of
+# the frontend for graphs that it did not receive, which are kept in the session state
+_SENT_GRAPHS_KEY = "_neo4j_viz_sent_graphs"
+_HANDLED_REQUESTS_KEY = "_neo4j_viz_handled_requests"
+# The number of fingerprints that are remembered, older graphs are sent again
+_MAX_SENT_GRAPHS = 16
+
+
+def _structure_fingerprint(VG: VisualizationGraph) -> str:
+    # Changes only when elements are added or removed, or relationships are rewired
+    node_ids = json.dumps([str(node.id) for node in VG._node_entities()])
+    rel_ids = json.dumps([[str(rel.id), str(rel.source), str(rel.target)] for rel in VG._relationship_entities()])
+    return NVL.fingerprint(node_ids, rel_ids)
+
+
+def render_component(
+    VG: VisualizationGraph,
+    layout: Optional[Layout] = None,
+    renderer: Renderer = Renderer.CANVAS,
+    height: int = 600,
+    pan_position: Optional[tuple[float, float]] = None,
+    initial_zoom: Optional[float] = None,
+    min_zoom: float = 0.075,
+    max_zoom: float = 10,
+    allow_dynamic_min_zoom: bool = True,
+    max_allowed_nodes: int = 10_000,
+    show_hover_tooltip: bool = True,
+    use_web_workers: bool = False,
+    max_array_values: Optional[int] = MAX_ARRAY_VALUES,
+    key: Optional[str] = None,
+) -> Optional[dict[str, Any]]:
+    """
+    Render a graph as a Streamlit component.
+
+    Unlike embedding the output of `VisualizationGraph.render` with `components.html`, the library is only loaded once
+    by the browser, and the visualization is kept alive across reruns of the script. Changes to the styling of the
+    nodes and relationships, the height, the zoom, the pan position, the layout or the renderer are applied to the
+    existing visualization, without restarting its layout. Only adding or removing nodes or relationships, or changing
+    the zoom limits, the tooltip or the web worker settings creates a new visualization. The nodes and relationships are
+    only sent to the browser when they have changed. If the browser does not have them, for example since the component
+    was removed from the page and added again, it requests them and the script is rerun to send them.
+
+    The component returns the last clicked element, as a dictionary with the `type` ("node" or "relationship") and the
+    `id` of the element, or `None` if nothing has been clicked yet.
+
+    Parameters
+    ----------
+    VG:
+        The graph to render.
+    layout:
+        The `Layout` to use.
+    renderer:
+        The `Renderer` to use.
+    height:
+        The height of the rendered graph, in pixels.
+    pan_position:
+        The pan position.
+    initial_zoom:
+        The zoom level.
+    min_zoom:
+        The minimum zoom level.
+    max_zoom:
+        The maximum zoom level.
+    allow_dynamic_min_zoom:
+        Whether to allow dynamic minimum zoom level.
+    max_allowed_nodes:
+        The maximum allowed number of nodes to render.
+    show_hover_tooltip:
+        Whether to show an info tooltip when hovering over nodes and relationships.
+    use_web_workers:
+        Whether to compute the layout in web workers, keeping the page responsive while large graphs are laid out.
+    max_array_values:
+        Array and numeric list property values with more elements than this, such as embeddings, are summarized in the
+        tooltips by their first and last values and their length. If `None`, all values are shown.
+    key:
+        An optional key that uniquely identifies the component, see the Streamlit documentation of components.
+    """
+    render_options = VG._render_options(
+        layout,
+        renderer,
+        pan_position,
+        initial_zoom,
+        min_zoom,
+        max_zoom,
+        allow_dynamic_min_zoom,
+        max_allowed_nodes,
+        use_web_workers,
+    )
+
+    nodes_json, rels_json, element_data_json = NVL.serialize_graph(
+        VG._node_entities(), VG._relationship_entities(), render_options.renderer, show_hover_tooltip, max_array_values
+    )
+
+    render_options, _ = NVL.layout_workers(render_options)
+
+    # The payload is only sent as JSON strings if it has not been sent in this session yet
+    graph_fingerprint = NVL.fingerprint(nodes_json, rels_json, element_data_json)
+    sent_graphs: dict[str, None] = st.session_state.setdefault(_SENT_GRAPHS_KEY, {})
+    send_graph = graph_fingerprint not in sent_graphs
+    value: Optional[dict[str, Any]] = _component_func(
+        nodes=nodes_json if send_graph else None,
+        relationships=rels_json if send_graph else None,
+        elementData=element_data_json if send_graph else None,
+        graphFingerprint=graph_fingerprint,
+        structureFingerprint=_structure_fingerprint(VG),
+        options=render_options.to_dict(),
+        height=height,
+        showHoverTooltip=show_hover_tooltip,
+        key=key,
+        default=None,
+    )
+    if send_graph:
+        sent_graphs[graph_fingerprint] = None
+        if len(sent_graphs) > _MAX_SENT_GRAPHS:
+            del sent_graphs[next(iter(sent_graphs))]
+
+    if value is None:
+        return None
+
+    # A frontend without the graph asks for it, and every request is answered once by sending the graph again
+    request = value.get("missingGraph")
+    handled_requests: set[str] = st.session_state.setdefault(_HANDLED_REQUESTS_KEY, set())
+    if request is not None and request["id"] not in handled_requests:
+        handled_requests.add(request["id"])
+        sent_graphs.pop(request["fingerprint"], None)
+        st.rerun()
+
+    clicked: Optional[dict[str, Any]] = value.get("clicked")
+    return clicked
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import warnings
-from collections.abc import Iterable
-from typing import Any, Callable, Hashable, Optional
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Hashable, NamedTuple, Optional, Union
 
 from IPython.display import HTML
 from pydantic_extra_types.color import Color, ColorType
 
+from ._encoders import MAX_ARRAY_VALUES
+from ._records import NodeLike, NodeRecord, RelationshipLike, RelationshipRecord
 from .colors import NEO4J_COLORS_CONTINUOUS, NEO4J_COLORS_DISCRETE, ColorSpace, ColorsType
 from .node import Node, NodeIdType
 from .node_size import RealNumber, verify_radii
@@ -14,16 +16,158 @@ from .nvl import NVL
 from .options import Layout, Renderer, RenderOptions
 from .relationship import Relationship
 
+if TYPE_CHECKING:
+    import neo4j
+
+
+class GraphDelta(NamedTuple):
+    """
+    The changes of a graph by `VisualizationGraph.expand`.
+    """
+
+    #: The nodes that were added
+    added_nodes: list[Node]
+    #: The relationships that were added
+    added_relationships: list[Relationship]
+    #: The nodes that were updated
+    updated_nodes: list[Node]
+    #: The relationships that were updated
+    updated_relationships: list[Relationship]
+
+
+_CONFLICT_POLICIES = ("first", "last", "update", "error")
+_ID_FIELDS = frozenset(("id", "source", "target"))
+
+
+def _as_model(entity: Any) -> Any:
+    return entity.to_model() if isinstance(entity, (NodeRecord, RelationshipRecord)) else entity
+
+
+def _field_values(entity: Any) -> dict[str, Any]:
+    names = NodeRecord.__slots__ if isinstance(entity, (Node, NodeRecord)) else RelationshipRecord.__slots__
+    return {name: getattr(entity, name) for name in names}
+
+
+def _comparable_values(entity: Any) -> dict[str, Any]:
+    values = _field_values(entity)
+    for name in _ID_FIELDS & values.keys():
+        values[name] = str(values[name])
+    return values
+
+
+def _changed_fields(existing: Any, other: Any, merge_properties: bool) -> dict[str, Any]:
+    # The fields that `other` sets to values other than those of `existing`. Its properties replace those of `existing`,
+    # or are merged into them.
+    changes = {}
+    for name, value in _field_values(other).items():
+        if name == "properties":
+            if merge_properties:
+                value = {**existing.properties, **value}
+        elif value is None:
+            continue
+        elif name in _ID_FIELDS:
+            # IDs are matched as strings, like the renderer does
+            if str(value) != str(getattr(existing, name)):
+                changes[name] = value
+            continue
+        if value != getattr(existing, name):
+            changes[name] = value
+    return changes
+
+
+def _with_changes(entity: Any, changes: dict[str, Any]) -> Any:
+    # A model of the entity with some of its fields changed, leaving the entity itself as it is
+    model = entity.to_model() if isinstance(entity, (NodeRecord, RelationshipRecord)) else entity.model_copy()
+    for name, value in changes.items():
+        setattr(model, name, value)
+    return model
+
+
+def _copy_entity(entity: Any) -> Any:
+    # A copy of the entity with its own properties dictionary, whose values are still shared
+    if isinstance(entity, (NodeRecord, RelationshipRecord)):
+        return type(entity)(**{**_field_values(entity), "properties": dict(entity.properties)})
+    return entity.model_copy(update={"properties": dict(entity.properties)})
+
+
+def _merge_entities(entities: list[Any], fetched: Sequence[Any]) -> tuple[list[Any], list[Any]]:
+    # Merges the fetched entities into `entities` in place, through an index by ID. IDs are compared as strings, like
+    # the renderer matches them. Added and updated entities are converted to models, which are returned.
+    index = {str(entity.id): position for position, entity in enumerate(entities)}
+    added = []
+    updated = []
+    for entity in fetched:
+        position = index.get(str(entity.id))
+        if position is None:
+            model = _as_model(entity)
+            index[str(model.id)] = len(entities)
+            entities.append(model)
+            added.append(model)
+            continue
+
+        # Fields that the fetched entity does not set are kept, but properties are replaced as a whole
+        changes = _changed_fields(entities[position], entity, merge_properties=False)
+        if changes:
+            model = _with_changes(entities[position], changes)
+            entities[position] = model
+            updated.append(model)
+
+    return added, updated
+
+
+def _union_entities(
+    entity_sequences: list[Sequence[Any]], on_conflict: Union[str, Callable[[Any, Any], Any]], kind: str
+) -> list[Any]:
+    # The entities of all sequences, with one entity per ID, in order of first appearance. IDs are compared as strings,
+    # like the renderer matches them.
+    merged: list[Any] = []
+    index: dict[str, int] = {}
+    remaining = entity_sequences
+    if entity_sequences:
+        # The first sequence is taken as a whole, unless it has duplicate IDs itself
+        first = list(entity_sequences[0])
+        first_index = {str(entity.id): position for position, entity in enumerate(first)}
+        if len(first_index) == len(first):
+            merged, index, remaining = first, first_index, entity_sequences[1:]
+
+    for entities in remaining:
+        for entity in entities:
+            position = index.get(str(entity.id))
+            if position is None:
+                index[str(entity.id)] = len(merged)
+                merged.append(entity)
+                continue
+
+            existing = merged[position]
+            if on_conflict == "first":
+                continue
+            elif on_conflict == "last":
+                merged[position] = entity
+            elif on_conflict == "update":
+                changes = _changed_fields(existing, entity, merge_properties=True)
+                if changes:
+                    merged[position] = _with_changes(existing, changes)
+            elif on_conflict == "error":
+                if _comparable_values(existing) != _comparable_values(entity):
+                    raise ValueError(
+                        f"Conflicting {kind}s with ID '{entity.id}': {_as_model(existing)} and {_as_model(entity)}"
+                    )
+            elif callable(on_conflict):
+                merged[position] = on_conflict(_as_model(existing), _as_model(entity))
+
+    return merged
+
 
 class VisualizationGraph:
     """
     A graph to visualize.
     """
 
-    #: "The nodes in the graph"
-    nodes: list[Node]
-    #: "The relationships in the graph"
-    relationships: list[Relationship]
+    # Until the nodes or relationships are first accessed, they may be held as records, see `_from_records`
+    _node_models: Optional[list[Node]]
+    _node_records: Sequence[NodeLike]
+    _relationship_models: Optional[list[Relationship]]
+    _relationship_records: Sequence[RelationshipLike]
 
     def __init__(self, nodes: list[Node], relationships: list[Relationship]) -> None:
         """ "
@@ -39,6 +183,57 @@ class VisualizationGraph:
         self.nodes = nodes
         self.relationships = relationships
 
+    @classmethod
+    def _from_records(cls, nodes: Sequence[NodeLike], relationships: Sequence[RelationshipLike]) -> VisualizationGraph:
+        # The nodes and relationships may be records of `_records`, which are converted to models on first access
+        VG = cls.__new__(cls)
+        VG._node_models = None
+        VG._node_records = nodes
+        VG._relationship_models = None
+        VG._relationship_records = relationships
+        return VG
+
+    @property
+    def nodes(self) -> list[Node]:
+        """
+        The nodes in the graph.
+        """
+        if self._node_models is None:
+            self._node_models = [
+                node.to_model() if isinstance(node, NodeRecord) else node for node in self._node_records
+            ]
+            self._node_records = ()
+        return self._node_models
+
+    @nodes.setter
+    def nodes(self, nodes: list[Node]) -> None:
+        self._node_models = nodes
+        self._node_records = ()
+
+    @property
+    def relationships(self) -> list[Relationship]:
+        """
+        The relationships in the graph.
+        """
+        if self._relationship_models is None:
+            self._relationship_models = [
+                rel.to_model() if isinstance(rel, RelationshipRecord) else rel for rel in self._relationship_records
+            ]
+            self._relationship_records = ()
+        return self._relationship_models
+
+    @relationships.setter
+    def relationships(self, relationships: list[Relationship]) -> None:
+        self._relationship_models = relationships
+        self._relationship_records = ()
+
+    def _node_entities(self) -> Sequence[NodeLike]:
+        # The nodes without converting records, for methods that only need their fields
+        return self._node_models if self._node_models is not None else self._node_records
+
+    def _relationship_entities(self) -> Sequence[RelationshipLike]:
+        return self._relationship_models if self._relationship_models is not None else self._relationship_records
+
     def render(
         self,
         layout: Optional[Layout] = None,
@@ -52,6 +247,9 @@ class VisualizationGraph:
         allow_dynamic_min_zoom: bool = True,
         max_allowed_nodes: int = 10_000,
         show_hover_tooltip: bool = True,
+        use_web_workers: bool = False,
+        progressive_chunk_size: Optional[int] = None,
+        max_array_values: Optional[int] = MAX_ARRAY_VALUES,
     ) -> HTML:
         """
         Render the graph.
@@ -80,9 +278,57 @@ class VisualizationGraph:
             The maximum allowed number of nodes to render.
         show_hover_tooltip:
             Whether to show an info tooltip when hovering over nodes and relationships.
+        use_web_workers:
+            Whether to compute the layout in web workers, keeping the page responsive while large graphs are laid out.
+            If web workers are not available in the browser, the layout is computed on the main thread instead.
+        progressive_chunk_size:
+            If given, nodes and relationships are added to the visualization progressively, in chunks of about this
+            many elements per animation frame. The largest and most connected nodes are added first, so that the most
+            important parts of large graphs are shown almost immediately. By default, all elements are added at once.
+        max_array_values:
+            Array and numeric list property values with more elements than this, such as embeddings, are summarized in
+            the tooltips by their first and last values and their length. If `None`, all values are shown.
         """
 
-        num_nodes = len(self.nodes)
+        if progressive_chunk_size is not None and progressive_chunk_size < 1:
+            raise ValueError(f"`progressive_chunk_size` must be a positive integer, but was {progressive_chunk_size}")
+
+        render_options = self._render_options(
+            layout,
+            renderer,
+            pan_position,
+            initial_zoom,
+            min_zoom,
+            max_zoom,
+            allow_dynamic_min_zoom,
+            max_allowed_nodes,
+            use_web_workers,
+        )
+
+        return NVL().render(
+            self._node_entities(),
+            self._relationship_entities(),
+            render_options,
+            width,
+            height,
+            show_hover_tooltip,
+            progressive_chunk_size,
+            max_array_values,
+        )
+
+    def _render_options(
+        self,
+        layout: Optional[Layout],
+        renderer: Renderer,
+        pan_position: Optional[tuple[float, float]],
+        initial_zoom: Optional[float],
+        min_zoom: float,
+        max_zoom: float,
+        allow_dynamic_min_zoom: bool,
+        max_allowed_nodes: int,
+        use_web_workers: bool,
+    ) -> RenderOptions:
+        num_nodes = len(self._node_entities())
         if num_nodes > max_allowed_nodes:
             raise ValueError(
                 f"Too many nodes ({num_nodes}) to render. Maximum allowed nodes is set "
@@ -92,7 +338,7 @@ class VisualizationGraph:
 
         Renderer.check(renderer, num_nodes)
 
-        render_options = RenderOptions(
+        return RenderOptions(
             layout=layout,
             renderer=renderer,
             pan_X=pan_position[0] if pan_position is not None else None,
@@ -101,16 +347,154 @@ class VisualizationGraph:
             min_zoom=min_zoom,
             max_zoom=max_zoom,
             allow_dynamic_min_zoom=allow_dynamic_min_zoom,
+            disable_web_workers=not use_web_workers,
         )
 
-        return NVL().render(
-            self.nodes,
-            self.relationships,
-            render_options,
-            width,
-            height,
-            show_hover_tooltip,
+    def fingerprint(self) -> str:
+        """
+        Compute a fingerprint of the graph, which changes whenever any node or relationship changes.
+
+        It is cheap to compare and stable across processes, which makes it suitable as a hash function for caches.
+        For example, with Streamlit: `st.cache_data(hash_funcs={VisualizationGraph: VisualizationGraph.fingerprint})`.
+        """
+        payload = NVL.serialize_graph(
+            self._node_entities(), self._relationship_entities(), None, include_properties=True
         )
+        return NVL.fingerprint(*payload)
+
+    def expand(
+        self,
+        source: Union[neo4j.Driver, Callable[[list[NodeIdType], Optional[int]], VisualizationGraph]],
+        node_ids: Iterable[NodeIdType],
+        limit: Optional[int] = 100,
+        database: Optional[str] = None,
+        size_property: Optional[str] = None,
+        node_caption: Optional[str] = "labels",
+        relationship_caption: Optional[str] = "type",
+    ) -> GraphDelta:
+        """
+        Add the neighbors of some nodes to the graph, together with the relationships to them.
+
+        The fetched nodes and relationships are merged into the graph by ID. Unknown ones are added, and known ones
+        are updated if they have changed: their properties are replaced, and their fields are overwritten by the
+        fields that the fetched ones set. Fields set only in this graph, like colors, are kept.
+
+        Parameters
+        ----------
+        source:
+            A `neo4j.Driver`, for graphs created with `from_neo4j`, whose node IDs are element IDs. Only relationships
+            that are not yet in the graph are queried, and only the nodes that are not yet in the graph are fetched
+            with their labels and properties, so known nodes are not updated. Alternatively, a function that takes the
+            node IDs and the limit, and returns a graph with their neighbors.
+        node_ids:
+            The IDs of the nodes to expand. Like in the visualization, IDs are compared as strings, so `1` and `"1"`
+            refer to the same node.
+        limit:
+            The maximum number of relationships to fetch, by default 100. If None, all of them are fetched.
+        database:
+            The database to query, by default the default database of the server. Only used with a driver.
+        size_property:
+            Property to use for node size, by default None. Only used with a driver. The sizes of the fetched nodes are
+            not rescaled, which can be done with `resize_nodes`.
+        node_caption:
+            Property to use as the node caption, by default the node labels. Only used with a driver.
+        relationship_caption:
+            Property to use as the relationship caption, by default the relationship type. Only used with a driver.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"`limit` must be a positive integer, but was {limit}")
+
+        unique_ids: dict[str, NodeIdType] = {}
+        for id in node_ids:
+            unique_ids.setdefault(str(id), id)
+        if callable(source):
+            fetched = source(list(unique_ids.values()), limit)
+        else:
+            from .neo4j import _fetch_neighbors
+
+            known_relationship_ids = [
+                str(rel.id)
+                for rel in self._relationship_entities()
+                if str(rel.source) in unique_ids or str(rel.target) in unique_ids
+            ]
+            known_node_ids = [str(node.id) for node in self._node_entities()]
+            fetched = _fetch_neighbors(
+                source,
+                list(unique_ids),
+                known_relationship_ids,
+                known_node_ids,
+                limit,
+                database,
+                size_property,
+                node_caption,
+                relationship_caption,
+            )
+
+        added_nodes, updated_nodes = _merge_entities(self._mutable_node_entities(), fetched._node_entities())
+        added_rels, updated_rels = _merge_entities(
+            self._mutable_relationship_entities(), fetched._relationship_entities()
+        )
+        return GraphDelta(added_nodes, added_rels, updated_nodes, updated_rels)
+
+    @classmethod
+    def merge(
+        cls,
+        *graphs: VisualizationGraph,
+        on_conflict: Union[str, Callable[[Any, Any], Any]] = "update",
+        copy: bool = True,
+    ) -> VisualizationGraph:
+        """
+        Merge several graphs into a new graph, with one node and one relationship per ID.
+
+        Nodes and relationships are deduplicated by ID, in time linear in the total size of the graphs, and kept in
+        order of first appearance. Like in the visualization, IDs are compared as strings, so `1` and `"1"` are the
+        same node.
+
+        Parameters
+        ----------
+        *graphs:
+            The graphs to merge.
+        on_conflict:
+            How to resolve nodes or relationships with the same ID, by default "update".
+            With "first" or "last", the first or the last of them is kept.
+            With "update", the fields set by later ones override those of earlier ones, and their properties are merged,
+            with the values of later ones taking precedence.
+            With "error", a ValueError is raised if they differ in any field or property.
+            Alternatively, a function that takes the earlier and the later `Node` or `Relationship` and returns the one
+            to keep.
+        copy:
+            Whether the merged graph gets copies of the nodes and relationships, by default True.
+            With copies, which have their own properties dictionaries, changes to the merged graph such as
+            `resize_nodes` or `color_nodes` leave the given graphs as they are. Without, the merged graph shares
+            nodes and relationships with the given graphs and changing them changes both, which saves time and memory
+            when the given graphs are not used anymore.
+        """
+        if not callable(on_conflict) and on_conflict not in _CONFLICT_POLICIES:
+            raise ValueError(
+                f"`on_conflict` must be one of {_CONFLICT_POLICIES} or a function, but was '{on_conflict}'"
+            )
+
+        nodes = _union_entities([VG._node_entities() for VG in graphs], on_conflict, "node")
+        relationships = _union_entities([VG._relationship_entities() for VG in graphs], on_conflict, "relationship")
+        if copy:
+            nodes = [_copy_entity(node) for node in nodes]
+            relationships = [_copy_entity(rel) for rel in relationships]
+        return cls._from_records(nodes, relationships)
+
+    def _mutable_node_entities(self) -> list[Any]:
+        # The list that backs the nodes, for adding and replacing nodes in place
+        if self._node_models is not None:
+            return self._node_models
+        if not isinstance(self._node_records, list):
+            self._node_records = list(self._node_records)
+        return self._node_records
+
+    def _mutable_relationship_entities(self) -> list[Any]:
+        if self._relationship_models is not None:
+            return self._relationship_models
+        if not isinstance(self._relationship_records, list):
+            self._relationship_records = list(self._relationship_records)
+        return self._relationship_records
 
     def toggle_nodes_pinned(self, pinned: dict[NodeIdType, bool]) -> None:
         """
@@ -121,7 +505,7 @@ class VisualizationGraph:
         pinned:
             A dictionary mapping from node ID to whether the node should be pinned or not.
         """
-        for node in self.nodes:
+        for node in self._node_entities():
             node_pinned = pinned.get(node.id)
 
             if node_pinned is None:
@@ -151,7 +535,7 @@ class VisualizationGraph:
 
         # Gather and verify all node size values we have to work with
         all_sizes = {}
-        for node in self.nodes:
+        for node in self._node_entities():
             size = None
             if sizes is not None:
                 size = sizes.get(node.id)
@@ -176,7 +560,7 @@ class VisualizationGraph:
         else:
             final_sizes = all_sizes
 
-        for node in self.nodes:
+        for node in self._node_entities():
             size = final_sizes.get(node.id)
 
             if size is None:
@@ -15,6 +15,11 @@ def pytest_addoption(parser: Any) -> None:
         action="store_true",
         help="include tests requiring a Snowflake connection",
     )
+    parser.addoption(
+        "--include-js-build",
+        action="store_true",
+        help="include tests requiring the resources of a full JS applet build",
+    )
 
 
 def pytest_collection_modifyitems(config: Any, items: Any) -> None:
@@ -28,6 +33,11 @@ def pytest_collection_modifyitems(config: Any, items: Any) -> None:
         for item in items:
             if "requires_snowflake" in item.keywords:
                 item.add_marker(skip)
+    if not config.getoption("--include-js-build"):
+        skip = pytest.mark.skip(reason="skipping since requiring a full JS applet build")
+        for item in items:
+            if "requires_js_build" in item.keywords:
+                item.add_marker(skip)
 
 
 @pytest.fixture(scope="package")
@@ -0,0 +1,76 @@
+import json
+
+import pyarrow as pa
+import pytest
+from pydantic_extra_types.color import Color
+
+from neo4j_viz.arrow import from_arrow
+from neo4j_viz.node import Node
+from neo4j_viz.nvl import NVL
+
+
+def test_from_arrow() -> None:
+    nodes = pa.table(
+        {
+            "id": [0, 1],
+            "caption": ["A", "B"],
+            "size": [1337, 42],
+            "color": ["#FF0000", "#FF0000"],
+            "instruments": [["piano"], ["guitar", "bass"]],
+        }
+    )
+    relationships = pa.table({"source": [0, 1], "target": [1, 0], "caption": ["REL", "REL2"], "weight": [1.0, 2.0]})
+
+    VG = from_arrow(nodes, relationships, node_radius_min_max=(42, 1337))
+
+    assert len(VG.nodes) == 2
+    assert VG.nodes[0].id == 0
+    assert VG.nodes[0].caption == "A"
+    assert VG.nodes[0].size == 1337
+    assert VG.nodes[0].color == Color("#ff0000")
+    assert VG.nodes[0].properties == {"instruments": ["piano"]}
+    assert VG.nodes[1].size == 42
+    assert VG.nodes[1].properties == {"instruments": ["guitar", "bass"]}
+
+    assert len(VG.relationships) == 2
+    assert VG.relationships[0].source == 0
+    assert VG.relationships[0].target == 1
+    assert VG.relationships[0].caption == "REL"
+    assert VG.relationships[0].properties == {"weight": 1.0}
+
+
+def test_from_arrow_summarizes_embeddings() -> None:
+    nodes = pa.table({"id": [0], "embedding": [[0.5] * 1433], "tags": [["a"] * 200]})
+
+    VG = from_arrow(nodes, pa.table({"source": [0], "target": [0]}))
+
+    # Arrow list columns arrive as Python lists, which are summarized like NumPy arrays
+    properties = json.loads(NVL._serialize_properties(VG.nodes[0].properties))
+    assert properties == {"embedding": "[0.5, 0.5, 0.5, ..., 0.5, 0.5, 0.5] (length 1433)", "tags": ["a"] * 200}
+    assert "(length 1433)" in VG.render().data
+
+    properties = json.loads(NVL._serialize_properties(VG.nodes[0].properties, max_array_values=None))
+    assert properties["embedding"] == [0.5] * 1433
+
+
+def test_from_arrow_batches() -> None:
+    relationships = pa.table({"sourceNodeId": [0, 1, 2, 3], "targetNodeId": [1, 0, 1, 0]})
+    reader = pa.RecordBatchReader.from_batches(relationships.schema, relationships.to_batches(max_chunksize=3))
+
+    VG = from_arrow(None, reader)
+
+    assert [(rel.source, rel.target) for rel in VG.relationships] == [(0, 1), (1, 0), (2, 1), (3, 0)]
+    assert VG.nodes == [Node(id=id) for id in [0, 1, 2, 3]]
+
+
+def test_from_arrow_errors() -> None:
+    nodes = pa.table({"caption": ["A", "B"]})
+    with pytest.raises(ValueError, match=r"Mandatory node column 'id' is missing"):
+        from_arrow(nodes, [])
+
+    nodes = pa.table({"id": [0, 1], "size": [1, -1]})
+    with pytest.raises(
+        ValueError,
+        match=r"Error for node column 'size' with provided input '-1'. Reason: Input should be greater than or equal to 0 \(batch 0, row 1\)",
+    ):
+        from_arrow(nodes, [])
@@ -0,0 +1,87 @@
+import pickle
+import zlib
+from typing import Any
+
+import neo4j.spatial
+import neo4j.time
+import numpy as np
+import pytest
+import pytz
+
+from neo4j_viz import Node, Relationship
+from neo4j_viz._cache_format import dump_records, load_records
+from neo4j_viz._records import NodeLike, NodeRecord, RelationshipLike, RelationshipRecord
+from neo4j_viz.options import CaptionAlignment
+
+
+def test_dump_and_load_records() -> None:
+    nodes: list[NodeLike] = [
+        Node(id=0, caption="A", caption_align=CaptionAlignment.TOP, color="red", size=3, properties={"a": [1, 2]}),
+        NodeRecord(id="1", pinned=True, x=1.5, y=-2),
+    ]
+    relationships: list[RelationshipLike] = [
+        Relationship(id="r", source=0, target="1", caption_size=1.5, color="#00ff00"),
+        RelationshipRecord(source="1", target=0, properties={"b": None}),
+    ]
+
+    loaded = load_records(dump_records(nodes, relationships))
+
+    assert loaded is not None
+    loaded_nodes, loaded_relationships = loaded
+    expected_nodes = [node if isinstance(node, Node) else node.to_model() for node in nodes]
+    expected_relationships = [rel if isinstance(rel, Relationship) else rel.to_model() for rel in relationships]
+    assert [node.to_model() for node in loaded_nodes] == expected_nodes
+    assert [rel.to_model() for rel in loaded_relationships] == expected_relationships
+
+
+def test_dump_and_load_property_values() -> None:
+    values = {
+        "list": [1, 2.5, None, "a", [True]],
+        "map": {"k": [1, {"n": None}]},
+        "bytes": b"\x00ab",
+        "tuple": (1, "a"),
+        "nan": float("nan"),
+        "date": neo4j.time.Date(2020, 1, 2),
+        "time": neo4j.time.Time(1, 2, 3, 4, tzinfo=pytz.FixedOffset(60)),
+        "datetime": neo4j.time.DateTime(2020, 1, 2, 3, 4, 5, 6),
+        "zoned": neo4j.time.DateTime(2020, 3, 29, 3, 4, 5, 6, tzinfo=pytz.UTC).as_timezone(
+            pytz.timezone("Europe/Berlin")
+        ),
+        "duration": neo4j.time.Duration(months=1, days=2, seconds=3, nanoseconds=4),
+        "point": neo4j.spatial.WGS84Point((1.5, 2.0)),
+        "point3d": neo4j.spatial.CartesianPoint((1.0, 2.0, 3.0)),
+    }
+
+    loaded = load_records(dump_records([NodeRecord(id=0, properties=values)], []))
+
+    assert loaded is not None
+    properties = loaded[0][0].properties
+    assert str(properties.pop("nan")) == "nan"
+    values.pop("nan")
+    assert properties == values
+    assert [type(value) for value in properties.values()] == [type(value) for value in values.values()]
+    assert properties["zoned"].tzinfo.zone == "Europe/Berlin"
+
+    # NumPy scalars are stored as their Python values
+    loaded = load_records(dump_records([NodeRecord(id=0, properties={"count": np.int64(3)})], []))
+    assert loaded is not None
+    assert loaded[0][0].properties == {"count": 3}
+
+    with pytest.raises(TypeError, match="Property values of type object cannot be serialized"):
+        dump_records([NodeRecord(id=0, properties={"a": object()})], [])
+    with pytest.raises(TypeError, match="Points with SRID None cannot be serialized"):
+        dump_records([NodeRecord(id=0, properties={"a": [neo4j.spatial.Point((1.0, 2.0))]})], [])
+
+
+calls: list[str] = []
+
+
+class _Exploit:
+    def __reduce__(self) -> Any:
+        return calls.append, ("unpickled",)
+
+
+def test_load_records_does_not_unpickle() -> None:
+    assert load_records(zlib.compress(pickle.dumps((1, [_Exploit()], [])))) is None
+    assert load_records(b"not compressed") is None
+    assert calls == []
@@ -0,0 +1,84 @@
+from typing import Optional
+
+import pytest
+
+from neo4j_viz import Node, Relationship, VisualizationGraph
+from neo4j_viz._records import NodeRecord, RelationshipRecord
+from neo4j_viz.node import NodeIdType
+from neo4j_viz.visualization_graph import GraphDelta
+
+
+def test_expand() -> None:
+    VG = VisualizationGraph(
+        nodes=[Node(id=0, caption="A", color="red"), Node(id=1, caption="B")],
+        relationships=[Relationship(id="r0", source=0, target=1)],
+    )
+    calls = []
+
+    def fetch(node_ids: list[NodeIdType], limit: Optional[int]) -> VisualizationGraph:
+        calls.append((node_ids, limit))
+        return VisualizationGraph(
+            nodes=[
+                Node(id=0, caption="A2", properties={"a": 1}),
+                Node(id=1, caption="B"),
+                Node(id=2, caption="C"),
+            ],
+            relationships=[Relationship(id="r0", source=0, target=1), Relationship(id="r1", source=0, target=2)],
+        )
+
+    delta = VG.expand(fetch, [0, 0], limit=10)
+
+    assert calls == [([0], 10)]
+    assert delta == GraphDelta(
+        added_nodes=[Node(id=2, caption="C")],
+        added_relationships=[Relationship(id="r1", source=0, target=2)],
+        # Fields that are only set locally are kept
+        updated_nodes=[Node(id=0, caption="A2", color="red", properties={"a": 1})],
+        updated_relationships=[],
+    )
+    assert [node.id for node in VG.nodes] == [0, 1, 2]
+    assert VG.nodes[0] is delta.updated_nodes[0]
+    assert [rel.id for rel in VG.relationships] == ["r0", "r1"]
+
+    # Nothing changes when fetching the same again
+    assert VG.expand(fetch, [0]) == GraphDelta([], [], [], [])
+
+    with pytest.raises(ValueError, match="`limit` must be a positive integer, but was 0"):
+        VG.expand(fetch, [0], limit=0)
+
+
+def test_expand_string_ids() -> None:
+    VG = VisualizationGraph(nodes=[Node(id=1, caption="A")], relationships=[])
+    calls = []
+
+    def fetch(node_ids: list[NodeIdType], limit: Optional[int]) -> VisualizationGraph:
+        calls.append(node_ids)
+        return VisualizationGraph(
+            nodes=[Node(id="1", caption="A2"), Node(id="2")],
+            relationships=[Relationship(id="r", source="1", target="2")],
+        )
+
+    delta = VG.expand(fetch, [1, "1"])
+
+    # IDs are compared as strings, like the renderer does
+    assert calls == [[1]]
+    assert delta.added_nodes == [Node(id="2")]
+    assert delta.updated_nodes == [Node(id=1, caption="A2")]
+    assert [node.id for node in VG.nodes] == [1, "2"]
+
+
+def test_expand_records() -> None:
+    VG = VisualizationGraph._from_records([NodeRecord(id=0), NodeRecord(id=1, caption="B")], ())
+    fetched = VisualizationGraph._from_records(
+        [NodeRecord(id=1, caption="B2"), NodeRecord(id=2)], [RelationshipRecord(id="r", source=1, target=2)]
+    )
+
+    delta = VG.expand(lambda node_ids, limit: fetched, [1])
+
+    # Added and updated entities are reported as models, which are the ones in the graph
+    assert delta.added_nodes == [Node(id=2)]
+    assert delta.updated_nodes == [Node(id=1, caption="B2")]
+    assert delta.added_relationships == [Relationship(id="r", source=1, target=2)]
+    assert VG._node_entities()[1] is delta.updated_nodes[0]
+    assert VG.nodes == [Node(id=0), Node(id=1, caption="B2"), Node(id=2)]
+    assert VG.relationships == [Relationship(id="r", source=1, target=2)]
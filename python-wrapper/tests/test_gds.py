@@ -1,3 +1,5 @@
+import logging
+import threading
 from typing import Any
 
 import pandas as pd
@@ -134,6 +136,204 @@ def test_from_gds_mocked(mocker: MockerFixture) -> None:
     ]
 
 
+def test_aggregate_labels() -> None:
+    from neo4j_viz.gds import _aggregate_labels
+
+    # More than eight labels, so that the label bits span several bytes
+    labels = [f"L{i}" for i in range(10)]
+    node_dfs = {lbl: pd.DataFrame({"nodeId": [100, i], "score": [0.5, i / 10]}) for i, lbl in enumerate(labels)}
+
+    ids, columns, node_labels = _aggregate_labels(node_dfs, ["score"])
+
+    # In order of first appearance
+    assert ids.tolist() == [100, *range(10)]
+    assert columns[0].tolist() == [0.5, *(i / 10 for i in range(10))]
+    assert node_labels[0] == labels
+    assert node_labels[1:] == [[lbl] for lbl in labels]
+    # Every node has a list of its own
+    assert node_labels[1] is not node_labels[2]
+    node_labels[1].append("X")
+    assert node_labels[2] == ["L1"]
+
+
+def test_from_gds_concurrent_streams(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
+    from neo4j_viz.gds import from_gds
+
+    labels = ["A", "B", "C", "D"]
+    condition = threading.Condition()
+    active = [0]
+    max_active = [0]
+    # Every stream waits until this many streams have run at the same time, instead of relying on timing
+    expected_active = [5]
+
+    def stream(df: pd.DataFrame) -> pd.DataFrame:
+        with condition:
+            active[0] += 1
+            max_active[0] = max(max_active[0], active[0])
+            condition.notify_all()
+            condition.wait_for(lambda: max_active[0] >= expected_active[0], timeout=10)
+            active[0] -= 1
+        return df
+
+    def stream_node_properties(G: Any, node_properties: list[str], node_labels: list[str], **kwargs: Any) -> Any:
+        lbl_index = labels.index(node_labels[0])
+        return stream(pd.DataFrame({"nodeId": [lbl_index, lbl_index + 1], "score": [lbl_index, lbl_index + 1.0]}))
+
+    gds = mocker.Mock()
+    gds.graph.nodeProperties.stream.side_effect = stream_node_properties
+    gds.graph.relationships.stream.side_effect = lambda G, relationship_types: stream(
+        pd.DataFrame({"sourceNodeId": [0], "targetNodeId": [4], "relationshipType": ["REL"]})
+    )
+    G = mocker.Mock()
+    G.node_properties.return_value = pd.Series({lbl: ["score"] for lbl in labels})
+    G.node_labels.return_value = labels
+
+    with caplog.at_level(logging.DEBUG, logger="neo4j_viz.gds"):
+        VG = from_gds(gds, G, additional_node_properties=["score"], max_workers=5)
+
+    # All five streams run at the same time
+    assert max_active[0] == 5
+    assert sorted(node.id for node in VG.nodes) == [0, 1, 2, 3, 4]
+    assert sorted(VG.nodes, key=lambda node: node.id)[1].properties["labels"] == ["A", "B"]
+    assert [(rel.source, rel.target) for rel in VG.relationships] == [(0, 4)]
+    assert len([r for r in caplog.records if r.getMessage().startswith("Streamed node properties of label")]) == 4
+    assert len([r for r in caplog.records if r.getMessage().startswith("Streamed relationships")]) == 1
+
+    max_active[0] = 0
+    expected_active[0] = 2
+    from_gds(gds, G, max_workers=2)
+    assert max_active[0] == 2
+
+    with pytest.raises(ValueError, match="`max_workers` must be a positive integer, but was 0"):
+        from_gds(gds, G, max_workers=0)
+
+
+def test_from_gds_sampling(mocker: MockerFixture) -> None:
+    from neo4j_viz.gds import from_gds
+
+    def mock_graph(name: str, node_count: int) -> Any:
+        graph = mocker.Mock()
+        graph.name.return_value = name
+        graph.node_count.return_value = node_count
+        graph.node_properties.return_value = pd.Series({"A": ["score"]})
+        graph.node_labels.return_value = ["A"]
+        return graph
+
+    G = mock_graph("g", 1000)
+    sample = mock_graph("g_sample", 2)
+    gds = mocker.Mock()
+    gds.graph.sample.rwr.return_value = (sample, pd.Series())
+    gds.graph.filter.return_value = (sample, pd.Series())
+    gds.graph.nodeProperty.stream.return_value = pd.DataFrame({"nodeId": [0, 1, 2], "propertyValue": [3.0, 1.0, 3.0]})
+    gds.graph.nodeProperties.stream.return_value = pd.DataFrame({"nodeId": [0, 2], "score": [3.0, 3.0]})
+    gds.graph.relationships.stream.return_value = pd.DataFrame(
+        {"sourceNodeId": [0], "targetNodeId": [2], "relationshipType": ["REL"]}
+    )
+
+    VG = from_gds(gds, G, max_nodes=100)
+
+    name, from_G = gds.graph.sample.rwr.call_args.args
+    assert name.startswith("g_neo4j_viz_sample_")
+    assert from_G is G
+    assert gds.graph.sample.rwr.call_args.kwargs == {"samplingRatio": 0.1}
+    # Only the sample is streamed, and it is dropped afterwards
+    assert gds.graph.nodeProperties.stream.call_args.args[0] is sample
+    assert gds.graph.relationships.stream.call_args.args[0] is sample
+    sample.drop.assert_called_once()
+    assert sorted(node.id for node in VG.nodes) == [0, 2]
+
+    # The sample is dropped on errors too
+    gds.graph.relationships.stream.side_effect = RuntimeError("stream failed")
+    with pytest.raises(RuntimeError, match="stream failed"):
+        from_gds(gds, G, max_nodes=100, sampling="rwr")
+    assert sample.drop.call_count == 2
+    gds.graph.relationships.stream.side_effect = None
+
+    VG = from_gds(gds, G, size_property="score", node_radius_min_max=None, max_nodes=1, sampling="top_k")
+    gds.graph.nodeProperty.stream.assert_called_once_with(G, "score")
+    assert gds.graph.filter.call_args.kwargs == {"node_filter": "n.`score` >= 3.0", "relationship_filter": "*"}
+    assert sample.drop.call_count == 3
+    assert [node.size for node in VG.nodes] == [3.0, 3.0]
+
+    # Property keys are quoted, and large thresholds are written without the exponent sign
+    gds.graph.nodeProperty.stream.return_value = pd.DataFrame({"nodeId": [0, 1], "propertyValue": [1e20, 1.0]})
+    G.node_properties.return_value = sample.node_properties.return_value = pd.Series({"A": ["score", "page `rank`"]})
+    gds.graph.nodeProperties.stream.return_value = pd.DataFrame({"nodeId": [0], "score": [3.0], "page `rank`": [1e20]})
+    from_gds(gds, G, size_property="page `rank`", node_radius_min_max=None, max_nodes=1, sampling="top_k")
+    assert gds.graph.filter.call_args.kwargs["node_filter"] == "n.`page ``rank``` >= 1e20"
+
+    # Non-finite values cannot be written in filters
+    for value in [float("inf"), float("nan")]:
+        gds.graph.nodeProperty.stream.return_value = pd.DataFrame({"nodeId": [0, 1], "propertyValue": [value, value]})
+        with pytest.raises(ValueError, match="requires finite values of 'score'"):
+            from_gds(gds, G, size_property="score", max_nodes=1, sampling="top_k")
+
+    # Graphs that are small enough are not sampled
+    from_gds(gds, sample, max_nodes=2, sampling="cnarw")
+    gds.graph.sample.cnarw.assert_not_called()
+
+    with pytest.raises(ValueError, match="requires a `size_property`"):
+        from_gds(gds, G, max_nodes=1, sampling="top_k")
+    with pytest.raises(ValueError, match="`sampling` must be one of"):
+        from_gds(gds, G, max_nodes=1, sampling="random")
+    with pytest.raises(ValueError, match="`max_nodes` must be a positive integer, but was 0"):
+        from_gds(gds, G, max_nodes=0)
+
+
+def test_from_gds_relationship_properties(mocker: MockerFixture) -> None:
+    from neo4j_viz.gds import from_gds
+
+    # Convert the relationships in several chunks
+    mocker.patch("neo4j_viz.gds._CHUNK_SIZE", 2)
+
+    gds = mocker.Mock()
+    gds.graph.nodeProperties.stream.return_value = pd.DataFrame({"nodeId": [0, 1, 2]})
+    gds.graph.relationshipProperties.stream.return_value = pd.DataFrame(
+        {
+            "sourceNodeId": [0, 1, 2],
+            "targetNodeId": [1, 2, 0],
+            "relationshipType": ["REL", "REL", "REL"],
+            "weight": [0.5, 1.5, 2.5],
+            "caption": ["a", "b", "c"],
+            "source": ["x", "y", "z"],
+        }
+    )
+    G = mocker.Mock()
+    G.name.return_value = "g"
+    G.node_properties.return_value = pd.Series({"A": []})
+    G.node_labels.return_value = ["A"]
+    G.relationship_properties.return_value = pd.Series(
+        {"REL": ["weight", "caption", "source"], "OTHER": ["weight", "cost"]}
+    )
+
+    VG = from_gds(gds, G, relationship_types=["REL"], relationship_properties=["weight", "caption", "source"])
+
+    gds.graph.relationshipProperties.stream.assert_called_once_with(
+        G, ["weight", "caption", "source"], ["REL"], separate_property_columns=True
+    )
+    gds.graph.relationships.stream.assert_not_called()
+    assert [(rel.source, rel.target, rel.caption, rel.properties) for rel in VG.relationships] == [
+        (0, 1, "a", {"relationshipType": "REL", "weight": 0.5, "source": "x"}),
+        (1, 2, "b", {"relationshipType": "REL", "weight": 1.5, "source": "y"}),
+        (2, 0, "c", {"relationshipType": "REL", "weight": 2.5, "source": "z"}),
+    ]
+
+    # Without properties only the topology of the selected types is streamed
+    gds.graph.relationships.stream.return_value = pd.DataFrame(
+        {"sourceNodeId": [0], "targetNodeId": [1], "relationshipType": ["OTHER"]}
+    )
+    from_gds(gds, G, relationship_types=["OTHER"])
+    gds.graph.relationships.stream.assert_called_once_with(G, ["OTHER"])
+
+    with pytest.raises(ValueError, match="There is no relationship type 'MISSING' in graph 'g'"):
+        from_gds(gds, G, relationship_types=["MISSING"])
+    with pytest.raises(
+        ValueError, match="There is no relationship property 'cost' for relationship type 'REL' in graph 'g'"
+    ):
+        from_gds(gds, G, relationship_properties=["cost"])
+    from_gds(gds, G, relationship_types=["OTHER"], relationship_properties=["cost"])
+
+
 @pytest.mark.requires_neo4j_and_gds
 def test_from_gds_node_errors(gds: Any) -> None:
     from neo4j_viz.gds import from_gds
@@ -163,6 +163,38 @@ def test_from_gql_create_sizes() -> None:
         assert created_node.properties == exp_node["properties"]
 
 
+def test_from_gql_create_property_projection() -> None:
+    query = """
+            CREATE
+              (a:User {name: 'Alice', age: 23, labels: ['Happy'], "caption": "A"}),
+              (b:User {name: "Bridget", age: 34}),
+              (a)-[:LINK {weight: 0.5, note: 'x', caption: "L"}]->(b);
+            """
+
+    VG = from_gql_create(
+        query,
+        size_property="age",
+        node_caption="name",
+        relationship_caption=None,
+        node_properties=["labels"],
+        relationship_properties=["weight"],
+    )
+
+    # Properties used for the sizes and captions, and properties named like fields, are still used
+    assert [node.caption for node in VG.nodes] == ["Alice", "Bridget"]
+    assert [node.size for node in VG.nodes] == [3.0, 60.0]
+    assert [node.properties for node in VG.nodes] == [{"labels": ["User"], "__labels": ["Happy"]}, {"labels": ["User"]}]
+    assert VG.relationships[0].caption == "L"
+    assert VG.relationships[0].properties == {"weight": 0.5, "type": "LINK"}
+
+    VG = from_gql_create(query, node_caption=None, relationship_caption="note", properties=False)
+
+    assert [node.caption for node in VG.nodes] == ["A", None]
+    assert [node.properties for node in VG.nodes] == [{}, {}]
+    assert VG.relationships[0].caption == "x"
+    assert VG.relationships[0].properties == {}
+
+
 def test_unbalanced_parentheses_snippet() -> None:
     query = "CREATE (a:User, (b:User })"
     with pytest.raises(ValueError, match=r"Unbalanced parentheses near: `.*\(b:User.*"):
@@ -0,0 +1,92 @@
+import pytest
+
+from neo4j_viz import Node, Relationship, VisualizationGraph
+from neo4j_viz._records import NodeRecord, RelationshipRecord
+
+
+def test_merge() -> None:
+    shared_node = Node(id=1, caption="B")
+    VG1 = VisualizationGraph(
+        nodes=[Node(id=0, caption="A", color="red", properties={"a": 1, "b": 1}), shared_node],
+        relationships=[Relationship(id="r0", source=0, target=1)],
+    )
+    VG2 = VisualizationGraph._from_records(
+        [NodeRecord(id=2), NodeRecord(id=0, caption="A2", properties={"b": 2, "c": 2})],
+        [RelationshipRecord(id="r0", source=0, target=1), RelationshipRecord(id="r1", source=0, target=2)],
+    )
+
+    merged = VisualizationGraph.merge(VG1, VG2)
+
+    assert merged.nodes == [
+        Node(id=0, caption="A2", color="red", properties={"a": 1, "b": 2, "c": 2}),
+        Node(id=1, caption="B"),
+        Node(id=2),
+    ]
+    assert [rel.id for rel in merged.relationships] == ["r0", "r1"]
+    # The merged graphs are not changed
+    assert VG1.nodes[0] == Node(id=0, caption="A", color="red", properties={"a": 1, "b": 1})
+
+    assert VisualizationGraph.merge(VG1, VG2, on_conflict="first").nodes[0] == VG1.nodes[0]
+    assert VisualizationGraph.merge(VG1, VG2, on_conflict="last").nodes[0] == VG2.nodes[1]
+
+    conflicts = []
+
+    def keep_first(a: Node, b: Node) -> Node:
+        conflicts.append((a.id, b.id))
+        return a
+
+    assert VisualizationGraph.merge(VG1, VG2, on_conflict=keep_first).nodes[0] == VG1.nodes[0]
+    assert conflicts == [(0, 0), ("r0", "r0")]
+
+    # Duplicates within a single graph are resolved too
+    assert [node.id for node in VisualizationGraph.merge(VisualizationGraph([Node(id=0), Node(id=0)], [])).nodes] == [0]
+    assert VisualizationGraph.merge().nodes == []
+
+
+def test_merge_copy() -> None:
+    node = Node(id=0, size=1, properties={"a": 1})
+    VG1 = VisualizationGraph([node, Node(id=1, size=2)], [])
+    VG2 = VisualizationGraph._from_records([NodeRecord(id=2, size=3, properties={"b": 1})], [])
+
+    merged = VisualizationGraph.merge(VG1, VG2)
+    merged.resize_nodes(node_radius_min_max=(10, 20))
+    merged.toggle_nodes_pinned({0: True, 2: True})
+    merged.nodes[0].properties["a"] = 2
+    merged.nodes[2].properties["b"] = 2
+
+    # Copies are changed, whether the merged graphs hold models or records
+    assert [node.size for node in merged.nodes] == [10, 15, 20]
+    assert node == Node(id=0, size=1, properties={"a": 1})
+    assert VG1.nodes[1] == Node(id=1, size=2)
+    assert VG2.nodes[0] == Node(id=2, size=3, properties={"b": 1})
+
+    shared = VisualizationGraph.merge(VG1, VG2, copy=False)
+    assert shared.nodes[0] is node
+    shared.resize_nodes(node_radius_min_max=(10, 20))
+    assert node.size == 10
+    assert VG2.nodes[0].size == 20
+
+
+def test_merge_mixed_id_types() -> None:
+    VG1 = VisualizationGraph([Node(id=1, caption="A"), Node(id=2)], [Relationship(id=0, source=1, target=2)])
+    VG2 = VisualizationGraph([Node(id="1", size=5), Node(id="3")], [Relationship(id="0", source="1", target="2")])
+
+    # IDs are compared as strings, like the renderer does, so that no ID is rendered twice
+    merged = VisualizationGraph.merge(VG1, VG2)
+    assert merged.nodes == [Node(id=1, caption="A", size=5), Node(id=2), Node(id="3")]
+    assert merged.relationships == [Relationship(id=0, source=1, target=2)]
+
+    # Entities that only differ in the types of their IDs do not conflict
+    same = VisualizationGraph([Node(id="2")], [Relationship(id="0", source="1", target="2")])
+    assert len(VisualizationGraph.merge(VG1, same, on_conflict="error").nodes) == 2
+
+
+def test_merge_errors() -> None:
+    VG1 = VisualizationGraph([Node(id=0, caption="A")], [])
+    VG2 = VisualizationGraph([Node(id=0, caption="B")], [])
+
+    assert VisualizationGraph.merge(VG1, VG1, on_conflict="error").nodes == VG1.nodes
+    with pytest.raises(ValueError, match="Conflicting nodes with ID '0'"):
+        VisualizationGraph.merge(VG1, VG2, on_conflict="error")
+    with pytest.raises(ValueError, match="`on_conflict` must be one of"):
+        VisualizationGraph.merge(VG1, VG2, on_conflict="other")
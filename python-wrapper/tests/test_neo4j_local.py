@@ -0,0 +1,361 @@
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any, Optional
+
+import neo4j
+import pytest
+from neo4j import AsyncResult, Record, Result
+
+import neo4j_viz.neo4j
+from neo4j_viz.neo4j import CacheInfo, QueryCache, from_neo4j, from_neo4j_async, from_neo4j_cached, from_neo4j_paged
+
+# Tests of the Neo4j integration that run without a database, on entities built like the driver does
+
+
+class FakeResult(Result):
+    def __init__(self, records: list[dict[str, Any]]) -> None:
+        self.records = [Record(record) for record in records]  # type: ignore[no-untyped-call]
+        self.consumed = 0
+
+    def __iter__(self) -> Iterator[Record]:
+        for record in self.records:
+            self.consumed += 1
+            yield record
+
+
+class FakeAsyncResult(AsyncResult):
+    def __init__(self, records: list[dict[str, Any]]) -> None:
+        self.records = [Record(record) for record in records]  # type: ignore[no-untyped-call]
+        self.consumed = 0
+
+    async def __aiter__(self) -> AsyncIterator[Record]:
+        # Like the driver, buffered records are returned without suspending
+        for record in self.records:
+            self.consumed += 1
+            yield record
+
+
+class FakeDriver:
+    # Serves pages of `records` for queries with `$skip` and `$limit` parameters, taking `latency` seconds per page.
+    # With `wait_for_sessions`, queries wait until that many sessions have been open at the same time.
+    def __init__(self, records: list[dict[str, Any]], latency: float = 0.0, wait_for_sessions: int = 0) -> None:
+        self.records = records
+        self.latency = latency
+        self.wait_for_sessions = wait_for_sessions
+        self.lock = threading.Condition()
+        self.open_sessions = 0
+        self.max_open_sessions = 0
+        self.runs: list[dict[str, Any]] = []
+
+    def session(self, database: Optional[str] = None) -> "FakeSession":
+        return FakeSession(self)
+
+
+class FakeSession:
+    def __init__(self, driver: FakeDriver) -> None:
+        self.driver = driver
+
+    def __enter__(self) -> "FakeSession":
+        with self.driver.lock:
+            self.driver.open_sessions += 1
+            self.driver.max_open_sessions = max(self.driver.max_open_sessions, self.driver.open_sessions)
+            self.driver.lock.notify_all()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        with self.driver.lock:
+            self.driver.open_sessions -= 1
+
+    def run(self, query: str, parameters: Optional[dict[str, Any]] = None) -> FakeResult:
+        parameters = parameters or {}
+        with self.driver.lock:
+            self.driver.runs.append(parameters)
+            self.driver.lock.wait_for(
+                lambda: self.driver.max_open_sessions >= self.driver.wait_for_sessions, timeout=10
+            )
+        time.sleep(self.driver.latency)
+        if "skip" not in parameters:
+            return FakeResult(self.driver.records)
+        skip, limit = parameters["skip"], parameters["limit"]
+        return FakeResult(self.driver.records[skip : skip + limit])
+
+
+def make_graph(num_nodes: int) -> tuple[list[neo4j.graph.Node], list[neo4j.graph.Relationship]]:
+    # A path of nodes, with a relationship from every node to the next one
+    graph = neo4j.graph.Graph()
+    nodes = [neo4j.graph.Node(graph, f"n{i}", i, ["Person"], {"name": f"P{i}", "age": i}) for i in range(num_nodes)]
+    relationships = []
+    for i in range(num_nodes - 1):
+        rel = graph.relationship_type("KNOWS")(graph, f"r{i}", i, {"since": 2000 + i})
+        rel._start_node = nodes[i]
+        rel._end_node = nodes[i + 1]
+        relationships.append(rel)
+    return nodes, relationships
+
+
+def test_from_neo4j_streamed_result() -> None:
+    nodes, rels = make_graph(4)
+    path = neo4j.graph.Path(nodes[2], rels[2])
+    result = FakeResult(
+        [
+            # A relationship before its nodes
+            {"r": rels[0], "a": nodes[0]},
+            {"a": nodes[1], "b": nodes[0], "r": rels[1]},
+            {"p": path},
+            {"nested": {"list": [nodes[3], rels[2]]}, "other": 1},
+        ]
+    )
+
+    VG = from_neo4j(result)
+
+    assert [node.id for node in VG.nodes] == ["n0", "n1", "n2", "n3"]
+    assert [(rel.id, rel.source, rel.target) for rel in VG.relationships] == [
+        ("r0", "n0", "n1"),
+        ("r1", "n1", "n2"),
+        ("r2", "n2", "n3"),
+    ]
+    assert VG.nodes[0].caption == "Person"
+    assert VG.nodes[0].properties == {"name": "P0", "age": 0, "labels": ["Person"]}
+    assert VG.relationships[0].properties == {"since": 2000, "type": "KNOWS"}
+
+
+def test_from_neo4j_property_projection() -> None:
+    graph = neo4j.graph.Graph()
+    node = neo4j.graph.Node(graph, "n0", 0, ["Person"], {"name": "P0", "age": 30, "caption": "Me", "bio": "..."})
+    rel = graph.relationship_type("KNOWS")(graph, "r0", 0, {"since": 2000, "weight": 1.5})
+    rel._start_node = node
+    rel._end_node = node
+    records = [{"r": rel}]
+
+    VG = from_neo4j(
+        FakeResult(records),
+        size_property="age",
+        node_caption=None,
+        node_radius_min_max=None,
+        node_properties=["name"],
+        relationship_properties=["weight"],
+    )
+
+    # Properties named like fields are still used as fields
+    assert VG.nodes[0].caption == "Me"
+    assert VG.nodes[0].size == 30
+    assert VG.nodes[0].properties == {"name": "P0", "labels": ["Person"]}
+    assert VG.relationships[0].properties == {"weight": 1.5, "type": "KNOWS"}
+
+    VG = from_neo4j(FakeResult(records), node_caption="name", relationship_caption="since", properties=False)
+
+    assert VG.nodes[0].caption == "P0"
+    assert VG.nodes[0].properties == {}
+    assert VG.relationships[0].caption == "2000"
+    assert VG.relationships[0].properties == {}
+
+
+def test_from_neo4j_max_nodes() -> None:
+    nodes, rels = make_graph(10)
+    result = FakeResult([{"r": rel} for rel in rels])
+
+    VG = from_neo4j(result, max_nodes=4)
+
+    # Consuming stops with the record that reaches the limit
+    assert result.consumed == 3
+    assert [node.id for node in VG.nodes] == ["n0", "n1", "n2", "n3"]
+    assert [rel.id for rel in VG.relationships] == ["r0", "r1", "r2"]
+
+    # Relationships without both of their nodes are left out
+    result = FakeResult([{"a": nodes[0], "b": nodes[5], "r": rels[0]}])
+    VG = from_neo4j(result, max_nodes=2)
+    assert [node.id for node in VG.nodes] == ["n0", "n5"]
+    assert VG.relationships == []
+
+    graph = nodes[0].graph
+    graph._nodes.update({node.element_id: node for node in nodes})
+    graph._relationships.update({rel.element_id: rel for rel in rels})
+    VG = from_neo4j(graph, max_nodes=3)
+    assert len(VG.nodes) == 3
+    assert len(VG.relationships) == 2
+
+    with pytest.raises(ValueError, match="`max_nodes` must be a positive integer, but was 0"):
+        from_neo4j(graph, max_nodes=0)
+
+
+def test_from_neo4j_async(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(neo4j_viz.neo4j, "_ASYNC_BATCH_SIZE", 2)
+    nodes, rels = make_graph(10)
+    records = [{"r": rel} for rel in rels]
+
+    async def run() -> None:
+        result = FakeAsyncResult(records)
+        progress_seen_by_other_task = []
+
+        async def other_task() -> None:
+            # Only starts once the conversion suspends
+            progress_seen_by_other_task.append(result.consumed)
+
+        VG, _ = await asyncio.gather(from_neo4j_async(result), other_task())
+
+        expected = from_neo4j(FakeResult(records))
+        assert VG.nodes == expected.nodes
+        assert VG.relationships == expected.relationships
+
+        # The other task ran while the result was being consumed
+        assert progress_seen_by_other_task == [2]
+
+        result = FakeAsyncResult(records)
+        VG = await from_neo4j_async(result, max_nodes=4)
+        assert result.consumed == 3
+        assert [node.id for node in VG.nodes] == ["n0", "n1", "n2", "n3"]
+
+        with pytest.raises(ValueError, match="Expected `neo4j.AsyncResult`"):
+            await from_neo4j_async(FakeResult(records))  # type: ignore[arg-type]
+
+    asyncio.run(run())
+
+
+def test_from_neo4j_paged() -> None:
+    nodes, rels = make_graph(101)
+    # Every node once on its own, and once as endpoint of a relationship
+    records = [{"n": node} for node in nodes] + [{"r": rel} for rel in rels]
+    driver = FakeDriver(records)
+
+    VG = from_neo4j_paged(driver, "... SKIP $skip LIMIT $limit", page_size=7, parameters={"x": 1}, max_sessions=3)  # type: ignore[arg-type]
+
+    expected = from_neo4j(FakeResult(records))
+    assert VG.nodes == expected.nodes
+    assert VG.relationships == expected.relationships
+
+    assert driver.max_open_sessions <= 3
+    assert all(run["x"] == 1 and run["limit"] == 7 for run in driver.runs)
+    # All pages up to the first short page are fetched, and a few more may already have been started
+    assert {run["skip"] for run in driver.runs} >= set(range(0, len(records), 7))
+
+    # Endpoint nodes without labels and properties are completed by the nodes of other pages
+    graph = neo4j.graph.Graph()
+    endpoint = neo4j.graph.Node(graph, "n1", 1)
+    rel = graph.relationship_type("KNOWS")(graph, "r", 0, {})
+    rel._start_node = nodes[0]
+    rel._end_node = endpoint
+    VG = from_neo4j_paged(FakeDriver([{"r": rel}, {"n": nodes[1]}]), "", page_size=1)  # type: ignore[arg-type]
+    assert VG.nodes[1].properties == {"name": "P1", "age": 1, "labels": ["Person"]}
+
+    VG = from_neo4j_paged(driver, "", page_size=7, max_nodes=10)  # type: ignore[arg-type]
+    assert [node.id for node in VG.nodes] == [f"n{i}" for i in range(10)]
+
+    with pytest.raises(ValueError, match="`max_sessions` must be a positive integer, but was 0"):
+        from_neo4j_paged(driver, "", max_sessions=0)  # type: ignore[arg-type]
+
+
+def test_from_neo4j_paged_concurrency() -> None:
+    nodes, _ = make_graph(40)
+    records = [{"n": node} for node in nodes]
+
+    driver = FakeDriver(records)
+    from_neo4j_paged(driver, "", page_size=5, max_sessions=1)  # type: ignore[arg-type]
+    assert driver.max_open_sessions == 1
+
+    # The pages are fetched by four sessions at the same time
+    driver = FakeDriver(records, wait_for_sessions=4)
+    VG = from_neo4j_paged(driver, "", page_size=5, max_sessions=4)  # type: ignore[arg-type]
+    assert driver.max_open_sessions == 4
+    assert len(VG.nodes) == 40
+
+
+def test_from_neo4j_cached(tmp_path: Path) -> None:
+    nodes, rels = make_graph(5)
+    driver = FakeDriver([{"r": rel} for rel in rels])
+    cache = QueryCache(tmp_path / "cache.db")
+
+    VG = from_neo4j_cached(driver, "MATCH ...", cache, parameters={"x": 1}, size_property="age")  # type: ignore[arg-type]
+    cached_VG = from_neo4j_cached(driver, "MATCH ...", cache, parameters={"x": 1}, size_property="age")  # type: ignore[arg-type]
+
+    assert len(driver.runs) == 1
+    assert cached_VG.nodes == VG.nodes
+    assert cached_VG.relationships == VG.relationships
+    assert cache.info() == CacheInfo(hits=1, misses=1, skipped=0, entries=1, size_bytes=cache.info().size_bytes)
+
+    # Other parameters and options are cached separately
+    from_neo4j_cached(driver, "MATCH ...", cache, parameters={"x": 2}, size_property="age")  # type: ignore[arg-type]
+    from_neo4j_cached(driver, "MATCH ...", cache, parameters={"x": 1})  # type: ignore[arg-type]
+    assert len(driver.runs) == 3
+
+    # The cache file is shared with other cache objects, for example in other processes
+    other_cache = QueryCache(tmp_path / "cache.db")
+    from_neo4j_cached(driver, "MATCH ...", other_cache, parameters={"x": 1})  # type: ignore[arg-type]
+    assert len(driver.runs) == 3
+    assert other_cache.info() == CacheInfo(hits=1, misses=0, skipped=0, entries=3, size_bytes=cache.info().size_bytes)
+
+
+def test_query_cache_expiry_and_eviction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr(time, "time", lambda: now)
+    VG = from_neo4j(FakeResult([{"n": node} for node in make_graph(10)[0]]))
+
+    cache = QueryCache(tmp_path / "cache.db", ttl=60)
+    cache.put("a", VG)
+    now += 59
+    assert cache.get("a") is not None
+    now += 1
+    assert cache.get("a") is None
+    assert cache.info().entries == 0
+
+    cache = QueryCache(tmp_path / "lru.db", ttl=None)
+    cache.put("a", VG)
+    entry_size = cache.info().size_bytes
+    cache = QueryCache(tmp_path / "lru.db", ttl=None, max_bytes=2 * entry_size)
+    now += 1
+    cache.put("b", VG)
+    now += 1
+    # Accessing "a" makes "b" the least recently used entry
+    assert cache.get("a") is not None
+    now += 1
+    cache.put("c", VG)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.info().entries == 2
+    assert cache.info().size_bytes == 2 * entry_size
+
+    # Replacing an entry keeps the total size up to date
+    cache.put("c", VG)
+    assert cache.info() == (3, 1, 0, 2, 2 * entry_size)
+
+    cache.clear()
+    assert cache.info().entries == 0
+    assert cache.info().size_bytes == 0
+
+    # Graphs with property values that cannot be stored are not cached
+    VG.nodes[0].properties["value"] = object()
+    with pytest.warns(UserWarning, match="cannot be stored: Property values of type object cannot be serialized"):
+        cache.put("d", VG)
+    assert cache.get("d") is None
+    assert cache.info().skipped == 1
+
+    del VG.nodes[0].properties["value"]
+    tiny_cache = QueryCache(tmp_path / "tiny.db", max_bytes=1)
+    with pytest.warns(UserWarning, match="exceeds `max_bytes`"):
+        tiny_cache.put("e", VG)
+    assert tiny_cache.info().skipped == 1
+    assert tiny_cache.info().entries == 0
+
+    with pytest.raises(ValueError, match="`ttl` must be positive, but was 0"):
+        QueryCache(tmp_path / "cache.db", ttl=0)
+
+
+def test_expand_with_driver() -> None:
+    nodes, rels = make_graph(4)
+    VG = from_neo4j(FakeResult([{"r": rels[0]}]))
+    # The query returns the relationships of n1, except the known r0
+    driver = FakeDriver([{"r": rels[1]}])
+
+    delta = VG.expand(driver, ["n1"], limit=5, database="db")  # type: ignore[arg-type]
+
+    assert driver.runs == [
+        {"node_ids": ["n1"], "known_relationship_ids": ["r0"], "known_node_ids": ["n0", "n1"], "limit": 5}
+    ]
+    assert [node.id for node in delta.added_nodes] == ["n2"]
+    assert [rel.id for rel in delta.added_relationships] == ["r1"]
+    assert delta.updated_nodes == []
+    assert [node.id for node in VG.nodes] == ["n0", "n1", "n2"]
+    assert VG.nodes[2].properties == {"name": "P2", "age": 2, "labels": ["Person"]}
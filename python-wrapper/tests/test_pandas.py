@@ -1,3 +1,7 @@
+from collections.abc import Iterator
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Optional
+
 import pytest
 from pandas import DataFrame
 from pydantic_extra_types.color import Color
@@ -133,6 +137,137 @@ def test_from_dfs() -> None:
     assert VG.relationships[1].caption == "REL2"
 
 
+def test_from_dfs_chunked() -> None:
+    nodes = DataFrame({"id": list(range(10)), "caption": [f"N{i}" for i in range(10)], "rank": list(range(10))})
+    relationships = DataFrame({"source": list(range(10)), "target": [(i + 1) % 10 for i in range(10)]})
+
+    def rel_chunks() -> Iterator[DataFrame]:
+        for start in range(0, 10, 4):
+            yield relationships.iloc[start : start + 4]
+
+    VG = from_dfs(nodes, rel_chunks(), chunk_size=3)
+
+    assert [node.id for node in VG.nodes] == list(range(10))
+    assert [node.properties for node in VG.nodes] == [{"rank": i} for i in range(10)]
+    assert [(rel.source, rel.target) for rel in VG.relationships] == [(i, (i + 1) % 10) for i in range(10)]
+
+    # The implicit nodes are created in order of first appearance
+    VG = from_dfs(None, relationships.iloc[::-1], chunk_size=3)
+    assert [node.id for node in VG.nodes] == [9, 0, 8, 7, 6, 5, 4, 3, 2, 1]
+
+    with pytest.raises(ValueError, match="`chunk_size` must be a positive integer, but was 0"):
+        from_dfs(nodes, relationships, chunk_size=0)
+
+
+def test_from_dfs_workers() -> None:
+    nodes = DataFrame(
+        {
+            "id": list(range(10)),
+            "caption": [f"N{i}" for i in range(10)],
+            "size": [float(i + 1) for i in range(10)],
+            "active": [i % 2 == 0 for i in range(10)],
+        }
+    )
+    relationships = [
+        DataFrame({"source": list(range(5)), "target": [i + 1 for i in range(5)], "weight": [0.5] * 5}),
+        DataFrame({"source": list(range(5, 10)), "target": [0] * 5, "weight": [1.5] * 5}),
+    ]
+
+    VG = from_dfs(nodes, relationships, node_radius_min_max=None, workers=2, chunk_size=3)
+    expected = from_dfs(nodes, relationships, node_radius_min_max=None)
+
+    assert VG.nodes == expected.nodes
+    # Relationships without an ID column get random IDs
+    assert [(rel.source, rel.target, rel.properties) for rel in VG.relationships] == [
+        (rel.source, rel.target, rel.properties) for rel in expected.relationships
+    ]
+
+    invalid = DataFrame({"id": list(range(10)), "size": [1.0] * 7 + [-1.0] + [1.0] * 2})
+    with pytest.raises(
+        ValueError,
+        match=r"Error for node column 'size' with provided input '-1.0'. Reason: Input should be greater than or equal to 0 \(DataFrame 0, row 7\)",
+    ):
+        from_dfs(invalid, [], workers=2, chunk_size=3)
+
+    with pytest.raises(ValueError, match="`workers` must be a positive integer, but was 0"):
+        from_dfs(nodes, relationships, workers=0)
+
+
+def test_convert_df_workers_bounded() -> None:
+    from neo4j_viz.pandas import _convert_df, _convert_shared_rows
+
+    class CountingExecutor(Executor):
+        # Runs the conversions right away, and records how many of their results are not yet collected at most
+        def __init__(self) -> None:
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+            executor = self
+
+            class CountedFuture(Future[Any]):
+                def result(self, timeout: Optional[float] = None) -> Any:
+                    executor.in_flight -= 1
+                    return super().result(timeout)
+
+            future = CountedFuture()
+            future.set_result(fn(*args, **kwargs))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return future
+
+    nodes = DataFrame({"id": list(range(20)), "color": ["#ff0000", "blue"] * 10, "weight": [0.5] * 20})
+    executor = CountingExecutor()
+
+    converted = _convert_df(nodes, Node, None, 0, 1, executor, 2, True)
+
+    assert executor.max_in_flight == 4
+    assert [node.to_model() for node in converted] == _convert_df(nodes, Node, None, 0, None, None, 1, True)
+
+    # Workers send back plain values of the validated top level columns only
+    validated = _convert_shared_rows(
+        ["id", "color"], None, {}, {0: nodes["id"][:2], 1: nodes["color"][:2]}, 20, 0, 2, Node, 0
+    )
+    assert validated == [[0, 1], ["#ff0000", "#0000ff"]]
+
+
+def test_from_dfs_keeps_column_types() -> None:
+    nodes = DataFrame({"id": [0, 1], "size": [1.5, 2.5], "count": [3, 4]})
+
+    VG = from_dfs(nodes, [], node_radius_min_max=None)
+
+    assert VG.nodes[0].properties == {"count": 3}
+    assert isinstance(VG.nodes[0].properties["count"], int)
+
+
+def test_from_dfs_without_validation() -> None:
+    nodes = DataFrame(
+        {
+            "id": [0, 1],
+            "caption": ["A", "B"],
+            "size": [1337, 42],
+            "color": ["#FF0000", "blue"],
+            "captionAlign": ["top", "bottom"],
+            "instrument": ["piano", "guitar"],
+        }
+    )
+    relationships = DataFrame({"id": [10, 11], "source": [0, 1], "target": [1, 0], "weight": [1.0, 2.0]})
+
+    VG = from_dfs(nodes, relationships, validate=False)
+    expected = from_dfs(nodes, relationships)
+
+    assert VG.nodes == expected.nodes
+    assert VG.relationships == expected.relationships
+    assert [node.to_dict() for node in VG.nodes] == [node.to_dict() for node in expected.nodes]
+
+    # Relationships without an ID column still get an ID
+    VG = from_dfs(None, relationships.drop(columns="id"), validate=False)
+    assert all(isinstance(rel.id, str) for rel in VG.relationships)
+
+    with pytest.raises(ValueError, match="Mandatory node column 'id' is missing"):
+        from_dfs(nodes.drop(columns="id"), [], validate=False)
+
+
 def test_node_errors() -> None:
     nodes = DataFrame(
         {"caption": ["A", "B"], "size": [1337, 42], "color": "#FF0000", "instrument": ["piano", "guitar"]}
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+from neo4j_viz.node import Node
+from neo4j_viz.parquet import from_parquet
+
+
+@pytest.fixture
+def gds_export(tmp_path: Path) -> tuple[Path, Path]:
+    nodes_path = tmp_path / "nodes.parquet"
+    rels_path = tmp_path / "rels.parquet"
+    pq.write_table(
+        pa.table(
+            {
+                "nodeId": [0, 1, 2, 3],
+                "labels": ["Paper"] * 4,
+                "subject": [1, 1, 2, 2],
+                "features": [[0, 1], [1, 0], [1, 1], [0, 0]],
+            }
+        ),
+        nodes_path,
+        row_group_size=2,
+    )
+    pq.write_table(
+        pa.table(
+            {
+                "sourceNodeId": [0, 1, 2, 3],
+                "targetNodeId": [1, 2, 3, 0],
+                "relationshipType": ["CITES"] * 4,
+            }
+        ),
+        rels_path,
+        compression="none",
+    )
+    return nodes_path, rels_path
+
+
+def test_from_parquet(gds_export: tuple[Path, Path]) -> None:
+    nodes_path, rels_path = gds_export
+
+    VG = from_parquet(nodes_path, rels_path, node_properties=["subject"], relationship_properties=[])
+
+    assert [node.id for node in VG.nodes] == [0, 1, 2, 3]
+    assert [node.properties for node in VG.nodes] == [{"subject": 1}, {"subject": 1}, {"subject": 2}, {"subject": 2}]
+    assert [(rel.source, rel.target) for rel in VG.relationships] == [(0, 1), (1, 2), (2, 3), (3, 0)]
+    assert all(rel.properties == {} for rel in VG.relationships)
+
+
+def test_from_parquet_filters(gds_export: tuple[Path, Path]) -> None:
+    nodes_path, rels_path = gds_export
+
+    VG = from_parquet(
+        nodes_path,
+        [rels_path],
+        node_filter=pc.field("subject") == 2,
+        relationship_filter=[("sourceNodeId", ">=", 2)],
+        memory_map=True,
+    )
+
+    assert [node.id for node in VG.nodes] == [2, 3]
+    assert VG.nodes[0].properties == {"labels": "Paper", "subject": 2, "features": [1, 1]}
+    assert [(rel.source, rel.target) for rel in VG.relationships] == [(2, 3), (3, 0)]
+
+    VG = from_parquet(None, rels_path, relationship_filter=[("targetNodeId", "==", 0)])
+    assert VG.nodes == [Node(id=3), Node(id=0)]
+
+
+def test_from_parquet_missing_property(gds_export: tuple[Path, Path]) -> None:
+    nodes_path, rels_path = gds_export
+
+    with pytest.raises(ValueError, match=r"The node properties \['year'\] are not columns of the Parquet data"):
+        from_parquet(nodes_path, rels_path, node_properties=["year"])
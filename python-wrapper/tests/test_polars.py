@@ -0,0 +1,50 @@
+import polars as pl
+import pytest
+from pydantic_extra_types.color import Color
+
+from neo4j_viz.node import Node
+from neo4j_viz.polars import from_polars
+
+
+def test_from_polars() -> None:
+    nodes = pl.DataFrame(
+        {"id": [0, 1], "caption": ["A", "B"], "size": [1337, 42], "color": "#FF0000", "instrument": ["piano", "guitar"]}
+    )
+    relationships = pl.DataFrame({"source": [0, 1], "target": [1, 0], "caption": ["REL", "REL2"], "weight": [1.0, 2.0]})
+
+    VG = from_polars(nodes, relationships, node_radius_min_max=(42, 1337))
+
+    assert len(VG.nodes) == 2
+    assert VG.nodes[0].id == 0
+    assert VG.nodes[0].caption == "A"
+    assert VG.nodes[0].size == 1337
+    assert VG.nodes[0].color == Color("#ff0000")
+    assert VG.nodes[0].properties == {"instrument": "piano"}
+    assert VG.nodes[1].properties == {"instrument": "guitar"}
+
+    assert len(VG.relationships) == 2
+    assert VG.relationships[1].source == 1
+    assert VG.relationships[1].target == 0
+    assert VG.relationships[1].caption == "REL2"
+    assert VG.relationships[1].properties == {"weight": 2.0}
+
+
+def test_from_rel_polars() -> None:
+    relationships = [
+        pl.DataFrame({"source": [0, 1], "target": [1, 0]}),
+        pl.DataFrame({"source": [2, 3], "target": [1, 0]}),
+    ]
+
+    VG = from_polars(None, relationships)
+
+    assert len(VG.relationships) == 4
+    assert VG.nodes == [Node(id=id) for id in [0, 1, 2, 3]]
+
+
+def test_from_polars_errors() -> None:
+    relationships = pl.DataFrame({"source": [0, 1], "target": [1, 0], "caption_size": [1.0, -300.0]})
+    with pytest.raises(
+        ValueError,
+        match=r"Error for relationship column 'caption_size' with provided input '-300.0'. Reason: Input should be greater than 0 \(DataFrame 0, row 1\)",
+    ):
+        from_polars(None, relationships)
@@ -0,0 +1,78 @@
+from pydantic_extra_types.color import Color
+
+from neo4j_viz import Node, Relationship, VisualizationGraph
+from neo4j_viz._records import NodeRecord, RelationshipRecord
+from neo4j_viz.nvl import NVL
+from neo4j_viz.options import CaptionAlignment
+
+
+def test_records_have_model_fields() -> None:
+    assert NodeRecord.__slots__ == tuple(Node.model_fields)
+    assert RelationshipRecord.__slots__ == tuple(Relationship.model_fields)
+
+
+def test_record_to_model() -> None:
+    node = Node(
+        id=1,
+        caption="A",
+        caption_align=CaptionAlignment.TOP,
+        caption_size=2,
+        size=10,
+        color="red",
+        pinned=True,
+        x=1.5,
+        y=-2,
+        properties={"a": [1, 2]},
+    )
+    record = NodeRecord(
+        id=1,
+        caption="A",
+        caption_align=CaptionAlignment.TOP,
+        caption_size=2,
+        size=10,
+        color=Color("red"),
+        pinned=True,
+        x=1.5,
+        y=-2,
+        properties={"a": [1, 2]},
+    )
+
+    assert record.to_model() == node
+    assert record.to_model().model_fields_set == node.model_fields_set
+    assert record.payload() == node.model_dump(exclude={"id", "properties"}, exclude_none=True, by_alias=True)
+
+    rel = Relationship(id="r", source=1, target=2, caption="R", caption_size=1.5, color="#00ff00")
+    rel_record = RelationshipRecord(id="r", source=1, target=2, caption="R", caption_size=1.5, color=Color("#00ff00"))
+
+    assert rel_record.to_model() == rel
+    assert rel_record.payload() == rel.model_dump(
+        exclude={"id", "source", "target", "properties"}, exclude_none=True, by_alias=True
+    )
+
+    # Relationships get a random ID, like the model
+    assert isinstance(RelationshipRecord(source=1, target=2).id, str)
+
+
+def test_graph_from_records() -> None:
+    node_records = [NodeRecord(id=0, size=1), NodeRecord(id=1, size=2, properties={"a": 1})]
+    rel_records = [RelationshipRecord(id="r", source=0, target=1, caption="R")]
+    VG = VisualizationGraph._from_records(node_records, rel_records)
+    expected = VisualizationGraph(
+        [Node(id=0, size=1), Node(id=1, size=2, properties={"a": 1})],
+        [Relationship(id="r", source=0, target=1, caption="R")],
+    )
+
+    # Records are used as they are, without creating models
+    VG.resize_nodes(node_radius_min_max=(5, 10))
+    expected.resize_nodes(node_radius_min_max=(5, 10))
+    assert NVL.serialize_graph(VG._node_entities(), VG._relationship_entities(), None, True) == NVL.serialize_graph(
+        expected.nodes, expected.relationships, None, True
+    )
+    assert VG.fingerprint() == expected.fingerprint()
+
+    # Models are created once, on first access
+    assert VG.nodes == expected.nodes
+    assert VG.relationships == expected.relationships
+    VG.nodes[0].caption = "changed"
+    assert VG.nodes[0].caption == "changed"
+    assert VG._node_entities() is VG.nodes
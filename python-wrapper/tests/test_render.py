@@ -1,13 +1,15 @@
+import json
 import re
 from pathlib import Path
 from typing import Any
 
 import pytest
+from pytest_mock import MockerFixture
 from selenium import webdriver
 
 from neo4j_viz import Node, Relationship, VisualizationGraph
 from neo4j_viz.nvl import NVL
-from neo4j_viz.options import Layout, Renderer
+from neo4j_viz.options import CaptionAlignment, Layout, Renderer
 
 render_cases = {
     "default": {},
@@ -106,8 +108,154 @@ def test_render_non_json_serializable() -> None:
             "non-json-serializable": now,
         },
     )
-    assert str(now) in NVL._serialize_entity(node)
+    assert str(now) in NVL._serialize_properties(node.properties)
 
     VG = VisualizationGraph(nodes=[node], relationships=[])
     # Should not raise an error
     VG.render()
+
+
+def test_render_property_encoding() -> None:
+    import datetime
+
+    import numpy as np
+    import pandas as pd
+    from neo4j.spatial import CartesianPoint
+    from neo4j.time import Date, Duration
+
+    properties = {
+        "embedding": np.array([0.5, 1.5], dtype=np.float32),
+        "features": np.zeros(1433, dtype=np.int64),
+        "missing": [np.nan, pd.NA, pd.NaT],
+        "score": np.float64(np.inf),
+        "count": np.int32(3),
+        "flag": np.bool_(True),
+        "created": pd.Timestamp("2024-01-01 12:00"),
+        "published": Date(2024, 5, 6),
+        "duration": Duration(months=1, days=2),
+        "location": CartesianPoint((1.0, 2.0)),
+        "tags": ("a", datetime.date(2024, 1, 1)),
+    }
+
+    assert json.loads(NVL._serialize_properties(properties)) == {
+        "embedding": [0.5, 1.5],
+        "features": "[0, 0, 0, ..., 0, 0, 0] (shape (1433,), int64)",
+        "missing": ["nan", None, None],
+        "score": "inf",
+        "count": 3,
+        "flag": True,
+        "created": "2024-01-01 12:00:00",
+        "published": "2024-05-06",
+        "duration": "P1M2D",
+        "location": "point({srid: 7203, x: 1.0, y: 2.0})",
+        "tags": ["a", "2024-01-01"],
+    }
+
+    nested = {"scores": {"a": np.nan, "b": [np.float64(1.5), np.inf], 1: pd.NaT, datetime.date(2024, 1, 1): "x"}}
+    assert json.loads(NVL._serialize_properties(nested)) == {
+        "scores": {"a": "nan", "b": [1.5, "inf"], "1": None, "2024-01-01": "x"}
+    }
+
+    features = json.loads(NVL._serialize_properties(properties, max_array_values=None))["features"]
+    assert features == [0] * 1433
+
+
+def test_render_interned_ids() -> None:
+    nodes = [Node(id="4:abc:0", caption="A", properties={"name": "Alice"}), Node(id=1, caption="B")]
+    relationships = [
+        Relationship(id="5:abc:0", source="4:abc:0", target="1", properties={"year": 2025}),
+        Relationship(id="5:abc:1", source=1, target=2),
+    ]
+
+    node_ids, rel_ids, original_ids = NVL._intern_ids(nodes, relationships)
+    assert node_ids == [0, 1]
+    assert rel_ids == [(3, 0, 1), (4, 1, 2)]
+    assert original_ids == ["4:abc:0", 1, 2, "5:abc:0", "5:abc:1"]
+
+    assert NVL._serialize_entity(nodes[0], {"id": 0}) == '{"id": 0, "caption": "A"}'
+    assert NVL._serialize_entity(relationships[0], {"id": 3, "from": 0, "to": 1}) == '{"id": 3, "from": 0, "to": 1}'
+
+    VG = VisualizationGraph(nodes=nodes, relationships=relationships)
+
+    html = VG.render()
+    assert '[{"id": 0, "caption": "A"},{"id": 1, "caption": "B"}]' in html.data
+    assert '[{"id": 3, "from": 0, "to": 1},{"id": 4, "from": 1, "to": 2}]' in html.data
+    assert (
+        '{"ids":["4:abc:0", 1, 2, "5:abc:0", "5:abc:1"],"properties":[{"name": "Alice"},null,null,{"year": 2025},null]}'
+        in html.data
+    )
+
+    html = VG.render(show_hover_tooltip=False)
+    assert "Alice" not in html.data
+
+
+def test_render_web_workers(mocker: MockerFixture) -> None:
+    VG = VisualizationGraph(nodes=[Node(id=0), Node(id=1)], relationships=[Relationship(source=0, target=1)])
+
+    html = VG.render()
+    assert '"disableWebWorkers": true' in html.data
+
+    mocker.patch.object(NVL, "_worker_scripts", return_value={"CoseBilkentLayout": "onconnect = () => {}</script>"})
+    html = VG.render(use_web_workers=True)
+    assert '"disableWebWorkers": false' in html.data
+    assert '{"workerScripts": {"CoseBilkentLayout": "onconnect = () => {}<\\/script>"}}' in html.data
+
+
+def test_render_web_workers_from_files(tmp_path: Path, mocker: MockerFixture) -> None:
+    VG = VisualizationGraph(nodes=[Node(id=0), Node(id=1)], relationships=[Relationship(source=0, target=1)])
+    mocker.patch("neo4j_viz.nvl.files", return_value=tmp_path)
+    entry_point = tmp_path / "resources" / "nvl_entrypoint"
+    entry_point.mkdir(parents=True)
+    icons = tmp_path / "resources" / "icons"
+    icons.mkdir()
+    for name in ["base.js", "styles.css"]:
+        (entry_point / name).write_text("")
+    for name in ["zoom-in.svg", "zoom-out.svg", "screenshot.svg"]:
+        (icons / name).write_text("")
+
+    with pytest.warns(UserWarning, match="The layout web workers are not bundled"):
+        html = VG.render(use_web_workers=True)
+    assert '"disableWebWorkers": true' in html.data
+    assert "workerScripts" not in html.data
+
+    (entry_point / "HierarchicalLayout.js").write_text("onconnect = () => {}")
+    html = VG.render(use_web_workers=True)
+    assert '"disableWebWorkers": false' in html.data
+    assert '{"workerScripts": {"HierarchicalLayout": "onconnect = () => {}"}}' in html.data
+
+
+@pytest.mark.requires_js_build
+def test_layout_workers_bundled() -> None:
+    # The worker chunks are produced by the JS build, see scripts/build_js_applet.sh
+    scripts = NVL()._worker_scripts()
+
+    assert sorted(scripts) == sorted(NVL.LAYOUT_WORKERS)
+    assert all(scripts.values())
+
+
+def test_render_progressive() -> None:
+    VG = VisualizationGraph(nodes=[Node(id=0), Node(id=1)], relationships=[Relationship(source=0, target=1)])
+
+    html = VG.render(progressive_chunk_size=1000)
+    assert '{"progressiveChunkSize": 1000}' in html.data
+
+    with pytest.raises(ValueError, match="`progressive_chunk_size` must be a positive integer, but was 0"):
+        VG.render(progressive_chunk_size=0)
+
+
+def test_render_strips_unsupported_fields() -> None:
+    assert Renderer.WEB_GL.unsupported_fields("node") == {"caption", "captionAlign", "captionSize"}
+    assert Renderer.CANVAS.unsupported_fields("relationship") == set()
+
+    nodes = [Node(id=0, caption="A", caption_size=2, color="#ff0000"), Node(id=1, caption="B")]
+    relationships = [Relationship(source=0, target=1, caption="REL", caption_align=CaptionAlignment.TOP)]
+    VG = VisualizationGraph(nodes=nodes, relationships=relationships)
+
+    html = VG.render(renderer=Renderer.CANVAS)
+    assert '{"id": 0, "caption": "A", "captionSize": 2, "color": "#ff0000"}' in html.data
+    assert '{"id": 2, "from": 0, "to": 1, "caption": "REL", "captionAlign": "top"}' in html.data
+
+    with pytest.warns(UserWarning, match="the WebGL renderer cannot render text"):
+        html = VG.render(renderer=Renderer.WEB_GL)
+    assert '[{"id": 0, "color": "#ff0000"},{"id": 1}]' in html.data
+    assert '[{"id": 2, "from": 0, "to": 1}]' in html.data
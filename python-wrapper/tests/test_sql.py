@@ -0,0 +1,69 @@
+import sqlite3
+from collections.abc import Iterator
+
+import pytest
+
+from neo4j_viz.node import Node
+from neo4j_viz.sql import from_sql
+
+
+@pytest.fixture
+def connection() -> Iterator[sqlite3.Connection]:
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(
+        """
+        CREATE TABLE person (id INTEGER, name TEXT, size INTEGER, age INTEGER);
+        INSERT INTO person VALUES (1, 'Alice', 20, 34), (2, 'Bob', 10, 28), (3, 'Charlie', 10, 41);
+        CREATE TABLE knows (src INTEGER, dst INTEGER, since INTEGER);
+        INSERT INTO knows VALUES (1, 2, 2010), (2, 3, 2015), (3, 1, 2020);
+        """
+    )
+    yield connection
+    connection.close()
+
+
+def test_from_sql(connection: sqlite3.Connection) -> None:
+    VG = from_sql(
+        connection,
+        "SELECT id, name AS caption, size, age FROM person ORDER BY id",
+        "SELECT src AS source, dst AS target, 'KNOWS' AS caption, since FROM knows ORDER BY src",
+        batch_size=2,
+        node_radius_min_max=(10, 20),
+    )
+
+    assert [node.id for node in VG.nodes] == [1, 2, 3]
+    assert [node.caption for node in VG.nodes] == ["Alice", "Bob", "Charlie"]
+    assert [node.size for node in VG.nodes] == [20, 10, 10]
+    assert [node.properties for node in VG.nodes] == [{"age": 34}, {"age": 28}, {"age": 41}]
+
+    assert [(rel.source, rel.target) for rel in VG.relationships] == [(1, 2), (2, 3), (3, 1)]
+    assert VG.relationships[0].caption == "KNOWS"
+    assert VG.relationships[0].properties == {"since": 2010}
+
+
+def test_from_sql_without_nodes(connection: sqlite3.Connection) -> None:
+    VG = from_sql(connection, None, "SELECT src AS SOURCE, dst AS TARGET FROM knows ORDER BY src DESC")
+
+    assert VG.nodes == [Node(id=3), Node(id=1), Node(id=2)]
+
+
+def test_from_sql_errors(connection: sqlite3.Connection) -> None:
+    with pytest.raises(ValueError, match=r"Mandatory relationship column 'target' is missing"):
+        from_sql(connection, None, "SELECT src AS source FROM knows")
+
+    with pytest.raises(
+        ValueError,
+        match=r"Error for node column 'size' with provided input '-1'. Reason: Input should be greater than or equal to 0 \(query result, row 2\)",
+    ):
+        from_sql(
+            connection,
+            "SELECT id, CASE WHEN id = 3 THEN -1 ELSE size END AS size FROM person ORDER BY id",
+            "SELECT src AS source, dst AS target FROM knows",
+            batch_size=2,
+        )
+
+    with pytest.raises(ValueError, match="The query 'DELETE FROM knows WHERE 0' returned no rows or columns"):
+        from_sql(connection, None, "DELETE FROM knows WHERE 0")
+
+    with pytest.raises(ValueError, match="`batch_size` must be a positive integer, but was 0"):
+        from_sql(connection, None, "SELECT src AS source, dst AS target FROM knows", batch_size=0)
@@ -0,0 +1,143 @@
+import json
+from typing import Any
+
+import pytest
+import streamlit as st
+from pytest_mock import MockerFixture
+
+from neo4j_viz import Node, Relationship, VisualizationGraph
+from neo4j_viz.options import Layout, Renderer
+from neo4j_viz.streamlit import render_component
+
+
+@pytest.fixture
+def VG() -> VisualizationGraph:
+    nodes = [
+        Node(id="4:x:0", caption="Person", color="#ff0000", properties={"name": "Alice"}),
+        Node(id="4:x:1", caption="Product"),
+    ]
+    relationships = [Relationship(id="5:x:0", source="4:x:0", target="4:x:1", caption="BUYS")]
+    return VisualizationGraph(nodes=nodes, relationships=relationships)
+
+
+@pytest.fixture(autouse=True)
+def session_state(mocker: MockerFixture) -> dict[str, Any]:
+    # A session state of its own for every test, outside of a Streamlit app
+    state: dict[str, Any] = {}
+    mocker.patch.object(st, "session_state", state)
+    return state
+
+
+def test_render_component(VG: VisualizationGraph, mocker: MockerFixture) -> None:
+    component_func = mocker.patch(
+        "neo4j_viz.streamlit._component_func", return_value={"clicked": {"type": "node", "id": "4:x:0"}}
+    )
+
+    clicked = render_component(VG, layout=Layout.HIERARCHICAL, height=400, initial_zoom=0.5, key="graph")
+
+    assert clicked == {"type": "node", "id": "4:x:0"}
+
+    args = component_func.call_args.kwargs
+    assert json.loads(args["nodes"]) == [
+        {"id": 0, "caption": "Person", "color": "#ff0000"},
+        {"id": 1, "caption": "Product"},
+    ]
+    assert json.loads(args["relationships"]) == [{"id": 2, "from": 0, "to": 1, "caption": "BUYS"}]
+    assert json.loads(args["elementData"]) == {
+        "ids": ["4:x:0", "4:x:1", "5:x:0"],
+        "properties": [{"name": "Alice"}, None, None],
+    }
+    assert args["options"]["layout"] == "hierarchical"
+    assert args["options"]["initialZoom"] == 0.5
+    assert args["options"]["disableWebWorkers"] is True
+    assert args["height"] == 400
+    assert args["showHoverTooltip"] is True
+    assert args["key"] == "graph"
+
+
+def test_render_component_fingerprints(VG: VisualizationGraph, mocker: MockerFixture) -> None:
+    component_func = mocker.patch("neo4j_viz.streamlit._component_func", return_value=None)
+
+    render_component(VG)
+    first = component_func.call_args.kwargs
+
+    render_component(VG, height=800, initial_zoom=2, renderer=Renderer.CANVAS)
+    unchanged = component_func.call_args.kwargs
+    assert unchanged["graphFingerprint"] == first["graphFingerprint"]
+    assert unchanged["structureFingerprint"] == first["structureFingerprint"]
+
+    VG.color_nodes(property="caption")
+    render_component(VG)
+    restyled = component_func.call_args.kwargs
+    assert restyled["graphFingerprint"] != first["graphFingerprint"]
+    assert restyled["structureFingerprint"] == first["structureFingerprint"]
+
+    VG.nodes.append(Node(id="4:x:2"))
+    render_component(VG)
+    extended = component_func.call_args.kwargs
+    assert extended["structureFingerprint"] != first["structureFingerprint"]
+
+
+def test_render_component_sends_graph_once(VG: VisualizationGraph, mocker: MockerFixture) -> None:
+    component_func = mocker.patch("neo4j_viz.streamlit._component_func", return_value=None)
+    rerun = mocker.patch.object(st, "rerun")
+
+    render_component(VG)
+    first = component_func.call_args.kwargs
+    assert first["nodes"] is not None
+
+    # Reruns with the same graph only send its fingerprint
+    render_component(VG, height=800)
+    unchanged = component_func.call_args.kwargs
+    assert unchanged["nodes"] is None
+    assert unchanged["relationships"] is None
+    assert unchanged["elementData"] is None
+    assert unchanged["graphFingerprint"] == first["graphFingerprint"]
+
+    VG.color_nodes(property="caption")
+    render_component(VG)
+    assert component_func.call_args.kwargs["nodes"] is not None
+
+    # A frontend without the graph requests it, and the script is rerun to send it
+    request = {"id": "1", "fingerprint": component_func.call_args.kwargs["graphFingerprint"]}
+    component_func.return_value = {"clicked": {"type": "node", "id": "4:x:1"}, "missingGraph": request}
+    render_component(VG)
+    assert component_func.call_args.kwargs["nodes"] is None
+    rerun.assert_called_once()
+
+    assert render_component(VG) == {"type": "node", "id": "4:x:1"}
+    assert component_func.call_args.kwargs["nodes"] is not None
+    # Every request is answered once
+    rerun.assert_called_once()
+
+
+def test_render_component_web_workers(VG: VisualizationGraph, mocker: MockerFixture) -> None:
+    component_func = mocker.patch("neo4j_viz.streamlit._component_func", return_value=None)
+    mocker.patch("neo4j_viz.nvl.NVL._worker_scripts", return_value={})
+
+    # Without bundled workers, the frontend does not try to start them
+    with pytest.warns(UserWarning, match="The layout web workers are not bundled"):
+        render_component(VG, use_web_workers=True)
+    assert component_func.call_args.kwargs["options"]["disableWebWorkers"] is True
+
+    mocker.patch("neo4j_viz.nvl.NVL._worker_scripts", return_value={"CoseBilkentLayout": ""})
+    render_component(VG, use_web_workers=True)
+    assert component_func.call_args.kwargs["options"]["disableWebWorkers"] is False
+
+
+def test_render_component_too_many_nodes(VG: VisualizationGraph, mocker: MockerFixture) -> None:
+    component_func = mocker.patch("neo4j_viz.streamlit._component_func")
+
+    with pytest.raises(ValueError, match="Too many nodes"):
+        render_component(VG, max_allowed_nodes=1)
+
+    component_func.assert_not_called()
+
+
+def test_fingerprint(VG: VisualizationGraph) -> None:
+    fingerprint = VG.fingerprint()
+
+    assert fingerprint == VisualizationGraph(nodes=list(VG.nodes), relationships=list(VG.relationships)).fingerprint()
+
+    VG.nodes[0].properties["name"] = "Bob"
+    assert VG.fingerprint() != fingerprint
@@ -0,0 +1,55 @@
+# Compares the conversion of a large relationship DataFrame by `from_dfs` without and with worker processes.
+# The speedup depends on the number of available cores, so the share of the work that is left to the parent process,
+# which bounds the speedup, is reported as well.
+#
+# Usage: python scripts/benchmark_from_dfs_workers.py [num_relationships] [workers]
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from neo4j_viz import Relationship
+from neo4j_viz._columnar import convert_columns
+from neo4j_viz.pandas import _convert_shared_rows, from_dfs
+
+num_rels = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+rng = np.random.default_rng(0)
+rels = pd.DataFrame(
+    {
+        "source": rng.integers(0, num_rels // 4, num_rels),
+        "target": rng.integers(0, num_rels // 4, num_rels),
+        "caption": [f"REL{i % 7}" for i in range(num_rels)],
+        "color": [["#ff0000", "#00ff00", "#0000ff"][i % 3] for i in range(num_rels)],
+        "weight": rng.random(num_rels),
+        "kind": [f"kind{i % 5}" for i in range(num_rels)],
+    }
+)
+
+start = time.perf_counter()
+from_dfs(None, rels)
+serial = time.perf_counter() - start
+
+start = time.perf_counter()
+from_dfs(None, rels, workers=workers)
+parallel = time.perf_counter() - start
+
+# What the parent process does for the rows that a worker validated: receive the validated columns, and build records
+top_level = ["source", "target", "caption", "color"]
+validated = _convert_shared_rows(
+    top_level, None, {}, {i: rels[key] for i, key in enumerate(top_level)}, num_rels, 0, num_rels, Relationship, 0
+)
+payload = pickle.dumps(validated, protocol=pickle.HIGHEST_PROTOCOL)
+start = time.perf_counter()
+columns = pickle.loads(payload) + [rels["weight"].tolist(), rels["kind"].tolist()]
+convert_columns([*top_level, "weight", "kind"], columns, Relationship, None, "", 0, validate=False)
+parent = time.perf_counter() - start
+
+print(f"{num_rels} relationships, {os.cpu_count()} cores")
+print(f"serial:             {serial:.2f} s")
+print(f"{workers} workers:          {parallel:.2f} s ({serial / parallel:.2f}x)")
+print(f"parent process:     {parent:.2f} s ({parent / serial:.0%} of serial), {len(payload) / 1e6:.1f} MB received")